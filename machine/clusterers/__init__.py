@@ -1,4 +1,5 @@
 from .cluster import Cluster
+from .cluster_tree import ClusterTree
 from .flat_clusterer import FlatClusterer
 from .flat_upgma_clusterer import FlatUpgmaClusterer
 from .neighbor_joining_clusterer import NeighborJoiningClusterer
@@ -8,6 +9,7 @@ from .upgma_clusterer import UpgmaClusterer
 
 __all__ = [
     "Cluster",
+    "ClusterTree",
     "FlatClusterer",
     "FlatUpgmaClusterer",
     "NeighborJoiningClusterer",
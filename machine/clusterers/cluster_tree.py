@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Generic, Sequence, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from networkx import DiGraph
+
+from .cluster import Cluster
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ClusterTree(Generic[T]):
+    """A rooted cluster tree stored in arrays.
+
+    ``parents[i]`` is the index of the parent of ``clusters[i]``, or -1 for the root, and ``branch_lengths[i]`` is the
+    length of the branch from the parent to ``clusters[i]``.
+    """
+
+    clusters: Sequence[Cluster[T]]
+    parents: npt.NDArray[np.intp]
+    branch_lengths: npt.NDArray[np.float64]
+
+    def to_graph(self) -> DiGraph[Cluster[T]]:
+        tree: DiGraph[Cluster[T]] = DiGraph()
+        for cluster in self.clusters:
+            tree.add_node(cluster, cluster=cluster)
+        for i, (parent, branch_length) in enumerate(zip(self.parents.tolist(), self.branch_lengths.tolist())):
+            if parent != -1:
+                tree.add_edge(self.clusters[parent], self.clusters[i], weight=branch_length)
+        return tree
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import sys
-from typing import Callable, Dict, FrozenSet, Iterable, List, TypeVar
+from typing import Callable, Iterable, List, TypeVar
 
+import numpy as np
+import numpy.typing as npt
 from networkx import DiGraph
 
 from .cluster import Cluster
+from .cluster_tree import ClusterTree
 from .rooted_hierarchical_clusterer import RootedHierarchicalClusterer
 
 T = TypeVar("T")
@@ -16,87 +18,132 @@ class UpgmaClusterer(RootedHierarchicalClusterer[T]):
         self._get_distance = get_distance
 
     def generate_clusters(self, data_objects: Iterable[T]) -> DiGraph[Cluster[T]]:
-        tree: DiGraph[Cluster[T]] = DiGraph()
-        clusters: List[Cluster[T]] = []
-        for data_object in data_objects:
-            cluster = Cluster[T](data_object, description=str(data_object))
-            clusters.append(cluster)
-            tree.add_node(cluster, cluster=cluster)
-
-        distances: Dict[FrozenSet[Cluster[T]], float] = {}
-        heights: Dict[Cluster[T], float] = {}
-        for i in range(len(clusters)):
-            for j in range(i + 1, len(clusters)):
-                distance = self._get_distance(
-                    next(iter(clusters[i].data_objects)), next(iter(clusters[j].data_objects))
-                )
-                distances[frozenset([clusters[i], clusters[j]])] = distance
-            heights[clusters[i]] = 0
-
-        while len(clusters) >= 2:
-            min_i = 0
-            min_j = 0
-            min_dist = sys.float_info.max
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    dist = distances[frozenset([clusters[i], clusters[j]])]
-                    if dist < min_dist:
-                        min_dist = dist
-                        min_i = i
-                        min_j = j
-
-            i_cluster = clusters[min_i]
-            j_cluster = clusters[min_j]
-            del distances[frozenset([i_cluster, j_cluster])]
-
-            u_cluster = Cluster[T](description="BRANCH")
-            tree.add_node(u_cluster, cluster=u_cluster)
-
+        return self.generate_cluster_tree(data_objects).to_graph()
+
+    def generate_cluster_tree(self, data_objects: Iterable[T]) -> ClusterTree[T]:
+        data_object_list = list(data_objects)
+        clusters: List[Cluster[T]] = [
+            Cluster[T](data_object, description=str(data_object)) for data_object in data_object_list
+        ]
+        n = len(clusters)
+        if n < 2:
+            return ClusterTree(clusters, np.full(n, -1, dtype=np.intp), np.zeros(n, dtype=np.float64))
+
+        # nodes 0 to n - 1 are the data objects and each merge creates the next node
+        node_count = 2 * n - 1
+        parents = np.full(node_count, -1, dtype=np.intp)
+        branch_lengths = np.zeros(node_count, dtype=np.float64)
+        heights = np.zeros(node_count, dtype=np.float64)
+        data_object_counts = np.zeros(node_count, dtype=np.int64)
+        data_object_counts[:n] = 1
+        removed = np.zeros(node_count, dtype=np.bool_)
+        children: List[List[int]] = [[] for _ in range(node_count)]
+
+        # the distances between the clusters are stored in a condensed matrix with one row per slot; a merged cluster
+        # reuses the slot of the first of the two clusters
+        matrix = _CondensedDistanceMatrix(
+            n,
+            np.array(
+                [
+                    self._get_distance(data_object_list[i], data_object_list[j])
+                    for i in range(n)
+                    for j in range(i + 1, n)
+                ],
+                dtype=np.float64,
+            ),
+        )
+
+        for u_node in range(n, node_count):
+            i_slot, j_slot, min_dist = matrix.pop_closest_slots()
+            i_node = int(matrix.slot_nodes[i_slot])
+            j_node = int(matrix.slot_nodes[j_slot])
+
+            clusters.append(Cluster[T](description="BRANCH"))
             height = min_dist / 2
-            heights[u_cluster] = height
-
-            i_count = get_all_data_objects_count(tree, i_cluster)
-            i_len = height - heights[i_cluster]
-            if i_len <= 0 and tree.out_degree(i_cluster) > 0:
-                for _, target, data in tree.out_edges(i_cluster, data=True):
-                    tree.add_edge(u_cluster, target, weight=data["weight"])
-                tree.remove_node(i_cluster)
-            else:
-                tree.remove_edges_from(tree.in_edges(i_cluster))
-                tree.add_edge(u_cluster, i_cluster, weight=max(i_len, 0))
-            j_count = get_all_data_objects_count(tree, j_cluster)
-            j_len = height - heights[j_cluster]
-            if j_len <= 0 and tree.out_degree(j_cluster) > 0:
-                for _, target, data in tree.out_edges(j_cluster, data=True):
-                    tree.add_edge(u_cluster, target, weight=data["weight"])
-                tree.remove_node(j_cluster)
-            else:
-                tree.remove_edges_from(tree.in_edges(j_cluster))
-                tree.add_edge(u_cluster, j_cluster, weight=max(j_len, 0))
-
-            i_weight = i_count / (i_count + j_count)
-            j_weight = j_count / (i_count + j_count)
-            for k_cluster in clusters:
-                if k_cluster is i_cluster or k_cluster is j_cluster:
-                    continue
-                ki_key = frozenset([k_cluster, i_cluster])
-                kj_key = frozenset([k_cluster, j_cluster])
-                distances[frozenset([k_cluster, u_cluster])] = (i_weight * distances[ki_key]) + (
-                    j_weight * distances[kj_key]
-                )
-                del distances[ki_key]
-                del distances[kj_key]
-            del clusters[min_j]
-            del clusters[min_i]
-            clusters.append(u_cluster)
-
-        return tree
-
-
-def get_all_data_objects_count(tree: DiGraph[Cluster[T]], cluster: Cluster[T]) -> int:
-    if tree.out_degree(cluster) == 0:
-        return len(cluster.data_objects)
-    return sum(
-        (get_all_data_objects_count(tree, edge[1]) for edge in tree.out_edges(cluster)),
-        len(cluster.data_objects),
-    )
+            heights[u_node] = height
+            for node in (i_node, j_node):
+                branch_length = height - heights[node]
+                if branch_length <= 0 and len(children[node]) > 0:
+                    # collapse the zero-length branch
+                    for child in children[node]:
+                        parents[child] = u_node
+                    children[u_node].extend(children[node])
+                    children[node].clear()
+                    removed[node] = True
+                else:
+                    parents[node] = u_node
+                    branch_lengths[node] = max(branch_length, 0)
+                    children[u_node].append(node)
+
+            i_count = int(data_object_counts[i_node])
+            j_count = int(data_object_counts[j_node])
+            data_object_counts[u_node] = i_count + j_count
+            matrix.merge(i_slot, j_slot, u_node, i_count / (i_count + j_count), j_count / (i_count + j_count))
+
+        kept = np.flatnonzero(~removed)
+        new_indices = np.full(node_count, -1, dtype=np.intp)
+        new_indices[kept] = np.arange(len(kept))
+        kept_parents = parents[kept]
+        return ClusterTree(
+            [clusters[node] for node in kept.tolist()],
+            np.where(kept_parents == -1, -1, new_indices[kept_parents]),
+            branch_lengths[kept],
+        )
+
+
+class _CondensedDistanceMatrix:
+    def __init__(self, n: int, distances: npt.NDArray[np.float64]) -> None:
+        self._n = n
+        self._distances = distances
+        self.slot_nodes = np.arange(n)
+        self._active = np.ones(n, dtype=np.bool_)
+        # the closest slot and the distance to it for each active slot
+        self._min_slots = np.zeros(n, dtype=np.intp)
+        self._min_distances = np.zeros(n, dtype=np.float64)
+        for slot in range(n):
+            self._update_row_min(slot)
+
+    def pop_closest_slots(self) -> tuple[int, int, float]:
+        # ties are broken in favor of the pair of clusters that were created first, in the same way as scanning the
+        # clusters in creation order
+        slots = np.flatnonzero(self._active)
+        nodes = self.slot_nodes[slots]
+        min_nodes = self.slot_nodes[self._min_slots[slots]]
+        order = np.lexsort((np.maximum(nodes, min_nodes), np.minimum(nodes, min_nodes), self._min_distances[slots]))
+        slot1 = int(slots[order[0]])
+        slot2 = int(self._min_slots[slot1])
+        if self.slot_nodes[slot2] < self.slot_nodes[slot1]:
+            slot1, slot2 = slot2, slot1
+        return slot1, slot2, float(self._min_distances[slot1])
+
+    def merge(self, i_slot: int, j_slot: int, u_node: int, i_weight: float, j_weight: float) -> None:
+        self._active[j_slot] = False
+        self.slot_nodes[i_slot] = u_node
+        others = np.flatnonzero(self._active)
+        others = others[others != i_slot]
+        i_indices = self._get_indices(i_slot, others)
+        self._distances[i_indices] = (i_weight * self._distances[i_indices]) + (
+            j_weight * self._distances[self._get_indices(j_slot, others)]
+        )
+
+        # A merged distance is a weighted average of two distances, so it can never be closer than the current
+        # closest distance of a row unless the closest slot was one of the merged slots. On a tie, the merged cluster
+        # is always the most recently created, so it loses.
+        self._update_row_min(i_slot)
+        for slot in others[(self._min_slots[others] == i_slot) | (self._min_slots[others] == j_slot)].tolist():
+            self._update_row_min(slot)
+
+    def _update_row_min(self, slot: int) -> None:
+        others = np.flatnonzero(self._active)
+        others = others[others != slot]
+        if len(others) == 0:
+            return
+        distances = self._distances[self._get_indices(slot, others)]
+        candidates = others[distances == distances.min()]
+        self._min_slots[slot] = candidates[np.argmin(self.slot_nodes[candidates])]
+        self._min_distances[slot] = distances.min()
+
+    def _get_indices(self, slot: int, others: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+        lo = np.minimum(slot, others)
+        hi = np.maximum(slot, others)
+        return self._n * lo - (lo * (lo + 1)) // 2 + (hi - lo - 1)
@@ -1,100 +1,225 @@
-from .aligned_word_pair import AlignedWordPair
-from .alignment_collection import AlignmentCollection
-from .alignment_corpus import AlignmentCorpus
-from .alignment_row import AlignmentRow
-from .corpora_utils import batch
-from .corpus import Corpus
-from .dbl_bundle_text_corpus import DblBundleTextCorpus
-from .dictionary_alignment_corpus import DictionaryAlignmentCorpus
-from .dictionary_text_corpus import DictionaryTextCorpus
-from .file_paratext_project_file_handler import FileParatextProjectFileHandler
-from .file_paratext_project_settings_parser import FileParatextProjectSettingsParser
-from .file_paratext_project_terms_parser import FileParatextProjectTermsParser
-from .file_paratext_project_text_updater import FileParatextProjectTextUpdater
-from .file_usfm_versification_analyzer import FileUsfmVersificationAnalyzer
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_import
+
+# flatten is bound eagerly, because importing the machine.corpora.flatten submodule would otherwise replace the lazily
+# loaded function with the module
 from .flatten import flatten
-from .memory_alignment_collection import MemoryAlignmentCollection
-from .memory_stream_container import MemoryStreamContainer
-from .memory_text import MemoryText
-from .multi_key_ref import MultiKeyRef
-from .n_parallel_text_corpus import NParallelTextCorpus
-from .n_parallel_text_row import NParallelTextRow
-from .parallel_text_corpus import ParallelTextCorpus
-from .parallel_text_row import ParallelTextRow
-from .paratext_backup_terms_corpus import ParatextBackupTermsCorpus
-from .paratext_backup_text_corpus import ParatextBackupTextCorpus
-from .paratext_project_file_handler import ParatextProjectFileHandler
-from .paratext_project_settings import ParatextProjectSettings
-from .paratext_project_settings_parser_base import ParatextProjectSettingsParserBase
-from .paratext_project_terms_parser_base import KeyTerm, ParatextProjectTermsParserBase
-from .paratext_project_text_updater_base import ParatextProjectTextUpdaterBase
-from .paratext_text_corpus import ParatextTextCorpus
-from .place_markers_usfm_update_block_handler import PlaceMarkersAlignmentInfo, PlaceMarkersUsfmUpdateBlockHandler
-from .scripture_element import ScriptureElement
-from .scripture_ref import EMPTY_SCRIPTURE_REF, ScriptureRef
-from .scripture_ref_usfm_parser_handler_base import ScriptureRefUsfmParserHandlerBase, ScriptureTextType
-from .scripture_text_corpus import (
-    ScriptureTextCorpus,
-    create_versification_ref_corpus,
-    extract_scripture_corpus,
-    is_scripture,
-)
-from .standard_parallel_text_corpus import StandardParallelTextCorpus
-from .text import Text
-from .text_corpus import TextCorpus
-from .text_file_alignment_collection import TextFileAlignmentCollection
-from .text_file_alignment_corpus import TextFileAlignmentCorpus
-from .text_file_text import TextFileText
-from .text_file_text_corpus import TextFileTextCorpus
-from .text_row import TextRow, TextRowFlags
-from .text_row_content_type import TextRowContentType
-from .token_processors import (
-    escape_spaces,
-    lowercase,
-    nfc_normalize,
-    nfd_normalize,
-    nfkc_normalize,
-    nfkd_normalize,
-    normalize,
-    unescape_spaces,
-)
-from .update_usfm_parser_handler import (
-    UpdateUsfmMarkerBehavior,
-    UpdateUsfmParserHandler,
-    UpdateUsfmRow,
-    UpdateUsfmTextBehavior,
-)
-from .usfm_file_text import UsfmFileText
-from .usfm_file_text_corpus import UsfmFileTextCorpus
-from .usfm_memory_text import UsfmMemoryText
-from .usfm_parser import UsfmParser, parse_usfm
-from .usfm_parser_handler import UsfmParserHandler
-from .usfm_parser_state import UsfmElementType, UsfmParserElement, UsfmParserState
-from .usfm_stylesheet import UsfmStylesheet
-from .usfm_tag import UsfmJustification, UsfmStyleAttribute, UsfmStyleType, UsfmTag, UsfmTextProperties, UsfmTextType
-from .usfm_token import UsfmAttribute, UsfmToken, UsfmTokenType
-from .usfm_tokenizer import RtlReferenceOrder, UsfmTokenizer
-from .usfm_update_block import UsfmUpdateBlock
-from .usfm_update_block_element import UsfmUpdateBlockElement, UsfmUpdateBlockElementType
-from .usfm_update_block_handler import UsfmUpdateBlockHandler
-from .usfm_versification_analyzer_base import UsfmVersificationAnalyzerBase
-from .usfm_versification_analyzer_handler import (
-    UsfmVersificationAnalysis,
-    UsfmVersificationAnalyzerHandler,
-    UsfmVersificationDiagnostic,
-    UsfmVersificationDiagnosticType,
-)
-from .usx_file_alignment_collection import UsxFileAlignmentCollection
-from .usx_file_alignment_corpus import UsxFileAlignmentCorpus
-from .usx_file_text import UsxFileText
-from .usx_file_text_corpus import UsxFileTextCorpus
-from .usx_memory_text import UsxMemoryText
-from .usx_zip_text import UsxZipText
-from .zip_paratext_project_file_handler import ZipParatextProjectFileHandler
-from .zip_paratext_project_settings_parser import ZipParatextProjectSettingsParser
-from .zip_paratext_project_terms_parser import ZipParatextProjectTermsParser
-from .zip_paratext_project_text_updater import ZipParatextProjectTextUpdater
-from .zip_usfm_versification_analyzer import ZipUsfmVersificationAnalyzer
+
+if TYPE_CHECKING:
+    from .aligned_word_pair import AlignedWordPair
+    from .alignment_collection import AlignmentCollection
+    from .alignment_corpus import AlignmentCorpus
+    from .alignment_row import AlignmentRow
+    from .corpora_utils import batch
+    from .corpus import Corpus
+    from .dbl_bundle_text_corpus import DblBundleTextCorpus
+    from .dictionary_alignment_corpus import DictionaryAlignmentCorpus
+    from .dictionary_text_corpus import DictionaryTextCorpus
+    from .file_paratext_project_file_handler import FileParatextProjectFileHandler
+    from .file_paratext_project_settings_parser import FileParatextProjectSettingsParser
+    from .file_paratext_project_terms_parser import FileParatextProjectTermsParser
+    from .file_paratext_project_text_updater import FileParatextProjectTextUpdater
+    from .file_usfm_versification_analyzer import FileUsfmVersificationAnalyzer
+    from .memory_alignment_collection import MemoryAlignmentCollection
+    from .memory_stream_container import MemoryStreamContainer
+    from .memory_text import MemoryText
+    from .multi_key_ref import MultiKeyRef
+    from .n_parallel_text_corpus import NParallelTextCorpus
+    from .n_parallel_text_row import NParallelTextRow
+    from .parallel_text_corpus import ParallelTextCorpus
+    from .parallel_text_row import ParallelTextRow
+    from .paratext_backup_terms_corpus import ParatextBackupTermsCorpus
+    from .paratext_backup_text_corpus import ParatextBackupTextCorpus
+    from .paratext_project_file_handler import ParatextProjectFileHandler
+    from .paratext_project_settings import ParatextProjectSettings
+    from .paratext_project_settings_parser_base import ParatextProjectSettingsParserBase
+    from .paratext_project_terms_parser_base import KeyTerm, ParatextProjectTermsParserBase
+    from .paratext_project_text_updater_base import ParatextProjectTextUpdaterBase
+    from .paratext_text_corpus import ParatextTextCorpus
+    from .place_markers_usfm_update_block_handler import PlaceMarkersAlignmentInfo, PlaceMarkersUsfmUpdateBlockHandler
+    from .scripture_element import ScriptureElement
+    from .scripture_ref import EMPTY_SCRIPTURE_REF, ScriptureRef
+    from .scripture_ref_usfm_parser_handler_base import ScriptureRefUsfmParserHandlerBase, ScriptureTextType
+    from .scripture_text_corpus import (
+        ScriptureTextCorpus,
+        create_versification_ref_corpus,
+        extract_scripture_corpus,
+        is_scripture,
+    )
+    from .shared_zip_archive import SharedZipArchive
+    from .standard_parallel_text_corpus import StandardParallelTextCorpus
+    from .text import Text
+    from .text_corpus import TextCorpus
+    from .text_file_alignment_collection import TextFileAlignmentCollection
+    from .text_file_alignment_corpus import TextFileAlignmentCorpus
+    from .text_file_text import TextFileText
+    from .text_file_text_corpus import TextFileTextCorpus
+    from .text_row import TextRow, TextRowFlags
+    from .text_row_content_type import TextRowContentType
+    from .token_processors import (
+        escape_spaces,
+        lowercase,
+        nfc_normalize,
+        nfd_normalize,
+        nfkc_normalize,
+        nfkd_normalize,
+        normalize,
+        unescape_spaces,
+    )
+    from .update_usfm_parser_handler import (
+        UpdateUsfmMarkerBehavior,
+        UpdateUsfmParserHandler,
+        UpdateUsfmRow,
+        UpdateUsfmTextBehavior,
+    )
+    from .usfm_file_text import UsfmFileText
+    from .usfm_file_text_corpus import UsfmFileTextCorpus
+    from .usfm_memory_text import UsfmMemoryText
+    from .usfm_parser import UsfmParser, parse_usfm
+    from .usfm_parser_handler import UsfmParserHandler
+    from .usfm_parser_state import UsfmElementType, UsfmParserElement, UsfmParserState
+    from .usfm_stylesheet import UsfmStylesheet
+    from .usfm_tag import (
+        UsfmJustification,
+        UsfmStyleAttribute,
+        UsfmStyleType,
+        UsfmTag,
+        UsfmTextProperties,
+        UsfmTextType,
+    )
+    from .usfm_token import UsfmAttribute, UsfmToken, UsfmTokenType
+    from .usfm_tokenizer import RtlReferenceOrder, UsfmTokenizer
+    from .usfm_update_block import UsfmUpdateBlock
+    from .usfm_update_block_element import UsfmUpdateBlockElement, UsfmUpdateBlockElementType
+    from .usfm_update_block_handler import UsfmUpdateBlockHandler
+    from .usfm_versification_analyzer_base import UsfmVersificationAnalyzerBase
+    from .usfm_versification_analyzer_handler import (
+        UsfmVersificationAnalysis,
+        UsfmVersificationAnalyzerHandler,
+        UsfmVersificationDiagnostic,
+        UsfmVersificationDiagnosticType,
+    )
+    from .usx_file_alignment_collection import UsxFileAlignmentCollection
+    from .usx_file_alignment_corpus import UsxFileAlignmentCorpus
+    from .usx_file_text import UsxFileText
+    from .usx_file_text_corpus import UsxFileTextCorpus
+    from .usx_memory_text import UsxMemoryText
+    from .usx_zip_text import UsxZipText
+    from .zip_paratext_project_file_handler import ZipParatextProjectFileHandler
+    from .zip_paratext_project_settings_parser import ZipParatextProjectSettingsParser
+    from .zip_paratext_project_terms_parser import ZipParatextProjectTermsParser
+    from .zip_paratext_project_text_updater import ZipParatextProjectTextUpdater
+    from .zip_usfm_versification_analyzer import ZipUsfmVersificationAnalyzer
+
+_IMPORT_STRUCTURE = {
+    ".aligned_word_pair": ["AlignedWordPair"],
+    ".alignment_collection": ["AlignmentCollection"],
+    ".alignment_corpus": ["AlignmentCorpus"],
+    ".alignment_row": ["AlignmentRow"],
+    ".corpora_utils": ["batch"],
+    ".corpus": ["Corpus"],
+    ".dbl_bundle_text_corpus": ["DblBundleTextCorpus"],
+    ".dictionary_alignment_corpus": ["DictionaryAlignmentCorpus"],
+    ".dictionary_text_corpus": ["DictionaryTextCorpus"],
+    ".file_paratext_project_file_handler": ["FileParatextProjectFileHandler"],
+    ".file_paratext_project_settings_parser": ["FileParatextProjectSettingsParser"],
+    ".file_paratext_project_terms_parser": ["FileParatextProjectTermsParser"],
+    ".file_paratext_project_text_updater": ["FileParatextProjectTextUpdater"],
+    ".file_usfm_versification_analyzer": ["FileUsfmVersificationAnalyzer"],
+    ".memory_alignment_collection": ["MemoryAlignmentCollection"],
+    ".memory_stream_container": ["MemoryStreamContainer"],
+    ".memory_text": ["MemoryText"],
+    ".multi_key_ref": ["MultiKeyRef"],
+    ".n_parallel_text_corpus": ["NParallelTextCorpus"],
+    ".n_parallel_text_row": ["NParallelTextRow"],
+    ".parallel_text_corpus": ["ParallelTextCorpus"],
+    ".parallel_text_row": ["ParallelTextRow"],
+    ".paratext_backup_terms_corpus": ["ParatextBackupTermsCorpus"],
+    ".paratext_backup_text_corpus": ["ParatextBackupTextCorpus"],
+    ".paratext_project_file_handler": ["ParatextProjectFileHandler"],
+    ".paratext_project_settings": ["ParatextProjectSettings"],
+    ".paratext_project_settings_parser_base": ["ParatextProjectSettingsParserBase"],
+    ".paratext_project_terms_parser_base": ["KeyTerm", "ParatextProjectTermsParserBase"],
+    ".paratext_project_text_updater_base": ["ParatextProjectTextUpdaterBase"],
+    ".paratext_text_corpus": ["ParatextTextCorpus"],
+    ".place_markers_usfm_update_block_handler": ["PlaceMarkersAlignmentInfo", "PlaceMarkersUsfmUpdateBlockHandler"],
+    ".scripture_element": ["ScriptureElement"],
+    ".scripture_ref": ["EMPTY_SCRIPTURE_REF", "ScriptureRef"],
+    ".scripture_ref_usfm_parser_handler_base": ["ScriptureRefUsfmParserHandlerBase", "ScriptureTextType"],
+    ".scripture_text_corpus": [
+        "ScriptureTextCorpus",
+        "create_versification_ref_corpus",
+        "extract_scripture_corpus",
+        "is_scripture",
+    ],
+    ".shared_zip_archive": ["SharedZipArchive"],
+    ".standard_parallel_text_corpus": ["StandardParallelTextCorpus"],
+    ".text": ["Text"],
+    ".text_corpus": ["TextCorpus"],
+    ".text_file_alignment_collection": ["TextFileAlignmentCollection"],
+    ".text_file_alignment_corpus": ["TextFileAlignmentCorpus"],
+    ".text_file_text": ["TextFileText"],
+    ".text_file_text_corpus": ["TextFileTextCorpus"],
+    ".text_row": ["TextRow", "TextRowFlags"],
+    ".text_row_content_type": ["TextRowContentType"],
+    ".token_processors": [
+        "escape_spaces",
+        "lowercase",
+        "nfc_normalize",
+        "nfd_normalize",
+        "nfkc_normalize",
+        "nfkd_normalize",
+        "normalize",
+        "unescape_spaces",
+    ],
+    ".update_usfm_parser_handler": [
+        "UpdateUsfmMarkerBehavior",
+        "UpdateUsfmParserHandler",
+        "UpdateUsfmRow",
+        "UpdateUsfmTextBehavior",
+    ],
+    ".usfm_file_text": ["UsfmFileText"],
+    ".usfm_file_text_corpus": ["UsfmFileTextCorpus"],
+    ".usfm_memory_text": ["UsfmMemoryText"],
+    ".usfm_parser": ["UsfmParser", "parse_usfm"],
+    ".usfm_parser_handler": ["UsfmParserHandler"],
+    ".usfm_parser_state": ["UsfmElementType", "UsfmParserElement", "UsfmParserState"],
+    ".usfm_stylesheet": ["UsfmStylesheet"],
+    ".usfm_tag": [
+        "UsfmJustification",
+        "UsfmStyleAttribute",
+        "UsfmStyleType",
+        "UsfmTag",
+        "UsfmTextProperties",
+        "UsfmTextType",
+    ],
+    ".usfm_token": ["UsfmAttribute", "UsfmToken", "UsfmTokenType"],
+    ".usfm_tokenizer": ["RtlReferenceOrder", "UsfmTokenizer"],
+    ".usfm_update_block": ["UsfmUpdateBlock"],
+    ".usfm_update_block_element": ["UsfmUpdateBlockElement", "UsfmUpdateBlockElementType"],
+    ".usfm_update_block_handler": ["UsfmUpdateBlockHandler"],
+    ".usfm_versification_analyzer_base": ["UsfmVersificationAnalyzerBase"],
+    ".usfm_versification_analyzer_handler": [
+        "UsfmVersificationAnalysis",
+        "UsfmVersificationAnalyzerHandler",
+        "UsfmVersificationDiagnostic",
+        "UsfmVersificationDiagnosticType",
+    ],
+    ".usx_file_alignment_collection": ["UsxFileAlignmentCollection"],
+    ".usx_file_alignment_corpus": ["UsxFileAlignmentCorpus"],
+    ".usx_file_text": ["UsxFileText"],
+    ".usx_file_text_corpus": ["UsxFileTextCorpus"],
+    ".usx_memory_text": ["UsxMemoryText"],
+    ".usx_zip_text": ["UsxZipText"],
+    ".zip_paratext_project_file_handler": ["ZipParatextProjectFileHandler"],
+    ".zip_paratext_project_settings_parser": ["ZipParatextProjectSettingsParser"],
+    ".zip_paratext_project_terms_parser": ["ZipParatextProjectTermsParser"],
+    ".zip_paratext_project_text_updater": ["ZipParatextProjectTextUpdater"],
+    ".zip_usfm_versification_analyzer": ["ZipUsfmVersificationAnalyzer"],
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _IMPORT_STRUCTURE)
 
 __all__ = [
     "AlignedWordPair",
@@ -150,6 +275,7 @@ __all__ = [
     "ScriptureRefUsfmParserHandlerBase",
     "ScriptureTextCorpus",
     "ScriptureTextType",
+    "SharedZipArchive",
     "StandardParallelTextCorpus",
     "Text",
     "TextCorpus",
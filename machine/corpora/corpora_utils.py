@@ -11,9 +11,15 @@ import regex as re
 from ..scripture import ENGLISH_VERSIFICATION
 from ..scripture.canon import book_id_to_number
 from ..scripture.verse_ref import VERSE_RANGE_SEPARATOR, VERSE_SEQUENCE_INDICATOR, Versification
+from ..tokenization.batch_detokenizer import BatchDetokenizer
+from ..tokenization.batch_tokenizer import BatchTokenizer
+from ..tokenization.detokenizer import Detokenizer
+from ..tokenization.tokenizer import Tokenizer
 
 T = TypeVar("T")
 
+TOKENIZE_BATCH_SIZE = 256
+
 
 def alignment_exception(refs: Iterable[str]) -> RuntimeError:
     return RuntimeError(f'Unable to align rows with refs: {", ".join(refs)}.')
@@ -33,6 +39,22 @@ def batch(iterable: Iterable[T], batch_size: int) -> Iterable[Sequence[T]]:
         yield batch
 
 
+def is_batch_capable(tokenizer: Any) -> bool:
+    return isinstance(tokenizer, (BatchTokenizer, BatchDetokenizer))
+
+
+def tokenize_segments(tokenizer: Tokenizer[str, int, str], texts: Sequence[str]) -> Iterable[Sequence[str]]:
+    if isinstance(tokenizer, BatchTokenizer):
+        return tokenizer.tokenize_batch(texts)
+    return (list(tokenizer.tokenize(text)) for text in texts)
+
+
+def detokenize_segments(detokenizer: Detokenizer[str, str], segments: Sequence[Sequence[str]]) -> Iterable[str]:
+    if isinstance(detokenizer, BatchDetokenizer):
+        return detokenizer.detokenize_batch(segments)
+    return (detokenizer.detokenize(segment) for segment in segments)
+
+
 def get_split_indices(
     corpus_size: int, percent: Optional[float] = None, size: Optional[int] = None, seed: Any = None
 ) -> Set[int]:
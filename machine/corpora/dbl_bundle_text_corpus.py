@@ -1,13 +1,13 @@
 import os
-from io import TextIOWrapper
-from typing import List
+from typing import Generator, Iterable, List, Optional
 from xml.etree import ElementTree
-from zipfile import ZipFile
 
 from ..scripture import ENGLISH_VERSIFICATION
 from ..scripture.verse_ref import Versification
 from ..utils.typeshed import StrPath
 from .scripture_text_corpus import ScriptureTextCorpus
+from .shared_zip_archive import SharedZipArchive
+from .text_row import TextRow
 from .usx_zip_text import UsxZipText
 
 
@@ -15,7 +15,8 @@ class DblBundleTextCorpus(ScriptureTextCorpus):
     _SUPPORTED_VERSIONS = {"2.0", "2.1", "2.2"}
 
     def __init__(self, filename: StrPath) -> None:
-        with ZipFile(filename, "r") as archive:
+        self._archive = SharedZipArchive(filename)
+        with self._archive as archive:
             with archive.open("metadata.xml", "r") as stream:
                 doc = ElementTree.parse(stream)
             version = doc.getroot().get("version", "2.0")
@@ -29,13 +30,22 @@ class DblBundleTextCorpus(ScriptureTextCorpus):
             if versification_entry is not None:
                 with archive.open(versification_entry, "r") as stream:
                     abbr = doc.getroot().findtext("./identification/abbreviation", "")
-                    versification = Versification.parse(
-                        TextIOWrapper(stream, encoding="utf-8-sig"), "versification.vrs", fallback_name=abbr
-                    )
+                    versification = Versification.load(stream, fallback_name=abbr, filename="versification.vrs")
             else:
                 versification = ENGLISH_VERSIFICATION
 
         texts: List[UsxZipText] = []
         for content_elem in doc.getroot().findall("./publications/publication[@default='true']/structure/content"):
-            texts.append(UsxZipText(content_elem.get("role", ""), filename, content_elem.get("src", ""), versification))
+            texts.append(
+                UsxZipText(content_elem.get("role", ""), self._archive, content_elem.get("src", ""), versification)
+            )
         super().__init__(versification, texts)
+
+    def count(self, include_empty: bool = True, text_ids: Optional[Iterable[str]] = None) -> int:
+        with self._archive:
+            return super().count(include_empty, text_ids)
+
+    def _get_rows(self, text_ids: Optional[Iterable[str]] = None) -> Generator[TextRow, None, None]:
+        # the texts share the archive, so it is only opened once
+        with self._archive:
+            yield from super()._get_rows(text_ids)
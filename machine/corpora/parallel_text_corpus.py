@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from itertools import islice
+from itertools import islice, repeat
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -24,7 +24,14 @@ from ..tokenization.detokenizer import Detokenizer
 from ..tokenization.tokenizer import Tokenizer
 from ..utils.context_managed_generator import ContextManagedGenerator
 from .aligned_word_pair import AlignedWordPair
-from .corpora_utils import get_split_indices
+from .corpora_utils import (
+    TOKENIZE_BATCH_SIZE,
+    batch,
+    detokenize_segments,
+    get_split_indices,
+    is_batch_capable,
+    tokenize_segments,
+)
 from .corpus import Corpus
 from .parallel_text_row import ParallelTextRow
 from .text_row_content_type import TextRowContentType
@@ -37,6 +44,9 @@ if TYPE_CHECKING:
     from datasets.iterable_dataset import IterableDataset
     from datasets.splits import NamedSplit
 
+# the number of rows that are read at a time from data frames and datasets
+_READ_BATCH_SIZE = 10000
+
 
 class ParallelTextCorpus(Corpus[ParallelTextRow]):
     @classmethod
@@ -131,6 +141,17 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if target_tokenizer is None:
             target_tokenizer = source_tokenizer
 
+        if is_batch_capable(source_tokenizer) or is_batch_capable(target_tokenizer):
+
+            def _tokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                if force or not self.is_source_tokenized:
+                    _tokenize_source_segments(source_tokenizer, rows)
+                if force or not self.is_target_tokenized:
+                    _tokenize_target_segments(target_tokenizer, rows)
+                return rows
+
+            return self._transform_batch(_tokenize_batch, is_source_tokenized=True, is_target_tokenized=True)
+
         def _tokenize(row: ParallelTextRow) -> ParallelTextRow:
             if (force or not self.is_source_tokenized) and len(row.source_segment) > 0:
                 row.source_segment = list(source_tokenizer.tokenize(row.source_text))
@@ -144,6 +165,14 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if not force and self.is_source_tokenized:
             return self
 
+        if is_batch_capable(tokenizer):
+
+            def _tokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                _tokenize_source_segments(tokenizer, rows)
+                return rows
+
+            return self._transform_batch(_tokenize_batch, is_source_tokenized=True)
+
         def _tokenize(row: ParallelTextRow) -> ParallelTextRow:
             if len(row.source_segment) > 0:
                 row.source_segment = list(tokenizer.tokenize(row.source_text))
@@ -155,6 +184,14 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if not force and self.is_target_tokenized:
             return self
 
+        if is_batch_capable(tokenizer):
+
+            def _tokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                _tokenize_target_segments(tokenizer, rows)
+                return rows
+
+            return self._transform_batch(_tokenize_batch, is_target_tokenized=True)
+
         def _tokenize(row: ParallelTextRow) -> ParallelTextRow:
             if len(row.target_segment) > 0:
                 row.target_segment = list(tokenizer.tokenize(row.target_text))
@@ -174,6 +211,17 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if target_detokenizer is None:
             target_detokenizer = source_detokenizer
 
+        if is_batch_capable(source_detokenizer) or is_batch_capable(target_detokenizer):
+
+            def _detokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                if force or self.is_source_tokenized:
+                    _detokenize_source_segments(source_detokenizer, rows)
+                if force or self.is_target_tokenized:
+                    _detokenize_target_segments(target_detokenizer, rows)
+                return rows
+
+            return self._transform_batch(_detokenize_batch, is_source_tokenized=False, is_target_tokenized=False)
+
         def _detokenize(row: ParallelTextRow) -> ParallelTextRow:
             if (force or self.is_source_tokenized) and len(row.source_segment) > 1:
                 row.source_segment = [source_detokenizer.detokenize(row.source_segment)]
@@ -187,6 +235,14 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if not force and not self.is_source_tokenized:
             return self
 
+        if is_batch_capable(detokenizer):
+
+            def _detokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                _detokenize_source_segments(detokenizer, rows)
+                return rows
+
+            return self._transform_batch(_detokenize_batch, is_source_tokenized=False)
+
         def _detokenize(row: ParallelTextRow) -> ParallelTextRow:
             if len(row.source_segment) > 1:
                 row.source_segment = [detokenizer.detokenize(row.source_segment)]
@@ -198,6 +254,14 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
         if not force and not self.is_target_tokenized:
             return self
 
+        if is_batch_capable(detokenizer):
+
+            def _detokenize_batch(rows: Sequence[ParallelTextRow]) -> Sequence[ParallelTextRow]:
+                _detokenize_target_segments(detokenizer, rows)
+                return rows
+
+            return self._transform_batch(_detokenize_batch, is_target_tokenized=False)
+
         def _detokenize(row: ParallelTextRow) -> ParallelTextRow:
             if len(row.target_segment) > 1:
                 row.target_segment = [detokenizer.detokenize(row.target_segment)]
@@ -309,6 +373,15 @@ class ParallelTextCorpus(Corpus[ParallelTextRow]):
     ) -> ParallelTextCorpus:
         return _TransformParallelTextCorpus(self, transform, is_source_tokenized, is_target_tokenized)
 
+    def _transform_batch(
+        self,
+        transform: Callable[[Sequence[ParallelTextRow]], Sequence[ParallelTextRow]],
+        is_source_tokenized: Optional[bool] = None,
+        is_target_tokenized: Optional[bool] = None,
+        batch_size: int = TOKENIZE_BATCH_SIZE,
+    ) -> ParallelTextCorpus:
+        return _BatchTransformParallelTextCorpus(self, transform, is_source_tokenized, is_target_tokenized, batch_size)
+
     def filter_nonempty(self) -> ParallelTextCorpus:
         return self.filter(lambda r: not r.is_empty)
 
@@ -539,6 +612,62 @@ class _TransformParallelTextCorpus(ParallelTextCorpus):
             yield from map(self._transform, rows)
 
 
+class _BatchTransformParallelTextCorpus(ParallelTextCorpus):
+    def __init__(
+        self,
+        corpus: ParallelTextCorpus,
+        transform: Callable[[Sequence[ParallelTextRow]], Sequence[ParallelTextRow]],
+        is_source_tokenized: Optional[bool],
+        is_target_tokenized: Optional[bool],
+        batch_size: int,
+    ):
+        self._corpus = corpus
+        self._transform = transform
+        self._is_source_tokenized = corpus.is_source_tokenized if is_source_tokenized is None else is_source_tokenized
+        self._is_target_tokenized = corpus.is_target_tokenized if is_target_tokenized is None else is_target_tokenized
+        self._batch_size = batch_size
+
+    @property
+    def is_source_tokenized(self) -> bool:
+        return self._is_source_tokenized
+
+    @property
+    def is_target_tokenized(self) -> bool:
+        return self._is_target_tokenized
+
+    def count(self, include_empty: bool = True, text_ids: Optional[Iterable[str]] = None) -> int:
+        return self._corpus.count(include_empty, text_ids)
+
+    def _get_rows(self, text_ids: Optional[Iterable[str]]) -> Generator[ParallelTextRow, None, None]:
+        with self._corpus.get_rows(text_ids) as rows:
+            for row_batch in batch(rows, self._batch_size):
+                yield from self._transform(row_batch)
+
+
+def _tokenize_source_segments(tokenizer: Tokenizer[str, int, str], rows: Sequence[ParallelTextRow]) -> None:
+    nonempty_rows = [row for row in rows if len(row.source_segment) > 0]
+    for row, tokens in zip(nonempty_rows, tokenize_segments(tokenizer, [r.source_text for r in nonempty_rows])):
+        row.source_segment = tokens
+
+
+def _tokenize_target_segments(tokenizer: Tokenizer[str, int, str], rows: Sequence[ParallelTextRow]) -> None:
+    nonempty_rows = [row for row in rows if len(row.target_segment) > 0]
+    for row, tokens in zip(nonempty_rows, tokenize_segments(tokenizer, [r.target_text for r in nonempty_rows])):
+        row.target_segment = tokens
+
+
+def _detokenize_source_segments(detokenizer: Detokenizer[str, str], rows: Sequence[ParallelTextRow]) -> None:
+    tokenized_rows = [row for row in rows if len(row.source_segment) > 1]
+    for row, text in zip(tokenized_rows, detokenize_segments(detokenizer, [r.source_segment for r in tokenized_rows])):
+        row.source_segment = [text]
+
+
+def _detokenize_target_segments(detokenizer: Detokenizer[str, str], rows: Sequence[ParallelTextRow]) -> None:
+    tokenized_rows = [row for row in rows if len(row.target_segment) > 1]
+    for row, text in zip(tokenized_rows, detokenize_segments(detokenizer, [r.target_segment for r in tokenized_rows])):
+        row.target_segment = [text]
+
+
 class _FilterParallelTextCorpus(ParallelTextCorpus):
     def __init__(self, corpus: ParallelTextCorpus, predicate: Callable[[ParallelTextRow, int], bool]) -> None:
         self._corpus = corpus
@@ -630,46 +759,72 @@ class _PandasParallelTextCorpus(ParallelTextCorpus):
         return False
 
     def count(self, include_empty: bool = True, text_ids: Optional[Iterable[str]] = None) -> int:
-        if text_ids is None:
-            if include_empty:
-                return len(self._df)
-            return len(self._df[(self._df[self._source_column] != "") & (self._df[self._target_column] != "")])
-        text_ids = list(text_ids)
-        return len(self._df[self._df[self._source_column].isin(text_ids)]) & (
-            len(self._df[self._target_column].isin(text_ids))
-        )
+        mask: Any = None
+        if text_ids is not None:
+            text_ids = list(text_ids)
+            if self._text_id_column is not None and self._text_id_column in self._df:
+                mask = self._df[self._text_id_column].isin(text_ids)
+            elif self._default_text_id not in text_ids:
+                return 0
+        if not include_empty:
+            non_empty = (self._df[self._source_column] != "") & (self._df[self._target_column] != "")
+            mask = non_empty if mask is None else mask & non_empty
+        return len(self._df) if mask is None else int(mask.sum())
 
     def _get_rows(self, text_ids: Optional[Iterable[str]] = None) -> Generator[ParallelTextRow, None, None]:
-        text_ids_set = set(text_ids) if text_ids is not None else None
-        for index, row in self._df.iterrows():
-            text_id = self._default_text_id
-            if self._text_id_column is not None and self._text_id_column in self._df:
-                text_id = cast(str, row[self._text_id_column])
-            if text_ids_set is not None and text_id not in text_ids_set:
-                continue
-            refs = [index]
-            if self._ref_column is not None and self._ref_column in self._df:
-                refs = row[self._ref_column]
-                if not isinstance(refs, list):
-                    refs = [refs]
-                if self._ref_factory is not None:
-                    refs = [self._ref_factory(ref) for ref in refs]
-            source = cast(str, row[self._source_column])
-            target = cast(str, row[self._target_column])
-            alignment: Optional[Collection[AlignedWordPair]] = None
-            if self._alignment_column is not None and self._alignment_column in self._df:
-                v = row[self._alignment_column]
-                alignment = (
-                    AlignedWordPair.from_string(v) if isinstance(v, str) else [AlignedWordPair(t[0], t[1]) for t in v]
-                )
-            yield ParallelTextRow(
-                text_id,
-                refs,
-                refs,
-                [source] if len(source) > 0 else [],
-                [target] if len(target) > 0 else [],
-                alignment,
+        df = self._df
+        text_id_column = (
+            self._text_id_column if self._text_id_column is not None and self._text_id_column in df else None
+        )
+        ref_column = self._ref_column if self._ref_column is not None and self._ref_column in df else None
+        alignment_column = (
+            self._alignment_column if self._alignment_column is not None and self._alignment_column in df else None
+        )
+        if text_ids is not None:
+            text_ids = list(text_ids)
+            if text_id_column is not None:
+                df = df[df[text_id_column].isin(text_ids)]
+            elif self._default_text_id not in text_ids:
+                return
+
+        for start in range(0, len(df), _READ_BATCH_SIZE):
+            chunk = df.iloc[start : start + _READ_BATCH_SIZE]
+            text_id_values: Iterable[str] = (
+                chunk[text_id_column].tolist() if text_id_column is not None else repeat(self._default_text_id)
+            )
+            ref_values: Iterable[Any] = (
+                chunk[ref_column].tolist() if ref_column is not None else ([i] for i in chunk.index.tolist())
+            )
+            alignment_values: Iterable[Any] = (
+                chunk[alignment_column].tolist() if alignment_column is not None else repeat(None)
             )
+            for text_id, refs, source, target, v in zip(
+                text_id_values,
+                ref_values,
+                chunk[self._source_column].tolist(),
+                chunk[self._target_column].tolist(),
+                alignment_values,
+            ):
+                if ref_column is not None:
+                    if not isinstance(refs, list):
+                        refs = [refs]
+                    if self._ref_factory is not None:
+                        refs = [self._ref_factory(ref) for ref in refs]
+                alignment: Optional[Collection[AlignedWordPair]] = None
+                if alignment_column is not None:
+                    alignment = (
+                        AlignedWordPair.from_string(v)
+                        if isinstance(v, str)
+                        else [AlignedWordPair(t[0], t[1]) for t in v]
+                    )
+                yield ParallelTextRow(
+                    text_id,
+                    refs,
+                    refs,
+                    [source] if len(source) > 0 else [],
+                    [target] if len(target) > 0 else [],
+                    alignment,
+                )
 
 
 class _DatasetParallelTextCorpus(ParallelTextCorpus):
@@ -713,53 +868,65 @@ class _DatasetParallelTextCorpus(ParallelTextCorpus):
                 return len(self._ds)
 
             count = 0
-            for example in cast(Iterable[dict], self._ds):
-                if (
-                    self._get_translation(self._source_lang, example) != ""
-                    and self._get_translation(self._target_lang, example) != ""
-                ):
-                    count += 1
+            for examples in self._iter_batches():
+                translations = examples[self._translation_column]
+                if include_empty:
+                    count += len(translations)
+                    continue
+                for translation in translations:
+                    if (
+                        self._get_translation(self._source_lang, translation) != ""
+                        and self._get_translation(self._target_lang, translation) != ""
+                    ):
+                        count += 1
             return count
         return sum(1 for row in self._get_rows(text_ids) if include_empty or not row.is_empty)
 
     def _get_rows(self, text_ids: Optional[Iterable[str]]) -> Generator[ParallelTextRow, None, None]:
         text_ids_set = set(text_ids) if text_ids is not None else None
         index = 0
-        for example in cast(Iterable[dict], self._ds):
-            text_id = self._default_text_id
-            refs = [index]
-            if self._ref_column is not None and self._ref_column in example:
-                refs = example[self._ref_column]
-                if not isinstance(refs, list):
-                    refs = [refs]
-                if self._ref_factory is not None:
-                    refs = [self._ref_factory(ref) for ref in refs]
-                    if len(refs) > 0 and isinstance(refs[0], VerseRef):
-                        text_id = refs[0].book
-            if self._text_id_column is not None and self._text_id_column in example:
-                text_id = cast(str, example[self._text_id_column])
-            if text_ids_set is not None and text_id not in text_ids_set:
-                continue
-            source = self._get_translation(self._source_lang, example)
-            target = self._get_translation(self._target_lang, example)
-            alignment: Optional[Collection[AlignedWordPair]] = None
-            if self._alignment_column is not None and self._alignment_column in example:
-                src_indices = example[self._alignment_column][self._source_lang]
-                trg_indices = example[self._alignment_column][self._target_lang]
-                alignment = [AlignedWordPair(si, ti) for (si, ti) in zip(src_indices, trg_indices)]
-
-            yield ParallelTextRow(
-                text_id,
-                refs,
-                refs,
-                [source] if len(source) > 0 else [],
-                [target] if len(target) > 0 else [],
-                alignment,
-            )
-            index += 1
+        for examples in self._iter_batches():
+            # every batch has the same columns, so the column checks are done once per batch
+            ref_values = _get_batch_column(examples, self._ref_column)
+            text_id_values = _get_batch_column(examples, self._text_id_column)
+            alignment_values = _get_batch_column(examples, self._alignment_column)
+            for i, translation in enumerate(examples[self._translation_column]):
+                text_id = self._default_text_id
+                refs = [index]
+                if ref_values is not None:
+                    refs = ref_values[i]
+                    if not isinstance(refs, list):
+                        refs = [refs]
+                    if self._ref_factory is not None:
+                        refs = [self._ref_factory(ref) for ref in refs]
+                        if len(refs) > 0 and isinstance(refs[0], VerseRef):
+                            text_id = refs[0].book
+                if text_id_values is not None:
+                    text_id = cast(str, text_id_values[i])
+                if text_ids_set is not None and text_id not in text_ids_set:
+                    continue
+                source = self._get_translation(self._source_lang, translation)
+                target = self._get_translation(self._target_lang, translation)
+                alignment: Optional[Collection[AlignedWordPair]] = None
+                if alignment_values is not None:
+                    src_indices = alignment_values[i][self._source_lang]
+                    trg_indices = alignment_values[i][self._target_lang]
+                    alignment = [AlignedWordPair(si, ti) for (si, ti) in zip(src_indices, trg_indices)]
+
+                yield ParallelTextRow(
+                    text_id,
+                    refs,
+                    refs,
+                    [source] if len(source) > 0 else [],
+                    [target] if len(target) > 0 else [],
+                    alignment,
+                )
+                index += 1
+
+    def _iter_batches(self) -> Iterable[Dict[str, list]]:
+        return cast(Iterable[Dict[str, list]], self._ds.iter(batch_size=_READ_BATCH_SIZE))
 
-    def _get_translation(self, lang: str, example: dict) -> str:
-        translation: dict = example[self._translation_column]
+    def _get_translation(self, lang: str, translation: dict) -> str:
         if lang in translation:
             return translation[lang]
         if "language" in translation and "translation" in translation:
@@ -791,3 +958,9 @@ class _FromParallelRowsTextCorpus(ParallelTextCorpus):
     @property
     def is_target_tokenized(self) -> bool:
         return True
+
+
+def _get_batch_column(examples: Dict[str, list], column: Optional[str]) -> Optional[list]:
+    if column is None:
+        return None
+    return examples.get(column)
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Generator, Iterable, List, Optional
 from zipfile import ZipFile
 
 from ..utils.typeshed import StrPath
 from .scripture_text_corpus import ScriptureTextCorpus
+from .shared_zip_archive import SharedZipArchive
+from .text_row import TextRow
 from .usfm_zip_text import UsfmZipText
 from .zip_paratext_project_settings_parser import ZipParatextProjectSettingsParser
 
@@ -22,7 +24,8 @@ class ParatextBackupTextCorpus(ScriptureTextCorpus):
                 parent_parser = ZipParatextProjectSettingsParser(parent_archive)
                 parent_settings = parent_parser.parse()
 
-        with ZipFile(filename, "r") as archive:
+        self._archive = SharedZipArchive(filename)
+        with self._archive as archive:
             parser = ZipParatextProjectSettingsParser(archive, parent_settings)
             settings = parser.parse()
 
@@ -37,7 +40,7 @@ class ParatextBackupTextCorpus(ScriptureTextCorpus):
                             settings.stylesheet,
                             settings.encoding,
                             book_id,
-                            filename,
+                            self._archive,
                             sfm_entry.filename,
                             versification,
                             include_markers,
@@ -47,3 +50,12 @@ class ParatextBackupTextCorpus(ScriptureTextCorpus):
                     )
 
         super().__init__(versification, texts)
+
+    def count(self, include_empty: bool = True, text_ids: Optional[Iterable[str]] = None) -> int:
+        with self._archive:
+            return super().count(include_empty, text_ids)
+
+    def _get_rows(self, text_ids: Optional[Iterable[str]] = None) -> Generator[TextRow, None, None]:
+        # the texts share the archive, so it is only opened once
+        with self._archive:
+            yield from super()._get_rows(text_ids)
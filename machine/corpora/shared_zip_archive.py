@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Optional
+from zipfile import ZipFile
+
+from ..utils.typeshed import StrPath
+
+
+class SharedZipArchive:
+    """A reference-counted handle to a zip archive that is shared by the texts of a corpus.
+
+    The archive is opened by the first reference and closed when the last reference is released, so the central
+    directory is only read once while a corpus is being read, no matter how many texts it has.
+    """
+
+    def __init__(self, filename: StrPath) -> None:
+        self._filename = filename
+        self._archive: Optional[ZipFile] = None
+        self._ref_count = 0
+        self._lock = Lock()
+
+    @property
+    def filename(self) -> StrPath:
+        return self._filename
+
+    def __enter__(self) -> ZipFile:
+        return self.acquire()
+
+    def __exit__(self, type: Any, value: Any, traceback: Any) -> None:
+        self.release()
+
+    def acquire(self) -> ZipFile:
+        with self._lock:
+            if self._archive is None:
+                self._archive = ZipFile(self._filename, "r")
+            self._ref_count += 1
+            return self._archive
+
+    def release(self) -> None:
+        with self._lock:
+            if self._ref_count == 0:
+                raise RuntimeError("The archive has not been acquired.")
+            self._ref_count -= 1
+            if self._ref_count == 0 and self._archive is not None:
+                # entry streams that are still open keep the underlying file open until they are closed
+                self._archive.close()
+                self._archive = None
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from itertools import islice
-from typing import Any, Callable, Generator, Iterable, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Generator, Iterable, Literal, Optional, Sequence, Tuple, Union
 
 from ..scripture.verse_ref import Versification
 from ..tokenization.detokenizer import Detokenizer
 from ..tokenization.tokenizer import Tokenizer
 from ..utils.context_managed_generator import ContextManagedGenerator
 from .alignment_corpus import AlignmentCorpus
-from .corpora_utils import get_split_indices
+from .corpora_utils import (
+    TOKENIZE_BATCH_SIZE,
+    batch,
+    detokenize_segments,
+    get_split_indices,
+    is_batch_capable,
+    tokenize_segments,
+)
 from .corpus import Corpus
 from .parallel_text_corpus import ParallelTextCorpus
 from .text import Text
@@ -48,6 +55,16 @@ class TextCorpus(Corpus[TextRow]):
         if not force and self.is_tokenized:
             return self
 
+        if is_batch_capable(tokenizer):
+
+            def _tokenize_batch(rows: Sequence[TextRow]) -> Sequence[TextRow]:
+                nonempty_rows = [row for row in rows if len(row.segment) > 0]
+                for row, tokens in zip(nonempty_rows, tokenize_segments(tokenizer, [r.text for r in nonempty_rows])):
+                    row.segment = tokens
+                return rows
+
+            return self._transform_batch(_tokenize_batch, is_tokenized=True)
+
         def _tokenize(row: TextRow) -> TextRow:
             if len(row.segment) > 0:
                 row.segment = list(tokenizer.tokenize(row.text))
@@ -59,6 +76,18 @@ class TextCorpus(Corpus[TextRow]):
         if not force and not self.is_tokenized:
             return self
 
+        if is_batch_capable(detokenizer):
+
+            def _detokenize_batch(rows: Sequence[TextRow]) -> Sequence[TextRow]:
+                tokenized_rows = [row for row in rows if len(row.segment) > 1]
+                for row, text in zip(
+                    tokenized_rows, detokenize_segments(detokenizer, [r.segment for r in tokenized_rows])
+                ):
+                    row.segment = [text]
+                return rows
+
+            return self._transform_batch(_detokenize_batch, is_tokenized=False)
+
         def _detokenize(row: TextRow) -> TextRow:
             if len(row.segment) > 1:
                 row.segment = [detokenizer.detokenize(row.segment)]
@@ -121,6 +150,14 @@ class TextCorpus(Corpus[TextRow]):
     def transform(self, transform: Callable[[TextRow], TextRow], is_tokenized: Optional[bool] = None) -> TextCorpus:
         return _TransformTextCorpus(self, transform, is_tokenized)
 
+    def _transform_batch(
+        self,
+        transform: Callable[[Sequence[TextRow]], Sequence[TextRow]],
+        is_tokenized: Optional[bool] = None,
+        batch_size: int = TOKENIZE_BATCH_SIZE,
+    ) -> TextCorpus:
+        return _BatchTransformTextCorpus(self, transform, is_tokenized, batch_size)
+
     def align_rows(
         self,
         other: TextCorpus,
@@ -188,6 +225,40 @@ class _TransformTextCorpus(TextCorpus):
             yield from map(self._transform, rows)
 
 
+class _BatchTransformTextCorpus(TextCorpus):
+    def __init__(
+        self,
+        corpus: TextCorpus,
+        transform: Callable[[Sequence[TextRow]], Sequence[TextRow]],
+        is_tokenized: Optional[bool],
+        batch_size: int,
+    ) -> None:
+        self._corpus = corpus
+        self._transform = transform
+        self._is_tokenized = corpus.is_tokenized if is_tokenized is None else is_tokenized
+        self._batch_size = batch_size
+
+    @property
+    def texts(self) -> Iterable[Text]:
+        return self._corpus.texts
+
+    @property
+    def is_tokenized(self) -> bool:
+        return self._is_tokenized
+
+    @property
+    def versification(self) -> Optional[Versification]:
+        return self._corpus.versification
+
+    def count(self, include_empty: bool = True, text_ids: Optional[Iterable[str]] = None) -> int:
+        return self._corpus.count(include_empty, text_ids)
+
+    def _get_rows(self, text_ids: Optional[Iterable[str]] = None) -> Generator[TextRow, None, None]:
+        with self._corpus.get_rows(text_ids) as rows:
+            for row_batch in batch(rows, self._batch_size):
+                yield from self._transform(row_batch)
+
+
 class _TextFilterTextCorpus(TextCorpus):
     def __init__(self, corpus: TextCorpus, predicate: Callable[[Text], bool]) -> None:
         self._corpus = corpus
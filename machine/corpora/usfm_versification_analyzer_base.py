@@ -1,11 +1,20 @@
-from typing import Dict, Optional, Set, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from ..scripture.canon import book_id_to_number
+from ..scripture.verse_ref import Versification
 from .paratext_project_file_handler import ParatextProjectFileHandler
 from .paratext_project_settings import ParatextProjectSettings
 from .paratext_project_settings_parser_base import ParatextProjectSettingsParserBase
 from .usfm_parser import parse_usfm
-from .usfm_versification_analyzer_handler import UsfmVersificationAnalysis, UsfmVersificationAnalyzerHandler
+from .usfm_parser_handler import UsfmParserHandler
+from .usfm_stylesheet import UsfmStylesheet
+from .usfm_versification_analyzer_handler import (
+    UsfmVersificationAnalysis,
+    UsfmVersificationAnalyzerHandler,
+    UsfmVersificationEvent,
+    UsfmVersificationEventCollector,
+)
 
 
 class UsfmVersificationAnalyzerBase:
@@ -24,6 +33,7 @@ class UsfmVersificationAnalyzerBase:
         self,
         books_and_chapters: Optional[Union[Dict[str, Optional[Set[int]]], Dict[int, Optional[Set[int]]]]] = None,
         handler: Optional[UsfmVersificationAnalyzerHandler] = None,
+        max_workers: int = 1,
     ) -> UsfmVersificationAnalysis:
         book_nums_and_chapters = (
             {
@@ -34,6 +44,38 @@ class UsfmVersificationAnalyzerBase:
             else None
         )
         handler = handler or UsfmVersificationAnalyzerHandler(self._settings, book_nums_and_chapters)
+        books = self._read_books(book_nums_and_chapters)
+        if max_workers <= 1 or not _can_handle_events(handler):
+            for file_name, usfm in books:
+                _parse_book(
+                    file_name,
+                    usfm,
+                    handler,
+                    self._settings.stylesheet,
+                    self._settings.versification,
+                    self._settings.name,
+                )
+            return handler.get_analysis()
+
+        # the books are parsed in parallel, but the events are handled in canonical book order, because the expected
+        # verses of a book depend on where the analysis of the previous book left off
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self._settings.stylesheet, self._settings.versification, self._settings.name),
+        )
+        try:
+            futures: List[Future[List[UsfmVersificationEvent]]] = [
+                executor.submit(_collect_book_events_in_worker, file_name, usfm, book_nums_and_chapters)
+                for file_name, usfm in books
+            ]
+            for future in futures:
+                handler.handle_events(future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return handler.get_analysis()
+
+    def _read_books(self, book_nums_and_chapters: Optional[Dict[int, Optional[Set[int]]]]) -> Iterable[Tuple[str, str]]:
         for book_id in self._settings.get_all_scripture_book_ids():
 
             file_name = self._settings.get_book_file_name(book_id)
@@ -46,13 +88,50 @@ class UsfmVersificationAnalyzerBase:
 
             with self._paratext_project_file_handler.open(file_name) as sfm_file:
                 usfm: str = sfm_file.read().decode(self._settings.encoding)
-            try:
-                parse_usfm(usfm, handler, self._settings.stylesheet, self._settings.versification)
-            except Exception as e:
-                error_message = (
-                    f"An error occurred while parsing the usfm for '{file_name}'"
-                    f"{f' in project {self._settings.name}' if self._settings.name else ''}"
-                    f". Error: '{e}'"
-                )
-                raise RuntimeError(error_message) from e
-        return handler.get_analysis()
+            yield file_name, usfm
+
+
+def _can_handle_events(handler: UsfmVersificationAnalyzerHandler) -> bool:
+    # a handler that overrides the parser callbacks has to see the parse of every book itself
+    handler_type = type(handler)
+    return (
+        handler_type.start_book is UsfmVersificationAnalyzerHandler.start_book
+        and handler_type.chapter is UsfmVersificationAnalyzerHandler.chapter
+        and handler_type.verse is UsfmVersificationAnalyzerHandler.verse
+    )
+
+
+def _parse_book(
+    file_name: str,
+    usfm: str,
+    handler: UsfmParserHandler,
+    stylesheet: UsfmStylesheet,
+    versification: Versification,
+    project_name: Optional[str],
+) -> None:
+    try:
+        parse_usfm(usfm, handler, stylesheet, versification)
+    except Exception as e:
+        error_message = (
+            f"An error occurred while parsing the usfm for '{file_name}'"
+            f"{f' in project {project_name}' if project_name else ''}"
+            f". Error: '{e}'"
+        )
+        raise RuntimeError(error_message) from e
+
+
+_worker_settings: Optional[Tuple[UsfmStylesheet, Versification, Optional[str]]] = None
+
+
+def _init_worker(stylesheet: UsfmStylesheet, versification: Versification, project_name: Optional[str]) -> None:
+    global _worker_settings
+    _worker_settings = (stylesheet, versification, project_name)
+
+
+def _collect_book_events_in_worker(
+    file_name: str, usfm: str, book_nums_and_chapters: Optional[Dict[int, Optional[Set[int]]]]
+) -> List[UsfmVersificationEvent]:
+    assert _worker_settings is not None
+    collector = UsfmVersificationEventCollector(book_nums_and_chapters)
+    _parse_book(file_name, usfm, collector, *_worker_settings)
+    return collector.events
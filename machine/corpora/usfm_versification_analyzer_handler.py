@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, Iterator, List, Optional, Sequence, Set
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 from machine.scripture import canon
 
@@ -26,6 +26,11 @@ class UsfmVersificationDiagnostic:
     references: List[VerseRef]
     filename: Optional[str]
     line_numbers: List[int]
+    # Contiguous references are merged numerically using the (book, chapter, first verse, last verse) span of the last
+    # reference, so the verses of a reference only need to be listed once
+    _last_reference_span: Optional[Tuple[VerseRef, Tuple[int, int, int, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def num_affected_verses(self) -> int:
@@ -33,34 +38,43 @@ class UsfmVersificationDiagnostic:
 
     def extend(self, verse_reference: VerseRef, line_number: Optional[int] = None) -> None:
         combined = False
+        span = _get_span(verse_reference)
         if self.references:  # Combine contiguous references
             last_reference = self.references[-1]
+            last_span = (
+                self._last_reference_span[1]
+                if self._last_reference_span is not None and self._last_reference_span[0] is last_reference
+                else _get_span(last_reference)
+            )
+            book_num, chapter_num, next_verse_num, final_verse_num = span
+            last_book_num, last_chapter_num, first_verse_num, last_verse_num = last_span
             if (
-                verse_reference.book == last_reference.book
-                and verse_reference.chapter_num == last_reference.chapter_num
+                book_num == last_book_num
+                and chapter_num == last_chapter_num
+                and next_verse_num == last_verse_num + 1
+                and book_num > 0
+                and chapter_num >= 0
+                and first_verse_num >= 0
             ):
-                last_verse_num = list(last_reference.all_verses())[-1].verse_num
-                next_verse_num = list(verse_reference.all_verses())[0].verse_num
-                first_verse_num = list(last_reference.all_verses())[0].verse_num
-                final_verse_num = list(verse_reference.all_verses())[-1].verse_num
-                if (
-                    next_verse_num == last_verse_num + 1
-                    and (
-                        updated_verse_reference := VerseRef.try_from_string(
-                            f"{verse_reference.book} {verse_reference.chapter_num}:{first_verse_num}-{final_verse_num}"
-                        )
-                    )
-                    is not None
-                ):
-                    self.references[-1] = updated_verse_reference
-                    combined = True
+                span = (book_num, chapter_num, first_verse_num, final_verse_num)
+                verse_reference = VerseRef(book_num, chapter_num, f"{first_verse_num}-{final_verse_num}")
+                self.references[-1] = verse_reference
+                combined = True
 
         if not combined:
             self.references.append(verse_reference)
+        self._last_reference_span = (verse_reference, span)
         if line_number is not None:
             self.line_numbers.append(line_number)
 
 
+def _get_span(verse_ref: VerseRef) -> Tuple[int, int, int, int]:
+    if verse_ref.chapter_num <= 0 or not verse_ref.has_multiple:
+        return (verse_ref.book_num, verse_ref.chapter_num, verse_ref.verse_num, verse_ref.verse_num)
+    verses = list(verse_ref.all_verses())
+    return (verse_ref.book_num, verse_ref.chapter_num, verses[0].verse_num, verses[-1].verse_num)
+
+
 @dataclass
 class UsfmVersificationAnalysis:
     total_num_affected_verses: int
@@ -69,6 +83,99 @@ class UsfmVersificationAnalysis:
     project_settings: ParatextProjectSettings
 
 
+class _StartBookEvent(NamedTuple):
+    book: str
+
+
+class _InvalidChapterEvent(NamedTuple):
+    verse_ref: VerseRef
+    line_number: int
+
+
+class _VerseEvent(NamedTuple):
+    current_verses: VerseRef
+    verse_ref: VerseRef
+    line_number: int
+    invalid: bool
+    segment_mismatch: bool
+    unsupported_verse_range: bool
+    verses: List[VerseRef]
+
+
+# The parser events that the analysis depends on. The checks that do not depend on the expected verses are already
+# applied, so a book can be parsed in a separate process and its events handled later in canonical order.
+UsfmVersificationEvent = Union[_StartBookEvent, _InvalidChapterEvent, _VerseEvent]
+
+
+def _create_invalid_chapter_event(state: UsfmParserState, number: str) -> Optional[_InvalidChapterEvent]:
+    verse_ref = state.verse_ref.copy()
+    if not canon.is_canonical(verse_ref.book):
+        return None
+    verse_ref.chapter = number
+    if verse_ref.chapter_num != -1:
+        return None
+    return _InvalidChapterEvent(verse_ref, state.line_number)
+
+
+def _create_verse_event(
+    state: UsfmParserState, number: str, only_chapters: Optional[Dict[int, Optional[Set[int]]]]
+) -> Optional[_VerseEvent]:
+    current_verses = state.verse_ref.copy()
+    if only_chapters is not None:
+        if current_verses.book_num not in only_chapters:
+            return None
+        chapters_filter = only_chapters[current_verses.book_num]
+        if chapters_filter is not None and current_verses.chapter_num not in chapters_filter:
+            return None
+
+    verse_ref = current_verses.copy()
+    if not canon.is_canonical(verse_ref.book):
+        return None
+    verse_ref.verse = number
+    invalid_verse_num = verse_ref.verse_num == -1
+    bad_verse_range = verse_ref.valid_status in (ValidStatus.VERSE_OUT_OF_ORDER, ValidStatus.VERSE_REPEATED)
+
+    segment_mismatch = (not current_verses.segment()) == current_verses.has_segments_defined
+
+    has_cross_chapter_verse_range = False
+    if current_verses.has_multiple:
+        copy = current_verses.copy()
+        has_cross_chapter_verse_range = not copy.change_versification(ORIGINAL_VERSIFICATION)
+
+    return _VerseEvent(
+        current_verses,
+        verse_ref,
+        state.line_number,
+        invalid_verse_num or bad_verse_range,
+        segment_mismatch,
+        has_cross_chapter_verse_range,
+        sorted(current_verses.all_verses()),
+    )
+
+
+class UsfmVersificationEventCollector(UsfmParserHandler):
+    def __init__(self, only_chapters: Optional[Dict[int, Optional[Set[int]]]] = None) -> None:
+        self._only_chapters = only_chapters
+        self.events: List[UsfmVersificationEvent] = []
+
+    def start_book(self, state: UsfmParserState, marker: str, code: str) -> None:
+        self.events.append(_StartBookEvent(state.verse_ref.book))
+
+    def chapter(
+        self, state: UsfmParserState, number: str, marker: str, alt_number: Optional[str], pub_number: Optional[str]
+    ) -> None:
+        event = _create_invalid_chapter_event(state, number)
+        if event is not None:
+            self.events.append(event)
+
+    def verse(
+        self, state: UsfmParserState, number: str, marker: str, alt_number: Optional[str], pub_number: Optional[str]
+    ) -> None:
+        event = _create_verse_event(state, number, self._only_chapters)
+        if event is not None:
+            self.events.append(event)
+
+
 class UsfmVersificationAnalyzerHandler(UsfmParserHandler):
     def __init__(
         self, settings: ParatextProjectSettings, only_chapters: Optional[Dict[int, Optional[Set[int]]]] = None
@@ -118,67 +225,74 @@ class UsfmVersificationAnalyzerHandler(UsfmParserHandler):
         )
 
     def start_book(self, state: UsfmParserState, marker: str, code: str) -> None:
-        self._filename = self._settings.get_book_file_name(state.verse_ref.book)
+        self._start_book(state.verse_ref.book)
 
     def chapter(
         self, state: UsfmParserState, number: str, marker: str, alt_number: Optional[str], pub_number: Optional[str]
     ) -> None:
-        verse_ref = state.verse_ref.copy()
-        if not canon.is_canonical(verse_ref.book):
-            return
-        verse_ref.chapter = number
-        if verse_ref.chapter_num == -1:
-            self._diagnostics.append(
-                UsfmVersificationDiagnostic(
-                    type=UsfmVersificationDiagnosticType.INVALID,
-                    references=[verse_ref],
-                    filename=self._filename,
-                    line_numbers=[state.line_number],
-                )
-            )
-            self._last_verse_in_error = True
+        event = _create_invalid_chapter_event(state, number)
+        if event is not None:
+            self._handle_invalid_chapter(event)
 
     def verse(
         self, state: UsfmParserState, number: str, marker: str, alt_number: Optional[str], pub_number: Optional[str]
     ) -> None:
-        current_verses = state.verse_ref.copy()
-        if self._only_chapters is not None:
-            if current_verses.book_num not in self._only_chapters:
-                return
-            chapters_filter = self._only_chapters[current_verses.book_num]
-            if chapters_filter is not None and current_verses.chapter_num not in chapters_filter:
-                return
-
-        verse_ref = current_verses.copy()
-        if not canon.is_canonical(verse_ref.book):
-            return
-        verse_ref.verse = number
-        invalid_verse_num = verse_ref.verse_num == -1
-        bad_verse_range = verse_ref.valid_status in (ValidStatus.VERSE_OUT_OF_ORDER, ValidStatus.VERSE_REPEATED)
-        if invalid_verse_num or bad_verse_range:
-            self._handle_invalid_verse(state, verse_ref)
+        event = _create_verse_event(state, number, self._only_chapters)
+        if event is not None:
+            self._handle_verse(event)
+
+    def handle_events(self, events: Iterable[UsfmVersificationEvent]) -> None:
+        # events collected in another process refer to a copy of the versification
+        versification = self._settings.versification
+        for event in events:
+            if isinstance(event, _StartBookEvent):
+                self._start_book(event.book)
+                continue
+            if isinstance(event, _InvalidChapterEvent):
+                event.verse_ref.versification = versification
+                self._handle_invalid_chapter(event)
+            else:
+                event.current_verses.versification = versification
+                event.verse_ref.versification = versification
+                for verse in event.verses:
+                    verse.versification = versification
+                self._handle_verse(event)
+
+    def _start_book(self, book: str) -> None:
+        self._filename = self._settings.get_book_file_name(book)
+
+    def _handle_invalid_chapter(self, event: _InvalidChapterEvent) -> None:
+        self._diagnostics.append(
+            UsfmVersificationDiagnostic(
+                type=UsfmVersificationDiagnosticType.INVALID,
+                references=[event.verse_ref],
+                filename=self._filename,
+                line_numbers=[event.line_number],
+            )
+        )
+        self._last_verse_in_error = True
+
+    def _handle_verse(self, event: _VerseEvent) -> None:
+        if event.invalid:
+            self._handle_invalid_verse(event.line_number, event.verse_ref)
             self._last_verse_was_invalid = True
         else:
             self._last_verse_was_invalid = False
 
-        segment_mismatch = (not current_verses.segment()) == current_verses.has_segments_defined
-        if segment_mismatch:
-            self._handle_incorrect_verse_segment(state, verse_ref)
-
-        if current_verses.has_multiple:
-            copy = current_verses.copy()
-            has_cross_chapter_verse_range = not copy.change_versification(ORIGINAL_VERSIFICATION)
-            if has_cross_chapter_verse_range:
-                self._diagnostics.append(
-                    UsfmVersificationDiagnostic(
-                        type=UsfmVersificationDiagnosticType.UNSUPPORTED_VERSE_RANGE,
-                        references=[current_verses],
-                        filename=self._filename,
-                        line_numbers=[state.line_number],
-                    )
+        if event.segment_mismatch:
+            self._handle_incorrect_verse_segment(event.line_number, event.verse_ref)
+
+        if event.unsupported_verse_range:
+            self._diagnostics.append(
+                UsfmVersificationDiagnostic(
+                    type=UsfmVersificationDiagnosticType.UNSUPPORTED_VERSE_RANGE,
+                    references=[event.current_verses],
+                    filename=self._filename,
+                    line_numbers=[event.line_number],
                 )
+            )
 
-        for current_verse in sorted(current_verses.all_verses()):
+        for current_verse in event.verses:
             # Properly handle verse segments
             if self._prev_encountered_verse_ref.compare_to(current_verse, compare_segments=False) < 0:
                 self._total_verses_analyzed += 1
@@ -208,7 +322,7 @@ class UsfmVersificationAnalyzerHandler(UsfmParserHandler):
                         )
                     )
 
-                self._handle_extra_verse(state.line_number, current_verse)
+                self._handle_extra_verse(event.line_number, current_verse)
             else:
                 self._last_verse_in_error = False
             if compare <= 0:
@@ -216,26 +330,26 @@ class UsfmVersificationAnalyzerHandler(UsfmParserHandler):
 
             self._prev_encountered_verse_ref = current_verse
 
-        self._last_line_number = state.line_number
+        self._last_line_number = event.line_number
 
-    def _handle_invalid_verse(self, state: UsfmParserState, verse_ref: VerseRef) -> None:
+    def _handle_invalid_verse(self, line_number: int, verse_ref: VerseRef) -> None:
         self._diagnostics.append(
             UsfmVersificationDiagnostic(
                 type=UsfmVersificationDiagnosticType.INVALID,
                 references=[verse_ref],
                 filename=self._filename,
-                line_numbers=[state.line_number],
+                line_numbers=[line_number],
             )
         )
         self._last_verse_in_error = True
 
-    def _handle_incorrect_verse_segment(self, state: UsfmParserState, verse_ref: VerseRef) -> None:
+    def _handle_incorrect_verse_segment(self, line_number: int, verse_ref: VerseRef) -> None:
         self._diagnostics.append(
             UsfmVersificationDiagnostic(
                 type=UsfmVersificationDiagnosticType.INCORRECT_VERSE_SEGMENT,
                 references=[verse_ref],
                 filename=self._filename,
-                line_numbers=[state.line_number],
+                line_numbers=[line_number],
             )
         )
         self._last_verse_in_error = True
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
 from ..scripture.verse_ref import Versification
 from ..utils.typeshed import StrPath
+from .shared_zip_archive import SharedZipArchive
 from .stream_container import StreamContainer
 from .usfm_stylesheet import UsfmStylesheet
 from .usfm_text_base import UsfmTextBase
@@ -14,7 +15,7 @@ class UsfmZipText(UsfmTextBase):
         stylesheet: UsfmStylesheet,
         encoding: str,
         id: str,
-        archive_filename: StrPath,
+        archive: Union[StrPath, SharedZipArchive],
         path: str,
         versification: Optional[Versification] = None,
         include_markers: bool = False,
@@ -22,8 +23,8 @@ class UsfmZipText(UsfmTextBase):
         project: Optional[str] = None,
     ) -> None:
         super().__init__(id, stylesheet, encoding, versification, include_markers, include_all_text, project)
-        self._archive_filename = archive_filename
+        self._archive = archive
         self._path = path
 
     def _create_stream_container(self) -> StreamContainer:
-        return ZipEntryStreamContainer(self._archive_filename, self._path)
+        return ZipEntryStreamContainer(self._archive, self._path)
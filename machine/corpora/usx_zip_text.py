@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
 from ..scripture.verse_ref import Versification
 from ..utils.typeshed import StrPath
+from .shared_zip_archive import SharedZipArchive
 from .stream_container import StreamContainer
 from .usx_text_base import UsxTextBase
 from .zip_entry_stream_container import ZipEntryStreamContainer
@@ -11,14 +12,14 @@ class UsxZipText(UsxTextBase):
     def __init__(
         self,
         id: str,
-        archive_filename: StrPath,
+        archive: Union[StrPath, SharedZipArchive],
         path: str,
         versification: Optional[Versification] = None,
     ) -> None:
         super().__init__(id, versification)
 
-        self._archive_filename = archive_filename
+        self._archive = archive
         self._path = path
 
     def _create_stream_container(self) -> StreamContainer:
-        return ZipEntryStreamContainer(self._archive_filename, self._path)
+        return ZipEntryStreamContainer(self._archive, self._path)
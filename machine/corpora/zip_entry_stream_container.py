@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from io import BytesIO
-from typing import Any, BinaryIO
-from zipfile import ZipFile
+from typing import Any, BinaryIO, Union, cast
 
 from ..utils.typeshed import StrPath
+from .shared_zip_archive import SharedZipArchive
 from .stream_container import StreamContainer
 
 
 class ZipEntryStreamContainer(StreamContainer):
-    def __init__(self, archive_filename: StrPath, entry_path: str) -> None:
-        self._archive = ZipFile(archive_filename, "r")
-        self._entry = self._archive.getinfo(entry_path)
+    def __init__(self, archive: Union[StrPath, SharedZipArchive], entry_path: str) -> None:
+        self._archive = archive if isinstance(archive, SharedZipArchive) else SharedZipArchive(archive)
+        self._zip_file = self._archive.acquire()
+        self._closed = False
+        try:
+            self._entry = self._zip_file.getinfo(entry_path)
+        except Exception:
+            self.close()
+            raise
 
     def __enter__(self) -> ZipEntryStreamContainer:
         return self
@@ -20,7 +25,9 @@ class ZipEntryStreamContainer(StreamContainer):
         self.close()
 
     def open_stream(self) -> BinaryIO:
-        return BytesIO(self._archive.read(self._entry))
+        return cast(BinaryIO, self._zip_file.open(self._entry))
 
     def close(self) -> None:
-        self._archive.close()
+        if not self._closed:
+            self._closed = True
+            self._archive.release()
@@ -1,19 +1,46 @@
-from .clearml_shared_file_service import ClearMLSharedFileService
-from .local_shared_file_service import LocalSharedFileService
-from .nmt_engine_build_job import NmtEngineBuildJob
-from .nmt_model_factory import NmtModelFactory
-from .shared_file_service_base import DictToJsonWriter, SharedFileServiceBase
-from .smt_engine_build_job import SmtEngineBuildJob
-from .smt_model_factory import SmtModelFactory
-from .thot.thot_smt_model_factory import ThotSmtModelFactory
-from .thot.thot_word_alignment_model_factory import ThotWordAlignmentModelFactory
-from .translation_file_service import PretranslationInfo, TranslationFileService
-from .word_alignment_build_job import WordAlignmentBuildJob
-from .word_alignment_file_service import WordAlignmentFileService
-from .word_alignment_model_factory import WordAlignmentModelFactory
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .clearml_shared_file_service import ClearMLSharedFileService, ClearMLStorageBackend
+    from .file_transfer import FileTransfer, RemoteFileInfo, RetryPolicy, StorageBackend
+    from .local_shared_file_service import LocalSharedFileService
+    from .nmt_engine_build_job import NmtEngineBuildJob
+    from .nmt_model_factory import NmtModelFactory
+    from .shared_file_service_base import DictToJsonWriter, SharedFileServiceBase
+    from .smt_engine_build_job import SmtEngineBuildJob
+    from .smt_model_factory import SmtModelFactory
+    from .thot.thot_smt_model_factory import ThotSmtModelFactory
+    from .thot.thot_word_alignment_model_factory import ThotWordAlignmentModelFactory
+    from .translation_file_service import PretranslationInfo, TranslationFileService
+    from .word_alignment_build_job import WordAlignmentBuildJob
+    from .word_alignment_file_service import WordAlignmentFileService
+    from .word_alignment_model_factory import WordAlignmentModelFactory
+
+_IMPORT_STRUCTURE = {
+    ".clearml_shared_file_service": ["ClearMLSharedFileService", "ClearMLStorageBackend"],
+    ".file_transfer": ["FileTransfer", "RemoteFileInfo", "RetryPolicy", "StorageBackend"],
+    ".local_shared_file_service": ["LocalSharedFileService"],
+    ".nmt_engine_build_job": ["NmtEngineBuildJob"],
+    ".nmt_model_factory": ["NmtModelFactory"],
+    ".shared_file_service_base": ["DictToJsonWriter", "SharedFileServiceBase"],
+    ".smt_engine_build_job": ["SmtEngineBuildJob"],
+    ".smt_model_factory": ["SmtModelFactory"],
+    ".thot.thot_smt_model_factory": ["ThotSmtModelFactory"],
+    ".thot.thot_word_alignment_model_factory": ["ThotWordAlignmentModelFactory"],
+    ".translation_file_service": ["PretranslationInfo", "TranslationFileService"],
+    ".word_alignment_build_job": ["WordAlignmentBuildJob"],
+    ".word_alignment_file_service": ["WordAlignmentFileService"],
+    ".word_alignment_model_factory": ["WordAlignmentModelFactory"],
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _IMPORT_STRUCTURE)
 
 __all__ = [
     "ClearMLSharedFileService",
+    "ClearMLStorageBackend",
+    "FileTransfer",
     "LocalSharedFileService",
     "NmtEngineBuildJob",
     "NmtModelFactory",
@@ -21,9 +48,12 @@ __all__ = [
     "SharedFileServiceBase",
     "SmtEngineBuildJob",
     "SmtModelFactory",
+    "StorageBackend",
     "ThotSmtModelFactory",
     "ThotWordAlignmentModelFactory",
     "PretranslationInfo",
+    "RemoteFileInfo",
+    "RetryPolicy",
     "TranslationFileService",
     "WordAlignmentBuildJob",
     "WordAlignmentFileService",
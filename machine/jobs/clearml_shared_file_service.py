@@ -1,58 +1,85 @@
-import logging
-import time
 from pathlib import Path
-from typing import Callable
+from typing import Any, Iterable, List, Optional, Sequence
 
 from clearml import StorageManager
+from clearml.storage.helper import StorageHelper
 
+from .file_transfer import FileTransfer, RemoteFileInfo, RetryPolicy, StorageBackend, retry
 from .shared_file_service_base import SharedFileServiceBase
 
-logger = logging.getLogger(__name__)
+
+class ClearMLStorageBackend(StorageBackend):
+    def get_file_info(self, uri: str) -> RemoteFileInfo:
+        size = StorageManager.get_file_size_bytes(uri)
+        if size is None:
+            raise RuntimeError(f"Failed to get the size of file: {uri}")
+        return RemoteFileInfo(size)
+
+    def read_file(self, uri: str, offset: int = 0) -> Iterable[bytes]:
+        helper = StorageHelper.get(uri)
+        stream = None if helper is None else helper.download_as_stream(uri)
+        if stream is None:
+            raise RuntimeError(f"Failed to download file: {uri}")
+        # ClearML storage drivers do not support ranged reads, so the bytes before the offset are skipped
+        for chunk in stream:
+            if offset >= len(chunk):
+                offset -= len(chunk)
+                continue
+            yield chunk[offset:]
+            offset = 0
+
+    def write_file(self, local_path: Path, uri: str) -> None:
+        if StorageManager.upload_file(str(local_path), uri) is None:
+            raise RuntimeError(f"Failed to upload file {local_path} to {uri}.")
+
+    def exists_file(self, uri: str) -> bool:
+        return StorageManager.exists_file(uri)
 
 
 class ClearMLSharedFileService(SharedFileServiceBase):
-    def download_file(self, path: str) -> Path:
-        local_folder = str(self._data_dir)
-        file_path = try_n_times(
-            lambda: StorageManager.download_file(self._get_uri(path), local_folder, skip_zero_size_check=True)
+    def __init__(
+        self,
+        config: Any,
+        transfer: Optional[FileTransfer] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+    ) -> None:
+        super().__init__(config)
+        self._retry_policy = retry_policy
+        self._transfer = (
+            FileTransfer(ClearMLStorageBackend(), retry_policy=retry_policy) if transfer is None else transfer
         )
-        if file_path is None:
-            raise RuntimeError(f"Failed to download file: {self._get_uri(path)}")
-        return Path(file_path)
+
+    def download_file(self, path: str) -> Path:
+        return self._transfer.download_file(self._get_uri(path), self._get_local_path(path))
+
+    def download_files(self, paths: Sequence[str]) -> List[Path]:
+        return self._transfer.download_files([(self._get_uri(p), self._get_local_path(p)) for p in paths])
 
     def _download_folder(self, path: str) -> Path:
         local_folder = str(self._data_dir)
-        folder_path = try_n_times(lambda: StorageManager.download_folder(self._get_uri(path), local_folder))
+        folder_path = retry(
+            lambda: StorageManager.download_folder(self._get_uri(path), local_folder), self._retry_policy
+        )
         if folder_path is None:
             raise RuntimeError(f"Failed to download folder: {self._get_uri(path)}")
         return Path(folder_path) / path
 
     def _exists_file(self, path: str) -> bool:
-        return try_n_times(lambda: StorageManager.exists_file(self._get_uri(path)))  # type: ignore
+        return self._transfer.exists_file(self._get_uri(path))
 
     def _upload_file(self, path: str, local_file_path: Path) -> None:
-        final_destination = try_n_times(lambda: StorageManager.upload_file(str(local_file_path), self._get_uri(path)))
-        if final_destination is None:
-            logger.error((f"Failed to upload file {str(local_file_path)} " f"to {self._get_uri(path)}."))
+        self._transfer.upload_file(local_file_path, self._get_uri(path))
 
     def _upload_folder(self, path: str, local_folder_path: Path) -> None:
-        final_destination = try_n_times(
-            lambda: StorageManager.upload_folder(str(local_folder_path), self._get_uri(path))
-        )
-        if final_destination is None:
-            logger.error((f"Failed to upload folder {str(local_folder_path)} " f"to {self._get_uri(path)}."))
+        def _upload() -> None:
+            if StorageManager.upload_folder(str(local_folder_path), self._get_uri(path)) is None:
+                raise RuntimeError(f"Failed to upload folder {local_folder_path} to {self._get_uri(path)}.")
+
+        # like a file upload, a folder upload that still fails after the retries fails the build
+        retry(_upload, self._retry_policy)
 
     def _get_uri(self, path: str) -> str:
         return f"{self._shared_file_uri}/{self._shared_file_folder}/{path}"
 
-
-def try_n_times(func: Callable, n=10):
-    for i in range(n):
-        try:
-            return func()
-        except Exception as e:
-            if i < n - 1:
-                logger.exception(f"Failed {i+1} of {n} times.  Retrying.")
-                time.sleep(5)
-            else:
-                raise e
+    def _get_local_path(self, path: str) -> Path:
+        return self._data_dir / self._shared_file_folder / path
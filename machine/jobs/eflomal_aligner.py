@@ -112,7 +112,7 @@ class EflomalAligner:
     def __init__(self, model_dir: Path) -> None:
         self._model_dir = model_dir
 
-    def train(self, src_toks: Sequence[Sequence[str]], trg_toks: Sequence[Sequence[str]]) -> None:
+    def train(self, src_toks: Iterable[Sequence[str]], trg_toks: Iterable[Sequence[str]]) -> None:
         self._model_dir.mkdir(exist_ok=True)
         with TemporaryDirectory() as temp_dir:
             src_eflomal_path = Path(temp_dir, "source")
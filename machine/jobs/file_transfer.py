@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RemoteFileInfo:
+    size: int
+    sha256: Optional[str] = None
+
+
+class StorageBackend(ABC):
+    @abstractmethod
+    def get_file_info(self, uri: str) -> RemoteFileInfo: ...
+
+    @abstractmethod
+    def read_file(self, uri: str, offset: int = 0) -> Iterable[bytes]: ...
+
+    @abstractmethod
+    def write_file(self, local_path: Path, uri: str) -> None: ...
+
+    @abstractmethod
+    def exists_file(self, uri: str) -> bool: ...
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 10
+    initial_delay: float = 1.0
+    max_delay: float = 60.0
+    multiplier: float = 2.0
+
+    def get_delay(self, attempt: int) -> float:
+        # exponential backoff with full jitter
+        return random.uniform(0, min(self.max_delay, self.initial_delay * self.multiplier**attempt))
+
+
+def retry(func: Callable[[], T], policy: RetryPolicy, sleep: Callable[[float], None] = time.sleep) -> T:
+    for attempt in range(policy.max_attempts):
+        try:
+            return func()
+        except Exception:
+            if attempt == policy.max_attempts - 1:
+                raise
+            delay = policy.get_delay(attempt)
+            logger.exception(f"Failed {attempt + 1} of {policy.max_attempts} times. Retrying in {delay:.1f} seconds.")
+            sleep(delay)
+    raise ValueError("The retry policy must allow at least one attempt.")
+
+
+class FileTransfer:
+    def __init__(
+        self,
+        backend: StorageBackend,
+        max_workers: int = 4,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._backend = backend
+        self._max_workers = max_workers
+        self._retry_policy = retry_policy
+        self._sleep = sleep
+
+    def download_file(self, uri: str, local_path: Path) -> Path:
+        return self._retry(lambda: self._download_file(uri, local_path))
+
+    def download_files(self, files: Sequence[Tuple[str, Path]]) -> List[Path]:
+        return self._map(lambda f: self.download_file(*f), files)
+
+    def upload_file(self, local_path: Path, uri: str) -> None:
+        self._retry(lambda: self._upload_file(local_path, uri))
+
+    def upload_files(self, files: Sequence[Tuple[Path, str]]) -> None:
+        self._map(lambda f: self.upload_file(*f), files)
+
+    def exists_file(self, uri: str) -> bool:
+        return self._retry(lambda: self._backend.exists_file(uri))
+
+    def _download_file(self, uri: str, local_path: Path) -> Path:
+        info = self._backend.get_file_info(uri)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        # a partial file left behind by a failed attempt is resumed instead of downloaded again
+        partial_path = local_path.with_name(local_path.name + ".partial")
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+        if offset > info.size:
+            offset = 0
+        with partial_path.open("r+b" if offset > 0 else "wb") as file:
+            file.seek(offset)
+            file.truncate()
+            if offset < info.size:
+                for chunk in self._backend.read_file(uri, offset):
+                    file.write(chunk)
+
+        try:
+            _verify_file(partial_path, info)
+        except RuntimeError:
+            partial_path.unlink()
+            raise
+        partial_path.replace(local_path)
+        return local_path
+
+    def _upload_file(self, local_path: Path, uri: str) -> None:
+        self._backend.write_file(local_path, uri)
+        size = self._backend.get_file_info(uri).size
+        if size != local_path.stat().st_size:
+            raise RuntimeError(f"Uploaded file {uri} has size {size}, expected {local_path.stat().st_size}.")
+
+    def _retry(self, func: Callable[[], T]) -> T:
+        return retry(func, self._retry_policy, self._sleep)
+
+    def _map(self, func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        if self._max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+
+def _verify_file(path: Path, info: RemoteFileInfo) -> None:
+    size = path.stat().st_size
+    if size != info.size:
+        raise RuntimeError(f"Downloaded file {path} has size {size}, expected {info.size}.")
+    if info.sha256 is not None:
+        sha256 = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(_HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        if sha256.hexdigest() != info.sha256:
+            raise RuntimeError(f"Downloaded file {path} does not match the expected checksum.")
@@ -1,5 +1,4 @@
 import logging
-import tarfile
 from pathlib import Path
 from typing import Any, cast
 
@@ -16,6 +15,7 @@ from ...translation.huggingface.hugging_face_nmt_model_trainer import HuggingFac
 from ...translation.null_trainer import NullTrainer
 from ...translation.trainer import Trainer
 from ...translation.translation_engine import TranslationEngine
+from ...utils.archive_utils import create_tar_gz
 from ..nmt_model_factory import NmtModelFactory
 
 logger = logging.getLogger(__name__)
@@ -99,6 +99,11 @@ class HuggingFaceNmtModelFactory(NmtModelFactory):
             batch_size=self._config.huggingface.generate_params.batch_size,
             truncation=TruncationStrategy.LONGEST_FIRST,
             oom_batch_size_backoff_mult=self._config.huggingface.generate_params.oom_batch_size_backoff_mult,
+            oom_batch_size_probe_interval=self._config.huggingface.generate_params.get(
+                "oom_batch_size_probe_interval", 20
+            ),
+            batch_by_length=self._config.huggingface.generate_params.get("batch_by_length", False),
+            max_batch_tokens=self._config.huggingface.generate_params.get("max_batch_tokens"),
             output_attentions=False,
         )
 
@@ -106,7 +111,7 @@ class HuggingFaceNmtModelFactory(NmtModelFactory):
         tar_file_path = Path(
             self._config.data_dir, self._config.shared_file_folder, "builds", self._config.build_id, "model.tar.gz"
         )
-        with tarfile.open(tar_file_path, "w:gz") as tar:
+        with create_tar_gz(tar_file_path) as tar:
             for path in self._model_dir.iterdir():
                 if path.is_file():
                     tar.add(path, arcname=path.name)
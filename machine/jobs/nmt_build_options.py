@@ -33,6 +33,9 @@ class GenerateParams(BaseModel):
     num_beams: int | None = None
     batch_size: int | None = None
     oom_batch_size_backoff_mult: float | None = None
+    oom_batch_size_probe_interval: int | None = None
+    batch_by_length: bool | None = None
+    max_batch_tokens: int | None = None
 
 
 class TokenizerConfig(BaseModel):
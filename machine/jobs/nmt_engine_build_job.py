@@ -1,8 +1,10 @@
+import json
 import logging
 from contextlib import ExitStack
 from pathlib import Path
+from queue import Queue
 from tempfile import TemporaryDirectory
-from typing import Any, Callable, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
 
 from ..corpora.corpora_utils import batch
 from ..corpora.parallel_text_corpus import ParallelTextCorpus
@@ -11,6 +13,8 @@ from ..utils.phased_progress_reporter import Phase, PhasedProgressReporter
 from ..utils.progress_status import ProgressStatus
 from .eflomal_aligner import EflomalAligner, is_eflomal_available, tokenize
 from .nmt_model_factory import NmtModelFactory
+from .pipeline import Pipeline
+from .shared_file_service_base import DictToJsonWriter
 from .translation_engine_build_job import TranslationEngineBuildJob
 from .translation_file_service import PretranslationInfo, TranslationFileService
 
@@ -98,55 +102,71 @@ class NmtEngineBuildJob(TranslationEngineBuildJob):
         check_canceled: Optional[Callable[[], None]],
     ) -> None:
         logger.info("Pretranslating segments")
-        with self._translation_file_service.get_source_pretranslations() as src_pretranslations:
-            inference_step_count = sum(1 for _ in src_pretranslations)
-        with ExitStack() as stack:
-            phase_progress = stack.enter_context(progress_reporter.start_next_phase())
-            engine = stack.enter_context(self._nmt_model_factory.create_engine())
-            pretranslations = [
-                pt_info for pt_info in stack.enter_context(self._translation_file_service.get_source_pretranslations())
-            ]
-            src_segments = [pt_info["translation"] for pt_info in pretranslations]
-            current_inference_step = 0
-            phase_progress(ProgressStatus.from_step(current_inference_step, inference_step_count))
-            batch_size = self._config["inference_batch_size"]
-            for seg_batch in batch(iter(src_segments), batch_size):
-                if check_canceled is not None:
-                    check_canceled()
-                for i, result in enumerate(engine.translate_batch(seg_batch)):
-                    pretranslations[current_inference_step + i]["translation"] = result.translation
-                    pretranslations[current_inference_step + i]["sequenceConfidence"] = result.sequence_confidence
-                current_inference_step += len(seg_batch)
+        inference_step_count = self._translation_file_service.count_source_pretranslations()
+        align_pretranslations = self._config.align_pretranslations and is_eflomal_available()
+        with TemporaryDirectory() as td:
+            # when aligning, pretranslations are spooled to disk until the aligner has seen all of them
+            spool_path = Path(td, "pretranslations.jsonl")
+            with ExitStack() as stack:
+                phase_progress = stack.enter_context(progress_reporter.start_next_phase())
+                engine = stack.enter_context(self._nmt_model_factory.create_engine())
+                if align_pretranslations:
+                    writer: DictToJsonWriter = _JsonLinesWriter(
+                        stack.enter_context(spool_path.open("w", encoding="utf-8", newline="\n"))
+                    )
+                else:
+                    writer = stack.enter_context(self._translation_file_service.open_target_pretranslation_writer())
+                pipeline = stack.enter_context(Pipeline())
+                src_batches: "Queue[Optional[Sequence[PretranslationInfo]]]" = Queue(_MAX_QUEUED_BATCHES)
+                trg_batches: "Queue[Optional[Tuple[Sequence[str], Sequence[PretranslationInfo]]]]" = Queue(
+                    _MAX_QUEUED_BATCHES
+                )
+                pipeline.start(self._read_pretranslations, pipeline, src_batches)
+                pipeline.start(_write_pretranslations, pipeline, trg_batches, writer, align_pretranslations)
+
+                current_inference_step = 0
                 phase_progress(ProgressStatus.from_step(current_inference_step, inference_step_count))
-
-            if self._config.align_pretranslations and is_eflomal_available():
-                logger.info("Aligning source to pretranslations")
-                pretranslations = self._align(src_segments, pretranslations, progress_reporter, check_canceled)
-
-            writer = stack.enter_context(self._translation_file_service.open_target_pretranslation_writer())
-            for pretranslation in pretranslations:
-                writer.write(pretranslation)
+                while (pi_batch := pipeline.get(src_batches)) is not None:
+                    if check_canceled is not None:
+                        check_canceled()
+                    src_segments = [pi["translation"] for pi in pi_batch]
+                    for pi, result in zip(pi_batch, engine.translate_batch(src_segments)):
+                        pi["translation"] = result.translation
+                        pi["sequenceConfidence"] = result.sequence_confidence
+                    pipeline.put(trg_batches, (src_segments, pi_batch))
+                    current_inference_step += len(pi_batch)
+                    phase_progress(ProgressStatus.from_step(current_inference_step, inference_step_count))
+                pipeline.put(trg_batches, None)
+                pipeline.join()
+
+            if align_pretranslations:
+                self._align(spool_path, progress_reporter, check_canceled)
+
+    def _read_pretranslations(
+        self, pipeline: Pipeline, src_batches: "Queue[Optional[Sequence[PretranslationInfo]]]"
+    ) -> None:
+        with self._translation_file_service.get_source_pretranslations() as src_pretranslations:
+            for pi_batch in batch(src_pretranslations, self._config["inference_batch_size"]):
+                pipeline.put(src_batches, pi_batch)
+        pipeline.put(src_batches, None)
 
     def _align(
         self,
-        src_segments: Sequence[str],
-        pretranslations: Sequence[PretranslationInfo],
+        spool_path: Path,
         progress_reporter: PhasedProgressReporter,
         check_canceled: Optional[Callable[[], None]],
-    ) -> Sequence[PretranslationInfo]:
+    ) -> None:
         if check_canceled is not None:
             check_canceled()
 
         logger.info("Aligning source to pretranslations")
-        progress_reporter.start_next_phase()
-
-        src_tokenized = [tokenize(s) for s in src_segments]
-        trg_tokenized = [tokenize(pt_info["translation"]) for pt_info in pretranslations]
-
-        with TemporaryDirectory() as td:
+        with progress_reporter.start_next_phase(), TemporaryDirectory() as td:
             aligner = EflomalAligner(Path(td))
             logger.info("Training aligner")
-            aligner.train(src_tokenized, trg_tokenized)
+            aligner.train(
+                (pi["sourceTokens"] for pi in _read_spooled_pretranslations(spool_path)),
+                (pi["translationTokens"] for pi in _read_spooled_pretranslations(spool_path)),
+            )
 
             if check_canceled is not None:
                 check_canceled()
@@ -154,15 +174,13 @@ class NmtEngineBuildJob(TranslationEngineBuildJob):
             logger.info("Aligning pretranslations")
             alignments = aligner.align()
 
-        if check_canceled is not None:
-            check_canceled()
-
-        for i in range(len(pretranslations)):
-            pretranslations[i]["sourceTokens"] = list(src_tokenized[i])
-            pretranslations[i]["translationTokens"] = list(trg_tokenized[i])
-            pretranslations[i]["alignment"] = alignments[i]
+            if check_canceled is not None:
+                check_canceled()
 
-        return pretranslations
+            with self._translation_file_service.open_target_pretranslation_writer() as writer:
+                for pi, alignment in zip(_read_spooled_pretranslations(spool_path), alignments):
+                    pi["alignment"] = alignment
+                    writer.write(pi)
 
     def _save_model(self) -> None:
         if "save_model" in self._config and self._config.save_model is not None:
@@ -171,3 +189,32 @@ class NmtEngineBuildJob(TranslationEngineBuildJob):
             self._translation_file_service.save_model(
                 model_path, f"models/{self._config.save_model + ''.join(model_path.suffixes)}"
             )
+
+
+_MAX_QUEUED_BATCHES = 4
+
+
+class _JsonLinesWriter(DictToJsonWriter):
+    def write(self, pi: object) -> None:
+        self._file.write(json.dumps(pi) + "\n")
+
+
+def _read_spooled_pretranslations(path: Path) -> Iterator[PretranslationInfo]:
+    with path.open("r", encoding="utf-8") as file:
+        for line in file:
+            yield json.loads(line)
+
+
+def _write_pretranslations(
+    pipeline: Pipeline,
+    trg_batches: "Queue[Optional[Tuple[Sequence[str], Sequence[PretranslationInfo]]]]",
+    writer: DictToJsonWriter,
+    tokenize_pretranslations: bool,
+) -> None:
+    while (item := pipeline.get(trg_batches)) is not None:
+        src_segments, pi_batch = item
+        for src_segment, pi in zip(src_segments, pi_batch):
+            if tokenize_pretranslations:
+                pi["sourceTokens"] = list(tokenize(src_segment))
+                pi["translationTokens"] = list(tokenize(pi["translation"]))
+            writer.write(pi)
@@ -0,0 +1,71 @@
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Any, Callable, ContextManager, List, Optional
+
+_POLL_INTERVAL = 0.1
+
+
+class PipelineStoppedError(Exception):
+    pass
+
+
+class Pipeline(ContextManager["Pipeline"]):
+    """Runs the stages of a producer/consumer pipeline on background threads.
+
+    Stages exchange items through bounded queues using :meth:`get` and :meth:`put`. If any stage fails, the pipeline is
+    stopped, every blocked stage is released, and the error is re-raised in the thread that owns the pipeline.
+    """
+
+    def __init__(self) -> None:
+        self._threads: List[Thread] = []
+        self._stopped = Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self, stage: Callable[..., None], *args: Any) -> None:
+        thread = Thread(target=self._run, args=(stage, *args), daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def get(self, queue: Queue) -> Any:
+        while True:
+            self._check_stopped()
+            try:
+                return queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                pass
+
+    def put(self, queue: Queue, item: Any) -> None:
+        while True:
+            self._check_stopped()
+            try:
+                queue.put(item, timeout=_POLL_INTERVAL)
+                return
+            except Full:
+                pass
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self, stage: Callable[..., None], *args: Any) -> None:
+        try:
+            stage(*args)
+        except PipelineStoppedError:
+            pass
+        except BaseException as e:
+            if self._error is None:
+                self._error = e
+            self._stopped.set()
+
+    def _check_stopped(self) -> None:
+        if self._stopped.is_set():
+            raise self._error if self._error is not None else PipelineStoppedError()
+
+    def __exit__(self, type: Any, value: Any, traceback: Any) -> None:
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
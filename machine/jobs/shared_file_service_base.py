@@ -1,7 +1,7 @@
 import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Iterator, TextIO
+from typing import Any, Iterator, List, Sequence, TextIO
 
 
 class PrettyFloat(float):
@@ -79,6 +79,9 @@ class SharedFileServiceBase(ABC):
     @abstractmethod
     def download_file(self, path: str) -> Path: ...
 
+    def download_files(self, paths: Sequence[str]) -> List[Path]:
+        return [self.download_file(path) for path in paths]
+
     @abstractmethod
     def _download_folder(self, path: str) -> Path: ...
 
@@ -9,6 +9,7 @@ class ThotMt(BaseModel):
 
     word_alignment_model_type: str | None = None
     tokenizer: str | None = None
+    inference_workers: int | None = None
 
 
 class SmtBuildOptions(BaseModel):
@@ -1,6 +1,9 @@
 import logging
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from contextlib import ExitStack
-from typing import Any, Callable, Optional, Sequence, Tuple
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Sequence, Tuple
 
 from ..corpora.corpora_utils import batch
 from ..corpora.parallel_text_corpus import ParallelTextCorpus
@@ -9,7 +12,6 @@ from ..tokenization.tokenizer_factory import create_detokenizer, create_tokenize
 from ..translation.translation_engine import TranslationEngine
 from ..utils.phased_progress_reporter import Phase, PhasedProgressReporter
 from ..utils.progress_status import ProgressStatus
-from .shared_file_service_base import DictToJsonWriter
 from .smt_model_factory import SmtModelFactory
 from .translation_engine_build_job import TranslationEngineBuildJob
 from .translation_file_service import PretranslationInfo, TranslationFileService
@@ -74,23 +76,42 @@ class SmtEngineBuildJob(TranslationEngineBuildJob):
         progress_reporter: PhasedProgressReporter,
         check_canceled: Optional[Callable[[], None]],
     ) -> None:
-        with self._translation_file_service.get_source_pretranslations() as src_pretranslations:
-            inference_step_count = sum(1 for _ in src_pretranslations)
+        inference_step_count = self._translation_file_service.count_source_pretranslations()
+        inference_workers = self._config.thot_mt.get("inference_workers", 1)
 
         with ExitStack() as stack:
-            detokenizer = create_detokenizer(self._config.thot_mt.tokenizer)
-            truecaser = self._smt_model_factory.create_truecaser()
             phase_progress = stack.enter_context(progress_reporter.start_next_phase())
-            engine = stack.enter_context(self._smt_model_factory.create_engine(self._tokenizer, detokenizer, truecaser))
             src_pretranslations = stack.enter_context(self._translation_file_service.get_source_pretranslations())
+            pi_batches = batch(src_pretranslations, self._config["inference_batch_size"])
+            translated_batches: Iterable[Tuple[Sequence[PretranslationInfo], Sequence[str]]]
+            if inference_workers > 1:
+                logger.info(f"Pretranslating segments with {inference_workers} workers")
+                executor = ProcessPoolExecutor(
+                    max_workers=inference_workers,
+                    initializer=_init_worker,
+                    initargs=(self._smt_model_factory, self._config.thot_mt.tokenizer),
+                )
+                stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+                translated_batches = _translate_batches_in_parallel(executor, pi_batches, 2 * inference_workers)
+            else:
+                detokenizer = create_detokenizer(self._config.thot_mt.tokenizer)
+                truecaser = self._smt_model_factory.create_truecaser()
+                engine = stack.enter_context(
+                    self._smt_model_factory.create_engine(self._tokenizer, detokenizer, truecaser)
+                )
+                translated_batches = (
+                    (pi_batch, _translate_segments(engine, [pi["translation"] for pi in pi_batch]))
+                    for pi_batch in pi_batches
+                )
             writer = stack.enter_context(self._translation_file_service.open_target_pretranslation_writer())
             current_inference_step = 0
             phase_progress(ProgressStatus.from_step(current_inference_step, inference_step_count))
-            batch_size = self._config["inference_batch_size"]
-            for pi_batch in batch(src_pretranslations, batch_size):
+            for pi_batch, translations in translated_batches:
                 if check_canceled is not None:
                     check_canceled()
-                _translate_batch(engine, pi_batch, writer)
+                for pi, translation in zip(pi_batch, translations):
+                    pi["translation"] = translation
+                    writer.write(pi)
                 current_inference_step += len(pi_batch)
                 phase_progress(ProgressStatus.from_step(current_inference_step, inference_step_count))
 
@@ -102,12 +123,38 @@ class SmtEngineBuildJob(TranslationEngineBuildJob):
         )
 
 
-def _translate_batch(
-    engine: TranslationEngine,
-    batch: Sequence[PretranslationInfo],
-    writer: DictToJsonWriter,
-) -> None:
-    source_segments = [pi["translation"] for pi in batch]
-    for i, result in enumerate(engine.translate_batch(source_segments)):
-        batch[i]["translation"] = result.translation
-        writer.write(batch[i])
+def _translate_segments(engine: TranslationEngine, segments: Sequence[str]) -> Sequence[str]:
+    return [result.translation for result in engine.translate_batch(segments)]
+
+
+def _translate_batches_in_parallel(
+    executor: Executor, pi_batches: Iterable[Sequence[PretranslationInfo]], max_pending_batches: int
+) -> Iterator[Tuple[Sequence[PretranslationInfo], Sequence[str]]]:
+    # batches are submitted as workers free up, but always yielded in their original order
+    pending: Deque[Tuple[Sequence[PretranslationInfo], Future[Sequence[str]]]] = deque()
+    for pi_batch in pi_batches:
+        pending.append((pi_batch, executor.submit(_translate_in_worker, [pi["translation"] for pi in pi_batch])))
+        if len(pending) >= max_pending_batches:
+            pi_batch, future = pending.popleft()
+            yield pi_batch, future.result()
+    while len(pending) > 0:
+        pi_batch, future = pending.popleft()
+        yield pi_batch, future.result()
+
+
+_worker_engine: Optional[TranslationEngine] = None
+
+
+def _init_worker(smt_model_factory: SmtModelFactory, tokenizer_type: str) -> None:
+    global _worker_engine
+    _worker_engine = smt_model_factory.create_engine(
+        create_tokenizer(tokenizer_type), create_detokenizer(tokenizer_type), smt_model_factory.create_truecaser()
+    )
+    # close the engine when the worker exits; forked workers exit with os._exit, which skips atexit handlers, but
+    # multiprocessing runs its finalizers before that
+    Finalize(None, _worker_engine.close, exitpriority=0)
+
+
+def _translate_in_worker(segments: Sequence[str]) -> Sequence[str]:
+    assert _worker_engine is not None
+    return _translate_segments(_worker_engine, segments)
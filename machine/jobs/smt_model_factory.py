@@ -1,4 +1,3 @@
-import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
@@ -10,6 +9,7 @@ from ..tokenization.tokenizer import Tokenizer
 from ..translation.trainer import Trainer
 from ..translation.translation_engine import TranslationEngine
 from ..translation.truecaser import Truecaser
+from ..utils.archive_utils import create_tar_gz
 
 
 class SmtModelFactory(ABC):
@@ -37,10 +37,12 @@ class SmtModelFactory(ABC):
     def create_truecaser(self) -> Truecaser: ...
 
     def save_model(self) -> Path:
-        tar_file_basename = Path(
-            self._config.data_dir, self._config.shared_file_folder, "builds", self._config.build_id, "model"
+        tar_file_path = Path(
+            self._config.data_dir, self._config.shared_file_folder, "builds", self._config.build_id, "model.tar.gz"
         )
-        return Path(shutil.make_archive(str(tar_file_basename), "gztar", self._model_dir))
+        with create_tar_gz(tar_file_path) as tar:
+            tar.add(self._model_dir, arcname=".")
+        return tar_file_path
 
     @property
     def _model_dir(self) -> Path:
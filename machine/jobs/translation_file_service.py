@@ -48,27 +48,23 @@ class TranslationFileService:
 
     def create_source_corpus(self) -> TextCorpus:
         return TextFileTextCorpus(
-            file_patterns=[
-                self.shared_file_service.download_file(
-                    f"{self.shared_file_service.build_path}/{self._source_filename}"
-                ),
-                self.shared_file_service.download_file(
-                    f"{self.shared_file_service.build_path}/{self._source_terms_filename}"
-                ),
-            ],
+            file_patterns=self.shared_file_service.download_files(
+                [
+                    f"{self.shared_file_service.build_path}/{self._source_filename}",
+                    f"{self.shared_file_service.build_path}/{self._source_terms_filename}",
+                ]
+            ),
             content_types=[TextRowContentType.SEGMENT, TextRowContentType.WORD],
         )
 
     def create_target_corpus(self) -> TextCorpus:
         return TextFileTextCorpus(
-            file_patterns=[
-                self.shared_file_service.download_file(
-                    f"{self.shared_file_service.build_path}/{self._target_filename}"
-                ),
-                self.shared_file_service.download_file(
-                    f"{self.shared_file_service.build_path}/{self._target_terms_filename}"
-                ),
-            ],
+            file_patterns=self.shared_file_service.download_files(
+                [
+                    f"{self.shared_file_service.build_path}/{self._target_filename}",
+                    f"{self.shared_file_service.build_path}/{self._target_terms_filename}",
+                ]
+            ),
             content_types=[TextRowContentType.SEGMENT, TextRowContentType.WORD],
         )
 
@@ -84,10 +80,14 @@ class TranslationFileService:
             for target_filename in [self._target_filename, self._target_terms_filename]
         )
 
+    def count_source_pretranslations(self) -> int:
+        src_pretranslate_path = self._download_source_pretranslations()
+        with src_pretranslate_path.open("r", encoding="utf-8-sig") as file:
+            # items are skipped by the streaming parser without being materialized
+            return sum(1 for _ in json_stream.load(file))
+
     def get_source_pretranslations(self) -> ContextManagedGenerator[PretranslationInfo, None, None]:
-        src_pretranslate_path = self.shared_file_service.download_file(
-            f"{self.shared_file_service.build_path}/{self._source_pretranslation_filename}"
-        )
+        src_pretranslate_path = self._download_source_pretranslations()
 
         def generator() -> Generator[PretranslationInfo, None, None]:
             with src_pretranslate_path.open("r", encoding="utf-8-sig") as file:
@@ -109,6 +109,11 @@ class TranslationFileService:
     def save_model(self, model_path: Path, destination: str) -> None:
         self.shared_file_service.upload_path(model_path, destination)
 
+    def _download_source_pretranslations(self) -> Path:
+        return self.shared_file_service.download_file(
+            f"{self.shared_file_service.build_path}/{self._source_pretranslation_filename}"
+        )
+
     @contextmanager
     def open_target_pretranslation_writer(self) -> Iterator[DictToJsonWriter]:
         return self.shared_file_service.open_target_writer(self._target_pretranslation_filename)
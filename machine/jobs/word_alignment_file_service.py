@@ -44,14 +44,22 @@ class WordAlignmentFileService:
 
     def create_source_corpus(self) -> TextCorpus:
         return TextFileTextCorpus(
-            self.shared_file_service.download_file(f"{self.shared_file_service.build_path}/{source_filename}")
-            for source_filename in self._source_filenames
+            self.shared_file_service.download_files(
+                [
+                    f"{self.shared_file_service.build_path}/{source_filename}"
+                    for source_filename in self._source_filenames
+                ]
+            )
         )
 
     def create_target_corpus(self) -> TextCorpus:
         return TextFileTextCorpus(
-            self.shared_file_service.download_file(f"{self.shared_file_service.build_path}/{target_filename}")
-            for target_filename in self._target_filenames
+            self.shared_file_service.download_files(
+                [
+                    f"{self.shared_file_service.build_path}/{target_filename}"
+                    for target_filename in self._target_filenames
+                ]
+            )
         )
 
     def get_word_alignment_inputs(self) -> List[WordAlignmentInput]:
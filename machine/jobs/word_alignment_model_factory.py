@@ -1,4 +1,3 @@
-import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -7,6 +6,7 @@ from ..corpora.parallel_text_corpus import ParallelTextCorpus
 from ..tokenization.tokenizer import Tokenizer
 from ..translation.trainer import Trainer
 from ..translation.word_alignment_model import WordAlignmentModel
+from ..utils.archive_utils import create_tar_gz
 
 
 class WordAlignmentModelFactory(ABC):
@@ -25,10 +25,12 @@ class WordAlignmentModelFactory(ABC):
     ) -> WordAlignmentModel: ...
 
     def save_model(self) -> Path:
-        tar_file_basename = Path(
-            self._config.data_dir, self._config.shared_file_folder, "builds", self._config.build_id, "model"
+        tar_file_path = Path(
+            self._config.data_dir, self._config.shared_file_folder, "builds", self._config.build_id, "model.tar.gz"
         )
-        return Path(shutil.make_archive(str(tar_file_basename), "gztar", self._model_dir))
+        with create_tar_gz(tar_file_path) as tar:
+            tar.add(self._model_dir, arcname=".")
+        return tar_file_path
 
     @property
     def _model_dir(self) -> Path:
@@ -1,10 +1,13 @@
-from typing import Dict, List, Optional, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..corpora.paratext_project_file_handler import ParatextProjectFileHandler
 from ..corpora.paratext_project_settings import ParatextProjectSettings
 from ..corpora.paratext_project_settings_parser_base import ParatextProjectSettingsParserBase
 from ..corpora.usfm_parser import parse_usfm
+from ..corpora.usfm_stylesheet import UsfmStylesheet
 from ..scripture.canon import book_id_to_number, get_scripture_books
+from ..scripture.verse_ref import Versification
 from .quote_convention_analysis import QuoteConventionAnalysis
 from .quote_convention_detector import QuoteConventionDetector
 
@@ -22,11 +25,71 @@ class ParatextProjectQuoteConventionDetector:
             self._settings = settings
 
     def get_quote_convention_analysis(
-        self, include_chapters: Optional[Dict[int, List[int]]] = None
+        self,
+        include_chapters: Optional[Dict[int, List[int]]] = None,
+        max_workers: int = 1,
+        early_stopping_book_count: Optional[int] = None,
+        early_stopping_tolerance: float = 0.01,
     ) -> QuoteConventionAnalysis:
-
+        # when early_stopping_book_count is specified, the analysis stops once the best quote convention and its
+        # margin over the runner-up have been stable (within early_stopping_tolerance) for that many books
         book_quote_convention_analyses: List[QuoteConventionAnalysis] = []
+        stable_book_count = 0
+        prev_analysis: Optional[QuoteConventionAnalysis] = None
+        for quote_convention_analysis in self._analyze_books(include_chapters, max_workers):
+            book_quote_convention_analyses.append(quote_convention_analysis)
+            if early_stopping_book_count is None:
+                continue
+
+            analysis = QuoteConventionAnalysis.combine_with_weighted_average(book_quote_convention_analyses)
+            if (
+                prev_analysis is not None
+                and analysis.best_quote_convention is not None
+                and analysis.best_quote_convention == prev_analysis.best_quote_convention
+                and abs(analysis.best_quote_convention_margin - prev_analysis.best_quote_convention_margin)
+                <= early_stopping_tolerance
+            ):
+                stable_book_count += 1
+                if stable_book_count >= early_stopping_book_count:
+                    return analysis
+            else:
+                stable_book_count = 0
+            prev_analysis = analysis
 
+        return QuoteConventionAnalysis.combine_with_weighted_average(book_quote_convention_analyses)
+
+    def _analyze_books(
+        self, include_chapters: Optional[Dict[int, List[int]]], max_workers: int
+    ) -> Iterator[QuoteConventionAnalysis]:
+        books = self._read_books(include_chapters)
+        if max_workers <= 1:
+            for file_name, usfm in books:
+                yield _analyze_book(
+                    file_name,
+                    usfm,
+                    include_chapters,
+                    self._settings.stylesheet,
+                    self._settings.versification,
+                    self._settings.name,
+                )
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self._settings.stylesheet, self._settings.versification, self._settings.name),
+        )
+        try:
+            futures: List[Future[QuoteConventionAnalysis]] = [
+                executor.submit(_analyze_book_in_worker, file_name, usfm, include_chapters) for file_name, usfm in books
+            ]
+            # the analyses are reduced in canonical book order, regardless of the order in which they finish
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _read_books(self, include_chapters: Optional[Dict[int, List[int]]]) -> Iterable[Tuple[str, str]]:
         for book_id in get_scripture_books():
             if include_chapters is not None and book_id_to_number(book_id) not in include_chapters:
                 continue
@@ -34,21 +97,43 @@ class ParatextProjectQuoteConventionDetector:
             if not self._paratext_project_file_handler.exists(file_name):
                 continue
 
-            handler = QuoteConventionDetector()
-
             with self._paratext_project_file_handler.open(file_name) as sfm_file:
                 usfm: str = sfm_file.read().decode(self._settings.encoding)
-            try:
-                parse_usfm(usfm, handler, self._settings.stylesheet, self._settings.versification)
-            except Exception as e:
-                error_message = (
-                    f"An error occurred while parsing the usfm for '{file_name}'"
-                    f"{f' in project {self._settings.name}' if self._settings.name else ''}"
-                    f". Error: '{e}'"
-                )
-                raise RuntimeError(error_message) from e
+            yield file_name, usfm
 
-            quote_convention_analysis = handler.detect_quote_convention(include_chapters)
-            book_quote_convention_analyses.append(quote_convention_analysis)
 
-        return QuoteConventionAnalysis.combine_with_weighted_average(book_quote_convention_analyses)
+def _analyze_book(
+    file_name: str,
+    usfm: str,
+    include_chapters: Optional[Dict[int, List[int]]],
+    stylesheet: UsfmStylesheet,
+    versification: Versification,
+    project_name: Optional[str],
+) -> QuoteConventionAnalysis:
+    handler = QuoteConventionDetector()
+    try:
+        parse_usfm(usfm, handler, stylesheet, versification)
+    except Exception as e:
+        error_message = (
+            f"An error occurred while parsing the usfm for '{file_name}'"
+            f"{f' in project {project_name}' if project_name else ''}"
+            f". Error: '{e}'"
+        )
+        raise RuntimeError(error_message) from e
+
+    return handler.detect_quote_convention(include_chapters)
+
+
+_worker_settings: Optional[Tuple[UsfmStylesheet, Versification, Optional[str]]] = None
+
+
+def _init_worker(stylesheet: UsfmStylesheet, versification: Versification, project_name: Optional[str]) -> None:
+    global _worker_settings
+    _worker_settings = (stylesheet, versification, project_name)
+
+
+def _analyze_book_in_worker(
+    file_name: str, usfm: str, include_chapters: Optional[Dict[int, List[int]]]
+) -> QuoteConventionAnalysis:
+    assert _worker_settings is not None
+    return _analyze_book(file_name, usfm, include_chapters, *_worker_settings)
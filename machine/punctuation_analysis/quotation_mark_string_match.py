@@ -18,6 +18,9 @@ class QuotationMarkStringMatch:
     _WHITESPACE_PATTERN: Pattern = regex.compile(r"[\s~]", regex.U)
     _PUNCTUATION_PATTERN: Pattern = regex.compile(r"[\.,;\?!\)\]\-—۔،؛]", regex.U)
     _QUOTE_INTRODUCER_PATTERN: Pattern = regex.compile(r"[:,]\s*$", regex.U)
+    # Reverse form of _QUOTE_INTRODUCER_PATTERN; it matches backwards from the end position, so only the end of the
+    # leading substring is scanned
+    _REVERSE_QUOTE_INTRODUCER_PATTERN: Pattern = regex.compile(r"(?r)[:,]\s*", regex.U)
 
     def __init__(self, text_segment: TextSegment, start_index: int, end_index: int):
         self._text_segment = text_segment
@@ -136,11 +139,13 @@ class QuotationMarkStringMatch:
     def has_trailing_punctuation(self) -> bool:
         return self.next_character_matches(self._PUNCTUATION_PATTERN)
 
+    # The checks below search the segment text in place instead of copying the leading or trailing substring for
+    # every quotation mark, which is quadratic in long segments with many quotation marks.
     def has_letter_in_leading_substring(self) -> bool:
-        return self.leading_substring_matches(self._LETTER_PATTERN)
+        return self._LETTER_PATTERN.search(self._text_segment.text, 0, self._start_index) is not None
 
     def has_letter_in_trailing_substring(self) -> bool:
-        return self.trailing_substring_matches(self._LETTER_PATTERN)
+        return self._LETTER_PATTERN.search(self._text_segment.text, self._end_index) is not None
 
     def has_leading_latin_letter(self) -> bool:
         return self.previous_character_matches(self._LATIN_LETTER_PATTERN)
@@ -149,4 +154,4 @@ class QuotationMarkStringMatch:
         return self.next_character_matches(self._LATIN_LETTER_PATTERN)
 
     def has_quote_introducer_in_leading_substring(self) -> bool:
-        return self.leading_substring_matches(self._QUOTE_INTRODUCER_PATTERN)
+        return self._REVERSE_QUOTE_INTRODUCER_PATTERN.match(self._text_segment.text, 0, self._start_index) is not None
@@ -1,5 +1,5 @@
 from collections import Counter, defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .quotation_mark_direction import QuotationMarkDirection
 from .quotation_mark_metadata import QuotationMarkMetadata
@@ -22,6 +22,9 @@ class QuotationMarkCounts:
     def find_best_quotation_mark_proportion(self) -> tuple[str, int, int]:
         return self._quotation_mark_counter.most_common(1)[0] + (self._total_count,)
 
+    def get_count(self, quotation_mark: str) -> int:
+        return self._quotation_mark_counter[quotation_mark]
+
     def calculate_num_differences(self, expected_quotation_mark: str) -> int:
         return self._total_count - self._quotation_mark_counter[expected_quotation_mark]
 
@@ -59,6 +62,12 @@ class QuotationMarkTabulator:
     ) -> tuple[str, int, int]:
         return self._quotation_counts_by_depth_and_direction[(depth, direction)].find_best_quotation_mark_proportion()
 
+    def get_depths_and_directions(self) -> List[Tuple[int, QuotationMarkDirection]]:
+        return sorted(self._quotation_counts_by_depth_and_direction, key=lambda item: item[0])
+
+    def get_quotation_mark_counts(self, depth: int, direction: QuotationMarkDirection) -> QuotationMarkCounts:
+        return self._quotation_counts_by_depth_and_direction[(depth, direction)]
+
     def get_total_quotation_mark_count(self) -> int:
         total_count = 0
         for counts in self._quotation_counts_by_depth_and_direction.values():
@@ -69,7 +78,7 @@ class QuotationMarkTabulator:
         num_marks_by_depth: Dict[int, int] = defaultdict(int)
         num_matching_marks_by_depth: Dict[int, int] = defaultdict(int)
 
-        for depth, direction in sorted(self._quotation_counts_by_depth_and_direction, key=lambda item: item[0]):
+        for depth, direction in self.get_depths_and_directions():
             expected_quotation_mark: str = quote_convention.get_expected_quotation_mark(depth, direction)
 
             num_matching_marks = self._quotation_counts_by_depth_and_direction[(depth, direction)].get_observed_count()
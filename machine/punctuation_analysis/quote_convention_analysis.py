@@ -37,6 +37,14 @@ class QuoteConventionAnalysis:
     def best_quote_convention_score(self) -> float:
         return self._best_quote_convention_score
 
+    @property
+    def best_quote_convention_margin(self) -> float:
+        # the difference between the scores of the best and the second best quote conventions
+        if len(self._convention_scores) < 2:
+            return self._best_quote_convention_score
+        best_score, runner_up_score = sorted(self._convention_scores.values(), reverse=True)[:2]
+        return best_score - runner_up_score
+
     class Builder:
         def __init__(self, tabulated_quotation_marks: QuotationMarkTabulator):
             self._convention_scores: dict[QuoteConvention, float] = {}
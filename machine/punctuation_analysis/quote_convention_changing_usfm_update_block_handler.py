@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..corpora.usfm_token import UsfmToken, UsfmTokenType
 from ..corpora.usfm_update_block import UsfmUpdateBlock
@@ -126,21 +126,43 @@ class QuoteConventionChangingUsfmUpdateBlockHandler(UsfmUpdateBlockHandler):
         return text_segments
 
     def _update_quotation_marks(self, resolved_quotation_mark_matches: List[QuotationMarkMetadata]) -> None:
-        for quotation_mark_index, resolved_quotation_mark_match in enumerate(resolved_quotation_mark_matches):
-            previous_length: int = resolved_quotation_mark_match.length
-            resolved_quotation_mark_match.update_quotation_mark(self._new_quote_convention)
-            updated_length: int = resolved_quotation_mark_match.length
-
-            if previous_length != updated_length:
-                self._shift_quotation_mark_metadata_indices(
-                    resolved_quotation_mark_matches[quotation_mark_index + 1 :], updated_length - previous_length
-                )
-
-    def _shift_quotation_mark_metadata_indices(
-        self, quotation_mark_metadata_list: List[QuotationMarkMetadata], shift_amount: int
+        # The replacements are collected per text segment and applied in a single rebuild of the segment text, so the
+        # indices of the following quotation marks are shifted as they are visited, instead of once per replacement
+        matches_by_text_segment: Dict[int, List[QuotationMarkMetadata]] = {}
+        for resolved_quotation_mark_match in resolved_quotation_mark_matches:
+            matches_by_text_segment.setdefault(id(resolved_quotation_mark_match.text_segment), []).append(
+                resolved_quotation_mark_match
+            )
+        for text_segment_matches in matches_by_text_segment.values():
+            self._update_quotation_marks_in_text_segment(text_segment_matches)
+
+    def _update_quotation_marks_in_text_segment(
+        self, resolved_quotation_mark_matches: List[QuotationMarkMetadata]
     ) -> None:
-        for quotation_mark_metadata in quotation_mark_metadata_list:
-            quotation_mark_metadata.shift_indices(shift_amount)
+        replacements: List[Tuple[int, int, str]] = []
+        shift_amount = 0
+        for resolved_quotation_mark_match in resolved_quotation_mark_matches:
+            updated_quotation_mark = self._new_quote_convention.get_expected_quotation_mark(
+                resolved_quotation_mark_match.depth, resolved_quotation_mark_match.direction
+            )
+            if updated_quotation_mark == resolved_quotation_mark_match.quotation_mark:
+                resolved_quotation_mark_match.shift_indices(shift_amount)
+                continue
+
+            replacements.append(
+                (
+                    resolved_quotation_mark_match.start_index,
+                    resolved_quotation_mark_match.end_index,
+                    updated_quotation_mark,
+                )
+            )
+            resolved_quotation_mark_match.shift_indices(shift_amount)
+            length_change = len(updated_quotation_mark) - len(resolved_quotation_mark_match.quotation_mark)
+            resolved_quotation_mark_match.end_index += length_change
+            shift_amount += length_change
+
+        replacements.sort(key=lambda replacement: replacement[0])
+        resolved_quotation_mark_matches[0].text_segment.replace_substrings(replacements)
 
     def _check_for_chapter_change(self, block: UsfmUpdateBlock) -> None:
         for scripture_ref in block.refs:
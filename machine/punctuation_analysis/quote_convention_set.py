@@ -1,7 +1,8 @@
 from collections import defaultdict
 from re import Pattern
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import regex
 
 from .quotation_mark_direction import QuotationMarkDirection
@@ -15,6 +16,8 @@ class QuoteConventionSet:
         self._conventions = conventions
         self._create_quotation_mark_regexes()
         self._create_quotation_mark_pair_map()
+        self._create_quotation_mark_depth_maps()
+        self._create_expected_quotation_mark_matrix()
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, QuoteConventionSet):
@@ -59,6 +62,36 @@ class QuoteConventionSet:
                 self.closing_marks_by_opening_mark[opening_quotation_mark].add(closing_quotation_mark)
                 self.opening_marks_by_closing_mark[closing_quotation_mark].add(opening_quotation_mark)
 
+    def _create_quotation_mark_depth_maps(self) -> None:
+        self._depths_by_quotation_mark: Dict[Tuple[str, QuotationMarkDirection], Set[int]] = defaultdict(set)
+        self._quotation_marks_by_depth: Dict[Tuple[int, QuotationMarkDirection], Set[str]] = defaultdict(set)
+        for convention in self._conventions:
+            for depth in range(1, convention.num_levels + 1):
+                for direction in QuotationMarkDirection:
+                    quotation_mark = convention.get_expected_quotation_mark(depth, direction)
+                    self._depths_by_quotation_mark[(quotation_mark, direction)].add(depth)
+                    self._quotation_marks_by_depth[(depth, direction)].add(quotation_mark)
+        self._min_num_levels = min((c.num_levels for c in self._conventions), default=0)
+
+    def _create_expected_quotation_mark_matrix(self) -> None:
+        # expected_quotation_mark_ids[convention, depth - 1, direction] is an index into quotation_mark_vocab, where
+        # index 0 is the empty string that a convention expects at depths beyond its levels
+        self._quotation_mark_vocab: List[str] = [""] + sorted(
+            {q for (q, _) in self._depths_by_quotation_mark.keys() if q != ""}
+        )
+        quotation_mark_ids = {quotation_mark: i for i, quotation_mark in enumerate(self._quotation_mark_vocab)}
+        self._directions = list(QuotationMarkDirection)
+        max_num_levels = max((c.num_levels for c in self._conventions), default=0)
+        self._expected_quotation_mark_ids = np.zeros(
+            (len(self._conventions), max_num_levels, len(self._directions)), dtype=np.intp
+        )
+        for i, convention in enumerate(self._conventions):
+            for depth in range(1, convention.num_levels + 1):
+                for j, direction in enumerate(self._directions):
+                    self._expected_quotation_mark_ids[i, depth - 1, j] = quotation_mark_ids[
+                        convention.get_expected_quotation_mark(depth, direction)
+                    ]
+
     @property
     def opening_quotation_mark_regex(self) -> Pattern:
         return self._opening_quotation_mark_regex
@@ -112,18 +145,17 @@ class QuoteConventionSet:
         return paired_quotation_marks
 
     def get_possible_depths(self, quotation_mark: str, direction: QuotationMarkDirection) -> Set[int]:
-        depths: Set[int] = set()
-        for convention in self._conventions:
-            depths.update(convention.get_possible_depths(quotation_mark, direction))
-        return depths
+        depths = self._depths_by_quotation_mark.get((quotation_mark, direction))
+        return set() if depths is None else set(depths)
 
     def metadata_matches_quotation_mark(
         self, quotation_mark: str, depth: int, direction: QuotationMarkDirection
     ) -> bool:
-        for convention in self._conventions:
-            if convention.get_expected_quotation_mark(depth, direction) == quotation_mark:
-                return True
-        return False
+        quotation_marks = self._quotation_marks_by_depth.get((depth, direction))
+        if quotation_marks is not None and quotation_mark in quotation_marks:
+            return True
+        # a convention expects an empty quotation mark at depths beyond its levels
+        return quotation_mark == "" and len(self._conventions) > 0 and (depth < 1 or depth > self._min_num_levels)
 
     def filter_to_compatible_quote_conventions(
         self, opening_quotation_marks: list[str], closing_quotation_marks: list[str]
@@ -143,8 +175,9 @@ class QuoteConventionSet:
     ) -> Tuple[Optional[QuoteConvention], float]:
         best_similarity: float = float("-inf")
         best_quote_convention: Optional[QuoteConvention] = None
-        for quote_convention in self._conventions:
-            similarity = tabulated_quotation_marks.calculate_similarity(quote_convention)
+        for quote_convention, similarity in zip(
+            self._conventions, self._calculate_similarities(tabulated_quotation_marks)
+        ):
             if similarity > best_similarity:
                 best_similarity = similarity
                 best_quote_convention = quote_convention
@@ -153,8 +186,43 @@ class QuoteConventionSet:
 
     def score_all_quote_conventions(self, tabulated_quotation_marks: QuotationMarkTabulator) -> QuoteConventionAnalysis:
         quote_convention_analysis_builder = QuoteConventionAnalysis.Builder(tabulated_quotation_marks)
-        for quote_convention in self._conventions:
-            score = tabulated_quotation_marks.calculate_similarity(quote_convention)
+        for quote_convention, score in zip(self._conventions, self._calculate_similarities(tabulated_quotation_marks)):
             quote_convention_analysis_builder.record_convention_score(quote_convention, score)
 
         return quote_convention_analysis_builder.build()
+
+    def _calculate_similarities(self, tabulated_quotation_marks: QuotationMarkTabulator) -> List[Union[int, float]]:
+        # Computes QuotationMarkTabulator.calculate_similarity for all conventions at once. The arithmetic is done in
+        # the same order, so the scores are identical.
+        num_marks_by_depth: Dict[int, int] = defaultdict(int)
+        num_matching_marks_by_depth: Dict[int, np.ndarray] = {}
+        max_num_levels = self._expected_quotation_mark_ids.shape[1]
+        for depth, direction in tabulated_quotation_marks.get_depths_and_directions():
+            counts = tabulated_quotation_marks.get_quotation_mark_counts(depth, direction)
+            num_marks_by_depth[depth] += counts.get_observed_count()
+            vocab_counts = np.array([counts.get_count(q) for q in self._quotation_mark_vocab], dtype=np.int64)
+            if 1 <= depth <= max_num_levels:
+                expected_ids = self._expected_quotation_mark_ids[:, depth - 1, self._directions.index(direction)]
+            else:
+                expected_ids = np.zeros(len(self._conventions), dtype=np.intp)
+            num_matching_marks = vocab_counts[expected_ids]
+            if depth in num_matching_marks_by_depth:
+                num_matching_marks_by_depth[depth] = num_matching_marks_by_depth[depth] + num_matching_marks
+            else:
+                num_matching_marks_by_depth[depth] = num_matching_marks
+
+        total_marks = sum(num_marks_by_depth.values())
+        if total_marks == 0:
+            return [0] * len(self._conventions)
+
+        # The scores of greater depths depend on the scores of shallower depths
+        scores_by_depth: Dict[int, np.ndarray] = {}
+        for depth in sorted(num_marks_by_depth.keys()):
+            if depth - 1 in scores_by_depth:
+                scores_by_depth[depth] = (
+                    scores_by_depth[depth - 1] / num_marks_by_depth[depth - 1]
+                ) * num_matching_marks_by_depth[depth]
+            else:
+                scores_by_depth[depth] = num_matching_marks_by_depth[depth]
+        # the depth scores are summed with the built-in sum, like the scalar implementation
+        return [sum(scores) / total_marks for scores in zip(*(s.tolist() for s in scores_by_depth.values()))]
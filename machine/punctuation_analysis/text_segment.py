@@ -1,4 +1,4 @@
-from typing import Optional, Set
+from typing import List, Optional, Sequence, Set, Tuple
 
 from ..corpora.usfm_token import UsfmToken
 from .usfm_marker_type import UsfmMarkerType
@@ -60,6 +60,22 @@ class TextSegment:
         if self._usfm_token is not None:
             self._usfm_token.text = str(self._text)
 
+    def replace_substrings(self, replacements: Sequence[Tuple[int, int, str]]) -> None:
+        # The replacements must not overlap and must be ordered by start index. Their indices refer to the current
+        # text, and the text is rebuilt once.
+        if len(replacements) == 0:
+            return
+        parts: List[str] = []
+        prev_end_index = 0
+        for start_index, end_index, replacement in replacements:
+            parts.append(self._text[prev_end_index:start_index])
+            parts.append(replacement)
+            prev_end_index = end_index
+        parts.append(self._text[prev_end_index:])
+        self._text = "".join(parts)
+        if self._usfm_token is not None:
+            self._usfm_token.text = str(self._text)
+
     class Builder:
         def __init__(self):
             self._text_segment = TextSegment()
@@ -1,22 +1,67 @@
-import math
-from collections import defaultdict
-from typing import Iterable, List, Type, cast, overload
+from itertools import islice
+from typing import Generic, Hashable, Iterable, Iterator, List, Sequence, Type, TypeVar, cast, overload
+
+import numpy as np
+import numpy.typing as npt
 
 from ..corpora import MultiKeyRef, ScriptureRef
-from .score import Score
-from .scripture_book_scores import ScriptureBookScores
 from .scripture_book_usability import ScriptureBookUsability
-from .scripture_chapter_scores import ScriptureChapterScores
 from .scripture_chapter_usability import ScriptureChapterUsability
-from .scripture_segment_score import ScriptureSegmentScore
 from .scripture_segment_usability import ScriptureSegmentUsability
-from .text_scores import TextScores
-from .text_segment_score import TextSegmentScore
 from .text_segment_usability import TextSegmentUsability
 from .text_usability import TextUsability
 from .thresholds import Thresholds
 from .usability_parameters import UsabilityParameters
 
+_CHUNK_SIZE = 10_000
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class _GroupStatistics(Generic[KeyT]):
+    """Accumulates the confidences and usabilities of the segments in each group (text, book or chapter), so that the
+    segment-level arrays can be discarded after each chunk."""
+
+    def __init__(self) -> None:
+        self._indices: dict[KeyT, int] = {}
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._log_confidence_sums = np.zeros(0, dtype=np.float64)
+        self._nonpositive_counts = np.zeros(0, dtype=np.int64)
+        self._usability_sums = np.zeros(0, dtype=np.float64)
+
+    @property
+    def keys(self) -> List[KeyT]:
+        return list(self._indices.keys())
+
+    def add(self, keys: Iterable[KeyT], confidences: npt.NDArray[np.float64], usabilities: npt.NDArray[np.float64]):
+        indices = np.fromiter(
+            (self._indices.setdefault(key, len(self._indices)) for key in keys), dtype=np.intp, count=len(confidences)
+        )
+        group_count = len(self._indices)
+        positive = confidences > 0
+        self._counts = _accumulate(self._counts, np.bincount(indices, minlength=group_count))
+        self._nonpositive_counts = _accumulate(
+            self._nonpositive_counts, np.bincount(indices[~positive], minlength=group_count)
+        )
+        self._log_confidence_sums = _accumulate(
+            self._log_confidence_sums,
+            np.bincount(indices, weights=np.log(np.where(positive, confidences, 1.0)), minlength=group_count),
+        )
+        self._usability_sums = _accumulate(
+            self._usability_sums, np.bincount(indices, weights=usabilities, minlength=group_count)
+        )
+
+    def geometric_mean_confidences(self) -> npt.NDArray[np.float64]:
+        return np.where(self._nonpositive_counts > 0, 0.0, np.exp(self._log_confidence_sums / self._counts))
+
+    def average_usabilities(self) -> npt.NDArray[np.float64]:
+        return self._usability_sums / self._counts
+
+
+def _accumulate(totals: np.ndarray, values: np.ndarray) -> np.ndarray:
+    values[: len(totals)] += totals
+    return values
+
 
 class ChrF3QualityEstimator:
     GREEN_THRESHOLD = 0.776
@@ -53,176 +98,148 @@ class ChrF3QualityEstimator:
         tuple[list[ScriptureSegmentUsability], list[ScriptureChapterUsability], list[ScriptureBookUsability]]
         | tuple[list[TextSegmentUsability], list[TextUsability]]
     ):
-        confidences_list = list(confidences)
-        if not confidences_list:
+        # the confidences are consumed in chunks, so that an iterator over a large corpus is never fully materialized
+        chunks = _chunk(confidences)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
             return ([], []) if issubclass(ref_type, MultiKeyRef) else ([], [], [])
 
-        first_key = confidences_list[0][0]
-        if isinstance(first_key, ScriptureRef):
-            segment_scores, chapter_scores, book_scores = self._project_chrf3_scripture(
-                cast(List[tuple[ScriptureRef, float]], confidences_list)
+        if isinstance(first_chunk[0][0], ScriptureRef):
+            return self._estimate_quality_scripture(
+                cast(Iterator[Sequence[tuple[ScriptureRef, float]]], _prepend(first_chunk, chunks))
             )
-            return self._compute_segment_usability_scripture(segment_scores, chapter_scores, book_scores)
-        else:
-            segment_scores, text_scores = self._project_chrf3_text(
-                cast(List[tuple[MultiKeyRef, float]], confidences_list)
-            )
-            return self._compute_segment_usability_text(segment_scores, text_scores)
+        return self._estimate_quality_text(
+            cast(Iterator[Sequence[tuple[MultiKeyRef, float]]], _prepend(first_chunk, chunks))
+        )
 
-    def _calculate_usable_probability(self, chrf3: float) -> float:
-        usable_weight = math.exp(-((chrf3 - self.usable.mean) ** 2) / (2 * self.usable.variance)) * self.usable.count
-        unusable_weight = (
-            math.exp(-((chrf3 - self.unusable.mean) ** 2) / (2 * self.unusable.variance)) * self.unusable.count
+    def _calculate_usable_probabilities(self, chrf3: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        usable_weights = np.exp(-((chrf3 - self.usable.mean) ** 2) / (2 * self.usable.variance)) * self.usable.count
+        unusable_weights = (
+            np.exp(-((chrf3 - self.unusable.mean) ** 2) / (2 * self.unusable.variance)) * self.unusable.count
         )
-        return usable_weight / (usable_weight + unusable_weight)
-
-    def _compute_book_usability(self, book_scores: ScriptureBookScores) -> list[ScriptureBookUsability]:
-        usability_books = []
-        for book in book_scores.scores.keys():
-            score = book_scores.get_score(book)
-            if score is None:
-                continue
-            book_usabilities = book_scores.get_segment_usabilities(book)
-            average_probability = sum(book_usabilities) / len(book_usabilities) if book_usabilities else 0.0
-            usability_books.append(
-                ScriptureBookUsability(
-                    book=book,
-                    label=self.book_thresholds.return_label(average_probability),
-                    usability=average_probability,
-                    projected_chrf3=score.projected_chrf3,
-                    confidence=score.confidence,
-                )
-            )
-        return usability_books
-
-    def _compute_chapter_usability(self, chapter_scores: ScriptureChapterScores) -> list[ScriptureChapterUsability]:
-        usability_chapters = []
-        for book, chapter_dict in chapter_scores.scores.items():
-            for chapter in chapter_dict.keys():
-                score = chapter_scores.get_score(book, chapter)
-                if score is None:
-                    continue
-                chapter_usabilities = chapter_scores.get_segment_usabilities(book, chapter)
-                average_probability = (
-                    sum(chapter_usabilities) / len(chapter_usabilities) if chapter_usabilities else 0.0
-                )
-                usability_chapters.append(
-                    ScriptureChapterUsability(
-                        book=book,
-                        chapter=chapter,
-                        label=self.chapter_thresholds.return_label(average_probability),
-                        usability=average_probability,
-                        projected_chrf3=score.projected_chrf3,
-                        confidence=score.confidence,
-                    )
-                )
-        return usability_chapters
+        return usable_weights / (usable_weights + unusable_weights)
 
-    def _compute_segment_usability_scripture(
-        self,
-        segment_scores: list[ScriptureSegmentScore],
-        chapter_scores: ScriptureChapterScores,
-        book_scores: ScriptureBookScores,
+    def _project_chrf3(self, confidences: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return self._slope * confidences + self._intercept
+
+    def _score_chunk(
+        self, chunk: Sequence[tuple[ScriptureRef, float] | tuple[MultiKeyRef, float]]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        confidences = np.fromiter((confidence for _, confidence in chunk), dtype=np.float64, count=len(chunk))
+        projected_chrf3s = self._project_chrf3(confidences)
+        return confidences, projected_chrf3s, self._calculate_usable_probabilities(projected_chrf3s)
+
+    def _estimate_quality_scripture(
+        self, chunks: Iterator[Sequence[tuple[ScriptureRef, float]]]
     ) -> tuple[list[ScriptureSegmentUsability], list[ScriptureChapterUsability], list[ScriptureBookUsability]]:
-        usability_segments = []
-        for segment_score in segment_scores:
-            probability = self._calculate_usable_probability(segment_score.projected_chrf3)
-            chapter_scores.append_segment_usability(
-                segment_score.scripture_ref.book, segment_score.scripture_ref.chapter_num, probability
-            )
-            book_scores.append_segment_usability(segment_score.scripture_ref.book, probability)
-            usability_segments.append(
+        usability_segments: list[ScriptureSegmentUsability] = []
+        book_statistics: _GroupStatistics[str] = _GroupStatistics()
+        chapter_statistics: _GroupStatistics[tuple[str, int]] = _GroupStatistics()
+        for chunk in chunks:
+            confidences, projected_chrf3s, probabilities = self._score_chunk(chunk)
+            book_statistics.add((ref.book for ref, _ in chunk), confidences, probabilities)
+            chapter_statistics.add(((ref.book, ref.chapter_num) for ref, _ in chunk), confidences, probabilities)
+            usability_segments.extend(
                 ScriptureSegmentUsability(
-                    scripture_ref=segment_score.scripture_ref,
+                    scripture_ref=scripture_ref,
                     label=self.segment_thresholds.return_label(probability),
                     usability=probability,
-                    projected_chrf3=segment_score.projected_chrf3,
-                    confidence=segment_score.confidence,
+                    projected_chrf3=projected_chrf3,
+                    confidence=confidence,
+                )
+                for (scripture_ref, _), confidence, projected_chrf3, probability in zip(
+                    chunk, confidences.tolist(), projected_chrf3s.tolist(), probabilities.tolist()
                 )
             )
-        return (
-            usability_segments,
-            self._compute_chapter_usability(chapter_scores),
-            self._compute_book_usability(book_scores),
-        )
 
-    def _compute_segment_usability_text(
-        self, segment_scores: list[TextSegmentScore], text_scores: TextScores
+        book_indices = {book: i for i, book in enumerate(book_statistics.keys)}
+        chapters = sorted(enumerate(chapter_statistics.keys), key=lambda c: book_indices[c[1][0]])
+        chapter_confidences = chapter_statistics.geometric_mean_confidences()
+        chapter_projected_chrf3s = self._project_chrf3(chapter_confidences)
+        chapter_probabilities = chapter_statistics.average_usabilities()
+        usability_chapters = [
+            ScriptureChapterUsability(
+                book=book,
+                chapter=chapter,
+                label=self.chapter_thresholds.return_label(float(chapter_probabilities[i])),
+                usability=float(chapter_probabilities[i]),
+                projected_chrf3=float(chapter_projected_chrf3s[i]),
+                confidence=float(chapter_confidences[i]),
+            )
+            for i, (book, chapter) in chapters
+        ]
+
+        book_confidences = book_statistics.geometric_mean_confidences()
+        book_projected_chrf3s = self._project_chrf3(book_confidences)
+        book_probabilities = book_statistics.average_usabilities()
+        usability_books = [
+            ScriptureBookUsability(
+                book=book,
+                label=self.book_thresholds.return_label(probability),
+                usability=probability,
+                projected_chrf3=projected_chrf3,
+                confidence=confidence,
+            )
+            for book, confidence, projected_chrf3, probability in zip(
+                book_statistics.keys,
+                book_confidences.tolist(),
+                book_projected_chrf3s.tolist(),
+                book_probabilities.tolist(),
+            )
+        ]
+        return usability_segments, usability_chapters, usability_books
+
+    def _estimate_quality_text(
+        self, chunks: Iterator[Sequence[tuple[MultiKeyRef, float]]]
     ) -> tuple[list[TextSegmentUsability], list[TextUsability]]:
-        usability_segments = []
-        for segment_score in segment_scores:
-            probability = self._calculate_usable_probability(segment_score.projected_chrf3)
-            text_scores.append_segment_usability(segment_score.text_id, probability)
-            usability_segments.append(
+        usability_segments: list[TextSegmentUsability] = []
+        text_statistics: _GroupStatistics[str] = _GroupStatistics()
+        for chunk in chunks:
+            confidences, projected_chrf3s, probabilities = self._score_chunk(chunk)
+            text_statistics.add((ref.text_id for ref, _ in chunk), confidences, probabilities)
+            usability_segments.extend(
                 TextSegmentUsability(
-                    segment_ref=segment_score.segment_ref,
+                    segment_ref=segment_ref,
                     label=self.segment_thresholds.return_label(probability),
                     usability=probability,
-                    projected_chrf3=segment_score.projected_chrf3,
-                    confidence=segment_score.confidence,
+                    projected_chrf3=projected_chrf3,
+                    confidence=confidence,
                 )
-            )
-        return usability_segments, self._compute_text_usability(text_scores)
-
-    def _compute_text_usability(self, text_scores: TextScores) -> list[TextUsability]:
-        usability_texts = []
-        for text_id in text_scores.scores.keys():
-            score = text_scores.get_score(text_id)
-            if score is None:
-                continue
-            text_usabilities = text_scores.get_segment_usabilities(text_id)
-            average_probability = sum(text_usabilities) / len(text_usabilities) if text_usabilities else 0.0
-            usability_texts.append(
-                TextUsability(
-                    text_id=text_id,
-                    label=self.book_thresholds.return_label(average_probability),
-                    usability=average_probability,
-                    projected_chrf3=score.projected_chrf3,
-                    confidence=score.confidence,
+                for (segment_ref, _), confidence, projected_chrf3, probability in zip(
+                    chunk, confidences.tolist(), projected_chrf3s.tolist(), probabilities.tolist()
                 )
             )
-        return usability_texts
-
-    @staticmethod
-    def _gmean(values: List[float]) -> float:
-        if not values or any(x <= 0 for x in values):
-            return 0.0
-        return math.exp(sum(math.log(x) for x in values) / len(values))
-
-    def _project_chrf3_text(
-        self, confidences: List[tuple[MultiKeyRef, float]]
-    ) -> tuple[list[TextSegmentScore], TextScores]:
-        confidences_by_text_id = defaultdict(list)
-        segment_scores = []
-        for segment_ref, confidence in confidences:
-            score = TextSegmentScore(self._slope, confidence, self._intercept, segment_ref)
-            segment_scores.append(score)
-            confidences_by_text_id[segment_ref.text_id].append(confidence)
-
-        text_scores = TextScores()
-        for text_id, values in confidences_by_text_id.items():
-            text_scores.add_score(text_id, Score(self._slope, self._gmean(values), self._intercept))
-        return segment_scores, text_scores
-
-    def _project_chrf3_scripture(
-        self, confidences: List[tuple[ScriptureRef, float]]
-    ) -> tuple[list[ScriptureSegmentScore], ScriptureChapterScores, ScriptureBookScores]:
-        confidences_by_book = defaultdict(list)
-        confidences_by_book_and_chapter = defaultdict(list)
-        segment_scores = []
-        for scripture_ref, confidence in confidences:
-            score = ScriptureSegmentScore(self._slope, confidence, self._intercept, scripture_ref)
-            segment_scores.append(score)
-            book = scripture_ref.book
-            chapter = scripture_ref.chapter_num
-            confidences_by_book_and_chapter[(book, chapter)].append(confidence)
-            confidences_by_book[book].append(confidence)
-
-        chapter_scores = ScriptureChapterScores()
-        for (book, chapter), values in confidences_by_book_and_chapter.items():
-            chapter_scores.add_score(book, chapter, Score(self._slope, self._gmean(values), self._intercept))
-
-        book_scores = ScriptureBookScores()
-        for book, values in confidences_by_book.items():
-            book_scores.add_score(book, Score(self._slope, self._gmean(values), self._intercept))
-        return segment_scores, chapter_scores, book_scores
+
+        text_confidences = text_statistics.geometric_mean_confidences()
+        text_projected_chrf3s = self._project_chrf3(text_confidences)
+        text_probabilities = text_statistics.average_usabilities()
+        usability_texts = [
+            TextUsability(
+                text_id=text_id,
+                label=self.book_thresholds.return_label(probability),
+                usability=probability,
+                projected_chrf3=projected_chrf3,
+                confidence=confidence,
+            )
+            for text_id, confidence, projected_chrf3, probability in zip(
+                text_statistics.keys,
+                text_confidences.tolist(),
+                text_projected_chrf3s.tolist(),
+                text_probabilities.tolist(),
+            )
+        ]
+        return usability_segments, usability_texts
+
+
+T = TypeVar("T")
+
+
+def _chunk(items: Iterable[T]) -> Iterator[List[T]]:
+    it = iter(items)
+    while chunk := list(islice(it, _CHUNK_SIZE)):
+        yield chunk
+
+
+def _prepend(first: T, rest: Iterator[T]) -> Iterator[T]:
+    yield first
+    yield from rest
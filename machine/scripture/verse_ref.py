@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
-from io import TextIOWrapper
+from io import StringIO
 from pathlib import Path, PurePath
-from typing import BinaryIO, Dict, Generator, Iterable, List, Optional, Set, TextIO, Tuple, Union, cast
+from threading import Lock
+from typing import IO, Dict, Generator, Iterable, List, Optional, Set, TextIO, Tuple, Union, cast
 
 import regex as re
 
 from ..utils.comparable import Comparable
-from ..utils.file_utils import detect_encoding, detect_encoding_from_stream
+from ..utils.file_utils import detect_encoding_from_bytes
 from ..utils.string_utils import is_integer, parse_integer
 from ..utils.typeshed import StrPath
 from .canon import LAST_BOOK, book_id_to_number, book_number_to_id, is_canonical
@@ -645,6 +648,13 @@ class Versification:
     }
     _BUILTIN_VERSIFICATION_TYPES_TO_NAMES = {value: key for key, value in _BUILTIN_VERSIFICATION_NAMES_TO_TYPES.items()}
     _NON_CANONICAL_LAST_CHAPTER_OR_VERSE = 998
+    # Loaded versifications are cached by content, since the same project is often opened many times. The base
+    # versification is kept in each entry, so that its id is not reused while the entry exists.
+    _LOADED_VERSIFICATIONS: OrderedDict[
+        Tuple[int, str, Optional[str], Optional[str]], Tuple[Optional[Versification], Versification]
+    ] = OrderedDict()
+    _LOADED_VERSIFICATIONS_LOCK = Lock()
+    _MAX_LOADED_VERSIFICATIONS = 64
 
     @classmethod
     def create(cls, name: str) -> Versification:
@@ -686,44 +696,56 @@ class Versification:
     @classmethod
     def load(
         cls,
-        file: Union[StrPath, BinaryIO],
+        file: Union[StrPath, IO[bytes]],
         base_versification: Optional[Versification] = None,
         fallback_name: Optional[str] = None,
+        filename: Optional[StrPath] = None,
     ) -> Versification:
-        try:
-            return cls._load(file, base_versification, fallback_name, "utf-8-sig")
-        except UnicodeError:
-            if isinstance(file, PurePath) or isinstance(file, str):
-                encoding = detect_encoding(file)
-            else:
-                file.seek(0)
-                encoding = detect_encoding_from_stream(file)
-                file.seek(0)
-            return cls._load(file, base_versification, fallback_name, encoding)
+        if isinstance(file, PurePath) or isinstance(file, str):
+            if filename is None:
+                filename = file
+            with open(file, "rb") as stream:
+                data = stream.read()
+        else:
+            data = file.read()
+
+        key = (
+            id(base_versification),
+            hashlib.sha256(data).hexdigest(),
+            fallback_name,
+            None if filename is None else str(filename),
+        )
+        with cls._LOADED_VERSIFICATIONS_LOCK:
+            entry = cls._LOADED_VERSIFICATIONS.get(key)
+            if entry is not None and entry[0] is base_versification:
+                cls._LOADED_VERSIFICATIONS.move_to_end(key)
+                return entry[1]
+
+        versification = cls._load(data, filename, base_versification, fallback_name)
+        with cls._LOADED_VERSIFICATIONS_LOCK:
+            cls._LOADED_VERSIFICATIONS[key] = (base_versification, versification)
+            if len(cls._LOADED_VERSIFICATIONS) > cls._MAX_LOADED_VERSIFICATIONS:
+                cls._LOADED_VERSIFICATIONS.popitem(last=False)
+        return versification
 
     @classmethod
     def _load(
         cls,
-        file: Union[StrPath, BinaryIO],
+        data: bytes,
+        filename: Optional[StrPath],
         base_versification: Optional[Versification],
         fallback_name: Optional[str],
-        encoding: str,
     ) -> Versification:
-        if isinstance(file, PurePath) or isinstance(file, str):
-            with open(file, "r", encoding=encoding) as file_stream:
-                versification = (
-                    None
-                    if base_versification is None or fallback_name is None
-                    else Versification(fallback_name, file, base_versification)
-                )
-                return cls.parse(file_stream, file, versification, fallback_name)
-        file_stream = TextIOWrapper(file, encoding=encoding)
+        try:
+            text = data.decode("utf-8-sig")
+        except UnicodeError:
+            text = data.decode(detect_encoding_from_bytes(data))
         versification = (
             None
             if base_versification is None or fallback_name is None
-            else Versification(fallback_name, None, base_versification)
+            else Versification(fallback_name, filename, base_versification)
         )
-        return cls.parse(file_stream, None, versification, fallback_name)
+        return cls.parse(StringIO(text, newline=None), filename, versification, fallback_name)
 
     @classmethod
     def parse(
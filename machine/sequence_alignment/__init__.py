@@ -1,7 +1,7 @@
 from .alignment import Alignment
 from .alignment_cell import AlignmentCell
 from .pairwise_alignment_algorithm import MIN_SCORE, AlignmentMode, PairwiseAlignmentAlgorithm
-from .pairwise_alignment_scorer import PairwiseAlignmentScorer
+from .pairwise_alignment_scorer import PairwiseAlignmentScoreMatrices, PairwiseAlignmentScorer
 
 __all__ = [
     "Alignment",
@@ -9,5 +9,6 @@ __all__ = [
     "AlignmentMode",
     "MIN_SCORE",
     "PairwiseAlignmentAlgorithm",
+    "PairwiseAlignmentScoreMatrices",
     "PairwiseAlignmentScorer",
 ]
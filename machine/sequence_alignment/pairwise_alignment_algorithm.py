@@ -1,16 +1,23 @@
 import sys
+from collections import defaultdict
 from enum import Enum, auto
-from typing import Callable, Generic, Iterable, List, Tuple, TypeVar
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
 
 from .alignment import Alignment
 from .alignment_cell import AlignmentCell
-from .pairwise_alignment_scorer import PairwiseAlignmentScorer
+from .pairwise_alignment_scorer import PairwiseAlignmentScoreMatrices, PairwiseAlignmentScorer
 
 Seq = TypeVar("Seq")
 Item = TypeVar("Item")
 
 MIN_SCORE = -sys.maxsize - 1
 
+# the maximum number of alignment matrix cells that are computed together in a batch
+_MAX_BATCH_CELL_COUNT = 1 << 20
+
 
 class AlignmentMode(Enum):
     GLOBAL = auto()
@@ -50,6 +57,59 @@ class PairwiseAlignmentAlgorithm(Generic[Seq, Item]):
         return self._best_raw_score
 
     def compute(self) -> None:
+        PairwiseAlignmentAlgorithm.compute_batch([self])
+
+    @staticmethod
+    def compute_batch(algorithms: Iterable["PairwiseAlignmentAlgorithm[Seq, Item]"]) -> None:
+        # Sequence pairs whose scorer provides score matrices are padded to the same size and computed together one
+        # anti-diagonal at a time, since every cell on an anti-diagonal only depends on the previous anti-diagonals.
+        # The other pairs are computed with the score callbacks.
+        groups: Dict[
+            Tuple[AlignmentMode, bool, bool],
+            List[Tuple[PairwiseAlignmentAlgorithm[Seq, Item], PairwiseAlignmentScoreMatrices]],
+        ] = defaultdict(list)
+        for algorithm in algorithms:
+            score_matrices = algorithm._get_score_matrices()
+            if score_matrices is None:
+                algorithm._compute_with_callbacks()
+            else:
+                key = (algorithm.mode, algorithm.expansion_compression_enabled, algorithm.transposition_enabled)
+                groups[key].append((algorithm, score_matrices))
+
+        for group in groups.values():
+            group.sort(key=lambda item: (item[0]._count1, item[0]._count2))
+            batch: List[Tuple[PairwiseAlignmentAlgorithm[Seq, Item], PairwiseAlignmentScoreMatrices]] = []
+            for algorithm, score_matrices in group:
+                cell_count = (
+                    (len(batch) + 1)
+                    * (algorithm._count1 + 1)
+                    * (max([algorithm._count2] + [a._count2 for a, _ in batch]) + 1)
+                )
+                if len(batch) > 0 and cell_count > _MAX_BATCH_CELL_COUNT:
+                    _compute_wavefront(batch)
+                    batch = []
+                batch.append((algorithm, score_matrices))
+            if len(batch) > 0:
+                _compute_wavefront(batch)
+
+    def _get_score_matrices(self) -> Optional[PairwiseAlignmentScoreMatrices]:
+        score_matrices = self._scorer.get_score_matrices(
+            self._sequence1,
+            self._items1[self._start_index1 : self._start_index1 + self._count1],
+            self._sequence2,
+            self._items2[self._start_index2 : self._start_index2 + self._count2],
+        )
+        if score_matrices is None:
+            return None
+        if self.expansion_compression_enabled and (
+            score_matrices.expansion is None or score_matrices.compression is None
+        ):
+            return None
+        if self.transposition_enabled and score_matrices.transposition is None:
+            return None
+        return score_matrices
+
+    def _compute_with_callbacks(self) -> None:
         max_score = MIN_SCORE
 
         if self.mode == AlignmentMode.GLOBAL or self.mode == AlignmentMode.HALF_LOCAL:
@@ -293,3 +353,70 @@ class PairwiseAlignmentAlgorithm(Generic[Seq, Item]):
         self, i: int, j: int, score: int
     ) -> Tuple[List[AlignmentCell[Item]], List[AlignmentCell[Item]], int, int, int]:
         return [], [], self._start_index1 + i, self._start_index2 + j, score
+
+
+def _compute_wavefront(
+    batch: Sequence[Tuple[PairwiseAlignmentAlgorithm, PairwiseAlignmentScoreMatrices]],
+) -> None:
+    first_algorithm = batch[0][0]
+    mode = first_algorithm.mode
+    count1 = max(algorithm._count1 for algorithm, _ in batch)
+    count2 = max(algorithm._count2 for algorithm, _ in batch)
+
+    def stack(matrices: Iterable[Optional[npt.NDArray[np.int64]]]) -> npt.NDArray[np.int64]:
+        stacked = np.zeros((len(batch), count1 + 1, count2 + 1), dtype=np.int64)
+        for b, matrix in enumerate(matrices):
+            assert matrix is not None
+            stacked[b, : matrix.shape[0], : matrix.shape[1]] = matrix
+        return stacked
+
+    insertion = stack(m.insertion for _, m in batch)
+    deletion = stack(m.deletion for _, m in batch)
+    substitution = stack(m.substitution for _, m in batch)
+    expansion = compression = transposition = None
+    if first_algorithm.expansion_compression_enabled:
+        expansion = stack(m.expansion for _, m in batch)
+        compression = stack(m.compression for _, m in batch)
+    if first_algorithm.transposition_enabled:
+        transposition = stack(m.transposition for _, m in batch)
+    gap_penalties = np.array([algorithm._gap_penalty for algorithm, _ in batch], dtype=np.int64)[:, None]
+
+    sim = np.zeros((len(batch), count1 + 1, count2 + 1), dtype=np.int64)
+    if mode == AlignmentMode.GLOBAL or mode == AlignmentMode.HALF_LOCAL:
+        sim[:, 1:, 0] = np.cumsum(gap_penalties + deletion[:, 1:, 0], axis=1)
+        sim[:, 0, 1:] = np.cumsum(gap_penalties + insertion[:, 0, 1:], axis=1)
+
+    # cells in the padding are computed as well, but they are never used by the cells of the shorter sequences
+    for d in range(2, count1 + count2 + 1):
+        i = np.arange(max(1, d - count2), min(count1, d - 1) + 1)
+        j = d - i
+        scores = np.maximum(
+            np.maximum(
+                sim[:, i - 1, j] + gap_penalties + deletion[:, i, j],
+                sim[:, i, j - 1] + gap_penalties + insertion[:, i, j],
+            ),
+            sim[:, i - 1, j - 1] + substitution[:, i, j],
+        )
+        if expansion is not None and compression is not None:
+            scores = np.maximum(scores, np.where(j >= 2, sim[:, i - 1, j - 2] + expansion[:, i, j], MIN_SCORE))
+            scores = np.maximum(scores, np.where(i >= 2, sim[:, i - 2, j - 1] + compression[:, i, j], MIN_SCORE))
+        if transposition is not None:
+            scores = np.maximum(
+                scores, np.where((i >= 2) & (j >= 2), sim[:, i - 2, j - 2] + transposition[:, i, j], MIN_SCORE)
+            )
+        if mode == AlignmentMode.LOCAL:
+            scores = np.maximum(scores, 0)
+        sim[:, i, j] = scores
+
+    for b, (algorithm, _) in enumerate(batch):
+        algorithm_sim = sim[b, : algorithm._count1 + 1, : algorithm._count2 + 1]
+        algorithm._sim = algorithm_sim.tolist()
+        max_score = MIN_SCORE
+        if algorithm._count1 > 0 and algorithm._count2 > 0:
+            if mode == AlignmentMode.SEMI_GLOBAL:
+                max_score = int(max(algorithm_sim[-1, 1:].max(), algorithm_sim[1:, -1].max()))
+            else:
+                max_score = int(algorithm_sim[1:, 1:].max())
+        algorithm._best_raw_score = (
+            algorithm._sim[-1][-1] if mode == AlignmentMode.GLOBAL or max_score == MIN_SCORE else max_score
+        )
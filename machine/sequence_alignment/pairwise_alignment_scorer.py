@@ -1,10 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from dataclasses import dataclass
+from typing import Generic, Optional, Sequence, TypeVar
+
+import numpy as np
+import numpy.typing as npt
 
 Seq = TypeVar("Seq")
 Item = TypeVar("Item")
 
 
+@dataclass(frozen=True)
+class PairwiseAlignmentScoreMatrices:
+    """The operation scores for every cell of the alignment matrix of two sequences.
+
+    Each matrix has the shape ``(count1 + 1, count2 + 1)`` and is indexed like the alignment matrix, so ``[i, j]`` is
+    the score of the operation that ends at item ``i`` of the first sequence and item ``j`` of the second sequence
+    (1-based). For the insertion scores, row 0 contains the scores without a first sequence item, and for the deletion
+    scores, column 0 contains the scores without a second sequence item. Entries that do not correspond to an operation
+    are ignored. The expansion, compression and transposition scores only need to be specified if the corresponding
+    operations are enabled.
+    """
+
+    insertion: npt.NDArray[np.int64]
+    deletion: npt.NDArray[np.int64]
+    substitution: npt.NDArray[np.int64]
+    expansion: Optional[npt.NDArray[np.int64]] = None
+    compression: Optional[npt.NDArray[np.int64]] = None
+    transposition: Optional[npt.NDArray[np.int64]] = None
+
+
 class PairwiseAlignmentScorer(ABC, Generic[Seq, Item]):
     @abstractmethod
     def get_gap_penalty(self, sequence1: Seq, sequence2: Seq) -> int: ...
@@ -40,3 +64,10 @@ class PairwiseAlignmentScorer(ABC, Generic[Seq, Item]):
 
     @abstractmethod
     def get_max_score2(self, sequence1: Seq, sequence2: Seq, q: Item) -> int: ...
+
+    def get_score_matrices(
+        self, sequence1: Seq, items1: Sequence[Item], sequence2: Seq, items2: Sequence[Item]
+    ) -> Optional[PairwiseAlignmentScoreMatrices]:
+        # scorers that can compute all of the operation scores up front should override this, so that the alignment
+        # matrix can be computed with array operations instead of a score callback per cell
+        return None
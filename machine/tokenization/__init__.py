@@ -1,3 +1,5 @@
+from .batch_detokenizer import BatchDetokenizer
+from .batch_tokenizer import BatchTokenizer
 from .detokenizer import Detokenizer
 from .latin_sentence_tokenizer import LatinSentenceTokenizer
 from .latin_word_detokenizer import LatinWordDetokenizer
@@ -16,6 +18,8 @@ from .zwsp_word_detokenizer import ZwspWordDetokenizer
 from .zwsp_word_tokenizer import ZwspWordTokenizer
 
 __all__ = [
+    "BatchDetokenizer",
+    "BatchTokenizer",
     "Detokenizer",
     "get_ranges",
     "LatinSentenceTokenizer",
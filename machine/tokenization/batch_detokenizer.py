@@ -0,0 +1,12 @@
+from abc import abstractmethod
+from typing import Iterable, Sequence, TypeVar
+
+from .detokenizer import Detokenizer
+
+Data = TypeVar("Data")
+Token = TypeVar("Token")
+
+
+class BatchDetokenizer(Detokenizer[Data, Token]):
+    @abstractmethod
+    def detokenize_batch(self, tokens: Iterable[Iterable[Token]]) -> Sequence[Data]: ...
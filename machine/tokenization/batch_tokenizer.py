@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from typing import Sequence, TypeVar
+
+from .tokenizer import Tokenizer
+
+Data = TypeVar("Data")
+Offset = TypeVar("Offset")
+Token = TypeVar("Token")
+
+
+class BatchTokenizer(Tokenizer[Data, Offset, Token]):
+    @abstractmethod
+    def tokenize_batch(self, data: Sequence[Data]) -> Sequence[Sequence[Token]]: ...
@@ -1,4 +1,4 @@
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Tuple
 
 from ..annotations.range import Range
 from ..utils.string_utils import is_delayed_sentence_end, is_sentence_terminal
@@ -9,21 +9,20 @@ LINE_TOKENIZER = LineSegmentTokenizer()
 
 
 class LatinSentenceTokenizer(LatinWordTokenizer):
-    def tokenize_as_ranges(self, data: str, data_range: Optional[Range[int]]) -> Iterable[Range[int]]:
-        for line_range in LINE_TOKENIZER.tokenize_as_ranges(data, data_range):
-            for sentence_range in self._tokenize_line(data, line_range):
-                yield sentence_range
+    def _tokenize_as_offsets(self, data: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        for line_range in LINE_TOKENIZER.tokenize_as_ranges(data, Range.create(start, end)):
+            yield from self._tokenize_line(data, line_range)
 
-    def _tokenize_line(self, data: str, line_range: Range[int]) -> Iterable[Range[int]]:
+    def _tokenize_line(self, data: str, line_range: Range[int]) -> Iterable[Tuple[int, int]]:
         sentence_start = -1
         sentence_end = -1
         in_end = False
         has_end_quote_brackets = False
 
-        for word_range in super().tokenize_as_ranges(data, line_range):
+        for word_start, word_end in super()._tokenize_as_offsets(data, line_range.start, line_range.end):
             if sentence_start == -1:
-                sentence_start = word_range.start
-            word = data[word_range.start : word_range.end]
+                sentence_start = word_start
+            word = data[word_start:word_end]
             if not in_end:
                 if is_sentence_terminal(word):
                     in_end = True
@@ -34,11 +33,11 @@ class LatinSentenceTokenizer(LatinWordTokenizer):
                     in_end = False
                     has_end_quote_brackets = False
                 else:
-                    yield Range.create(sentence_start, sentence_end)
-                    sentence_start = word_range.start
+                    yield sentence_start, sentence_end
+                    sentence_start = word_start
                     in_end = False
                     has_end_quote_brackets = False
-            sentence_end = word_range.end
+            sentence_end = word_end
 
         if sentence_start != -1 and sentence_end != -1:
-            yield Range.create(sentence_start, sentence_end if in_end else line_range.end)
+            yield sentence_start, sentence_end if in_end else line_range.end
@@ -1,6 +1,6 @@
 from collections import deque
 from enum import Enum, auto
-from typing import Any
+from typing import Any, Dict, Optional
 
 from ..utils.string_utils import is_currency_symbol, is_punctuation
 from .string_detokenizer import DetokenizeOperation, StringDetokenizer
@@ -31,25 +31,41 @@ QUOTATION_MARKS = {
 }
 
 
+# The operation for a token only depends on its first character, except for quotation marks, which depend on the
+# quotation marks that are still open. None is cached for quotation marks.
+_OPERATION_CACHE: Dict[str, Optional[DetokenizeOperation]] = {}
+
+
+def _get_character_operation(c: str) -> Optional[DetokenizeOperation]:
+    if is_currency_symbol(c) or c in {"(", "[", "{", "¿", "¡", "<"}:
+        return DetokenizeOperation.MERGE_RIGHT
+    elif c in QUOTATION_MARKS:
+        return None
+    elif c in {"/", "\\"}:
+        return DetokenizeOperation.MERGE_BOTH
+    elif is_punctuation(c) or c == ">":
+        return DetokenizeOperation.MERGE_LEFT
+
+    return DetokenizeOperation.NO_OPERATION
+
+
 class LatinWordDetokenizer(StringDetokenizer):
     def _create_context(self) -> Any:
         return deque()
 
     def _get_operation(self, ctxt: Any, token: str) -> DetokenizeOperation:
-        quotes: deque[str] = ctxt
         c = token[0]
-        if is_currency_symbol(c) or c in {"(", "[", "{", "¿", "¡", "<"}:
+        try:
+            op = _OPERATION_CACHE[c]
+        except KeyError:
+            op = _OPERATION_CACHE[c] = _get_character_operation(c)
+        if op is not None:
+            return op
+
+        quotes: deque[str] = ctxt
+        if len(quotes) == 0 or QUOTATION_MARKS[c] != QUOTATION_MARKS[quotes[-1]]:
+            quotes.append(c)
             return DetokenizeOperation.MERGE_RIGHT
-        elif c in QUOTATION_MARKS:
-            if len(quotes) == 0 or QUOTATION_MARKS[c] != QUOTATION_MARKS[quotes[-1]]:
-                quotes.append(c)
-                return DetokenizeOperation.MERGE_RIGHT
-            else:
-                quotes.pop()
-                return DetokenizeOperation.MERGE_LEFT
-        elif c in {"/", "\\"}:
-            return DetokenizeOperation.MERGE_BOTH
-        elif is_punctuation(c) or c == ">":
+        else:
+            quotes.pop()
             return DetokenizeOperation.MERGE_LEFT
-
-        return DetokenizeOperation.NO_OPERATION
@@ -1,65 +1,140 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional, Tuple, cast
+from typing import Generator, Iterable, Iterator, Optional, Tuple, cast
 
 import regex as re
 
 from ..annotations.range import Range
 from ..utils.string_utils import is_control, is_punctuation, is_symbol
-from .whitespace_tokenizer import WhitespaceTokenizer
+from .whitespace_tokenizer import NON_WHITESPACE_REGEX, WhitespaceTokenizer
 
 INNER_WORD_PUNCT_REGEX = re.compile(
     r"[&\-.:=,?@\xAD\xB7\u2010\u2011\u2019\u2027]|['_]+",
 )
 URL_REGEX = re.compile(r"(?:[\w-]+://?|www[.])[^\s()<>]+(?:[\w\d]+|(?:[^\p{P}\s]|/))", re.IGNORECASE)
 
+# every URL contains one of these, so spans only need to be checked for URLs if the data contains one
+URL_HINT_REGEX = re.compile(r":/|www[.]", re.IGNORECASE)
+
+# The token regexes cover the states of the character-by-character tokenizer that do not need any lookahead: runs of
+# identical punctuation characters and words with inner-word punctuation that is followed by a word character. A word
+# that ends in inner-word punctuation is only handled if the punctuation is followed by whitespace.
+_WHITESPACE = r"\s\x1C-\x1F\u200B\uFEFF"
+_PUNCT = rf"(?![{_WHITESPACE}])[\p{{P}}\p{{S}}\p{{Cc}}]"
+_WORD_CHAR = rf"[^\p{{P}}\p{{S}}\p{{Cc}}{_WHITESPACE}]"
+_INNER_WORD_PUNCT = rf"(?>{INNER_WORD_PUNCT_REGEX.pattern})"
+_WORD_REST = rf"{_WORD_CHAR}*+(?:{_INNER_WORD_PUNCT}{_WORD_CHAR}++)*+({_INNER_WORD_PUNCT})?"
+# group 1 is the punctuation character of a punctuation run and group 2 is the trailing inner-word punctuation of a word
+TOKEN_REGEX = re.compile(rf"({_PUNCT})\1*+|{_WORD_CHAR}{_WORD_REST}")
+APOSTROPHE_WORD_TOKEN_REGEX = re.compile(rf"(?!')({_PUNCT})\1*+|(?:'++|{_WORD_CHAR}){_WORD_REST}")
+
 
 class LatinWordTokenizer(WhitespaceTokenizer):
     def __init__(self, abbreviations: Iterable[str] = [], treat_apostrophe_as_single_quote: bool = False) -> None:
         self._abbreviations = {a.lower() for a in abbreviations}
         self.treat_apostrophe_as_single_quote = treat_apostrophe_as_single_quote
 
-    def tokenize_as_ranges(self, data: str, data_range: Optional[Range[int]] = None) -> Iterable[Range[int]]:
-        if data_range is None:
-            data_range = Range.create(0, len(data))
-        ctxt = LatinWordTokenizer._TokenizeContext()
-        for char_range in super().tokenize_as_ranges(data, data_range):
-            url_match = URL_REGEX.match(data[char_range.start : char_range.end])
+    def _tokenize_as_offsets(self, data: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        data_range = Range.create(start, end)
+        # the token regexes assume the default character handling and whitespace
+        use_token_regex = (
+            type(self)._process_character is LatinWordTokenizer._process_character
+            and type(self)._is_whitespace is WhitespaceTokenizer._is_whitespace
+        )
+        if use_token_regex and URL_HINT_REGEX.search(data, start, end) is None:
+            index = start
+            while index < end:
+                index = yield from self._tokenize_span(data, index, end)
+                if index < end:
+                    span_end = cast(re.Match, NON_WHITESPACE_REGEX.match(data, index, end)).end()
+                    yield from self._tokenize_characters(data, data_range, index, span_end)
+                    index = span_end
+            return
+
+        for span_start, span_end in super()._tokenize_as_offsets(data, start, end):
+            url_match = URL_REGEX.match(data, span_start, span_end)
             if url_match is not None:
-                url_len = len(url_match.group())
-                yield Range.create(char_range.start, char_range.start + url_len)
-                ctxt.index = char_range.start + url_len
+                index = url_match.end()
+                yield span_start, index
             else:
-                ctxt.index = char_range.start
-
-            ctxt.word_start = -1
-            ctxt.inner_word_punct = -1
-
-            while ctxt.index < char_range.end:
-                token_range1, token_range2 = self._process_character(data, data_range, ctxt)
-                if token_range1 is not None:
-                    yield token_range1
-                if token_range2 is not None:
-                    yield token_range2
-
-            if ctxt.word_start != -1:
-                if ctxt.inner_word_punct != -1:
-                    inner_punct_str = data[ctxt.inner_word_punct : char_range.end]
-                    if (
-                        inner_punct_str == "." and self._is_abbreviation(data, ctxt.word_start, ctxt.inner_word_punct)
-                    ) or (inner_punct_str == "'" and not self.treat_apostrophe_as_single_quote):
-                        yield Range.create(ctxt.word_start, char_range.end)
-                    else:
-                        yield Range.create(cast(int, ctxt.word_start), ctxt.inner_word_punct)
-                        yield Range.create(ctxt.inner_word_punct, char_range.end)
+                index = span_start
+
+            if use_token_regex:
+                index = yield from self._tokenize_span(data, index, span_end)
+            yield from self._tokenize_characters(data, data_range, index, span_end)
+
+    def _tokenize_span(self, data: str, start: int, end: int) -> Generator[Tuple[int, int], None, int]:
+        # Tokenizes the span using the token regex and returns the index where the character-by-character tokenizer
+        # needs to take over, which is the end of the span if the whole span was tokenized. A word is only yielded once
+        # the character that follows it has been checked, since the regex engine may use a newer version of the
+        # Unicode database than unicodedata.
+        token_regex = TOKEN_REGEX if self.treat_apostrophe_as_single_quote else APOSTROPHE_WORD_TOKEN_REGEX
+        index = start
+        word_start = -1
+        for match in token_regex.finditer(data, start, end):
+            match_start, match_end = match.span()
+            if match_start != index and word_start != -1:
+                yield word_start, index
+                word_start = -1
+            index = match_start
+            c = match[1]
+            if c is not None:
+                # the databases agree on ASCII characters
+                if c >= "\x80" and not (is_punctuation(c) or is_symbol(c) or is_control(c)):
+                    break
+                if word_start != -1:
+                    yield word_start, index
+                    word_start = -1
+                yield match_start, match_end
+            else:
+                inner_word_punct = match.start(2)
+                if inner_word_punct == -1:
+                    word_start = index
+                elif match_end == end or self._is_whitespace(data[match_end]):
+                    yield from self._split_trailing_inner_word_punct(data, index, inner_word_punct, match_end)
                 else:
-                    yield Range.create(ctxt.word_start, char_range.end)
+                    break
+            index = match_end
+        else:
+            if word_start != -1:
+                yield word_start, index
+            return end
+        return index if word_start == -1 else word_start
+
+    def _tokenize_characters(
+        self, data: str, data_range: Range[int], start: int, end: int
+    ) -> Iterator[Tuple[int, int]]:
+        ctxt = LatinWordTokenizer._TokenizeContext(index=start, word_start=-1, inner_word_punct=-1)
+        while ctxt.index < end:
+            token1, token2 = self._process_character(data, data_range, ctxt)
+            if token1 is not None:
+                yield token1
+            if token2 is not None:
+                yield token2
+
+        if ctxt.word_start != -1:
+            if ctxt.inner_word_punct != -1:
+                yield from self._split_trailing_inner_word_punct(data, ctxt.word_start, ctxt.inner_word_punct, end)
+            else:
+                yield ctxt.word_start, end
+
+    def _split_trailing_inner_word_punct(
+        self, data: str, word_start: int, inner_word_punct: int, end: int
+    ) -> Iterator[Tuple[int, int]]:
+        inner_punct_str = data[inner_word_punct:end]
+        if (inner_punct_str == "." and self._is_abbreviation(data, word_start, inner_word_punct)) or (
+            inner_punct_str == "'" and not self.treat_apostrophe_as_single_quote
+        ):
+            yield word_start, end
+        else:
+            yield word_start, inner_word_punct
+            yield inner_word_punct, end
 
     def _process_character(
         self, data: str, data_range: Range[int], ctxt: LatinWordTokenizer._TokenizeContext
-    ) -> Tuple[Optional[Range[int]], Optional[Range[int]]]:
-        token_ranges: Tuple[Optional[Range[int]], Optional[Range[int]]] = (None, None)
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        tokens: Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]] = (None, None)
         c = data[ctxt.index]
         end_index = ctxt.index + 1
 
@@ -70,35 +145,29 @@ class LatinWordTokenizer(WhitespaceTokenizer):
                 if c == "'" and not self.treat_apostrophe_as_single_quote:
                     ctxt.word_start = ctxt.index
                 else:
-                    token_ranges = (Range.create(ctxt.index, end_index), None)
+                    tokens = ((ctxt.index, end_index), None)
             elif ctxt.inner_word_punct != -1:
                 inner_punct_str = data[ctxt.inner_word_punct : ctxt.index]
                 if inner_punct_str == "'" and not self.treat_apostrophe_as_single_quote:
-                    token_ranges = (Range.create(ctxt.word_start, ctxt.index), None)
+                    tokens = ((ctxt.word_start, ctxt.index), None)
                 else:
-                    token_ranges = (
-                        Range.create(ctxt.word_start, ctxt.inner_word_punct),
-                        Range.create(ctxt.inner_word_punct, ctxt.index),
-                    )
+                    tokens = ((ctxt.word_start, ctxt.inner_word_punct), (ctxt.inner_word_punct, ctxt.index))
                 ctxt.word_start = ctxt.index
             else:
                 match = INNER_WORD_PUNCT_REGEX.match(data, ctxt.index)
                 if match is not None:
                     ctxt.inner_word_punct = ctxt.index
                     ctxt.index += len(match.group())
-                    return token_ranges
+                    return tokens
 
-                token_ranges = (
-                    Range.create(ctxt.word_start, ctxt.index),
-                    Range.create(ctxt.index, end_index),
-                )
+                tokens = ((ctxt.word_start, ctxt.index), (ctxt.index, end_index))
                 ctxt.word_start = -1
         elif ctxt.word_start == -1:
             ctxt.word_start = ctxt.index
 
         ctxt.inner_word_punct = -1
         ctxt.index = end_index
-        return token_ranges
+        return tokens
 
     def _is_abbreviation(self, data: str, start: int, end: int) -> bool:
         substr = data[start:end].lower()
@@ -1,8 +1,11 @@
-from typing import Iterable
+from typing import Iterable, List
 
-from ..detokenizer import Detokenizer
+from ..batch_detokenizer import BatchDetokenizer
 
 
-class SentencePieceDetokenizer(Detokenizer[str, str]):
+class SentencePieceDetokenizer(BatchDetokenizer[str, str]):
     def detokenize(self, tokens: Iterable[str]) -> str:
         return "".join(tokens).replace("▁", " ").lstrip()
+
+    def detokenize_batch(self, tokens: Iterable[Iterable[str]]) -> List[str]:
+        return ["".join(t).replace("▁", " ").lstrip() for t in tokens]
@@ -1,16 +1,17 @@
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Sequence
 
 import sentencepiece as sp
 
 from ...annotations.range import Range
 from ...utils.typeshed import StrPath
-from ..tokenizer import Tokenizer
+from ..batch_tokenizer import BatchTokenizer
 
 
-class SentencePieceTokenizer(Tokenizer[str, int, str]):
-    def __init__(self, model_filename: StrPath) -> None:
+class SentencePieceTokenizer(BatchTokenizer[str, int, str]):
+    def __init__(self, model_filename: StrPath, num_threads: Optional[int] = None) -> None:
         self._sp = sp.SentencePieceProcessor()
         self._sp.Load(str(model_filename))
+        self._num_threads = num_threads
 
     def tokenize(self, data: str, data_range: Optional[Range[int]] = None) -> Iterable[str]:
         if data_range is None:
@@ -18,3 +19,10 @@ class SentencePieceTokenizer(Tokenizer[str, int, str]):
 
         data = data[data_range.start : data_range.end]
         return self._sp.EncodeAsPieces(data)
+
+    def tokenize_batch(self, data: Sequence[str], num_threads: Optional[int] = None) -> List[List[str]]:
+        if len(data) == 0:
+            return []
+        if num_threads is None:
+            num_threads = self._num_threads
+        return self._sp.Encode(list(data), out_type=str, num_threads=num_threads)
@@ -2,7 +2,7 @@ from abc import abstractmethod
 from enum import Enum, auto
 from typing import Any, Iterable, List
 
-from .detokenizer import Detokenizer
+from .batch_detokenizer import BatchDetokenizer
 
 
 class DetokenizeOperation(Enum):
@@ -12,26 +12,34 @@ class DetokenizeOperation(Enum):
     MERGE_BOTH = auto()
 
 
-class StringDetokenizer(Detokenizer[str, str]):
+class StringDetokenizer(BatchDetokenizer[str, str]):
     def detokenize(self, tokens: Iterable[str]) -> str:
         token_list = list(tokens)
         ctxt = self._create_context()
         ops = [self._get_operation(ctxt, t) for t in token_list]
-        result = ""
-        for i in range(len(token_list)):
-            result += self._transform_token(token_list[i])
-
-            append_separator = True
-            if i + 1 == len(ops):
-                append_separator = False
-            elif ops[i + 1] in {DetokenizeOperation.MERGE_LEFT, DetokenizeOperation.MERGE_BOTH}:
-                append_separator = False
-            elif ops[i] in {DetokenizeOperation.MERGE_RIGHT, DetokenizeOperation.MERGE_BOTH}:
-                append_separator = False
-
-            if append_separator:
-                result += self._get_separator(token_list, ops, i)
-        return result
+        # skip the calls to the default implementations, which do not depend on the token
+        transform_token = (
+            None if type(self)._transform_token is StringDetokenizer._transform_token else self._transform_token
+        )
+        get_separator = None if type(self)._get_separator is StringDetokenizer._get_separator else self._get_separator
+
+        pieces: List[str] = []
+        last_index = len(token_list) - 1
+        for i, token in enumerate(token_list):
+            pieces.append(token if transform_token is None else transform_token(token))
+            if i == last_index:
+                break
+            next_op = ops[i + 1]
+            if next_op is DetokenizeOperation.MERGE_LEFT or next_op is DetokenizeOperation.MERGE_BOTH:
+                continue
+            op = ops[i]
+            if op is DetokenizeOperation.MERGE_RIGHT or op is DetokenizeOperation.MERGE_BOTH:
+                continue
+            pieces.append(" " if get_separator is None else get_separator(token_list, ops, i))
+        return "".join(pieces)
+
+    def detokenize_batch(self, tokens: Iterable[Iterable[str]]) -> List[str]:
+        return [self.detokenize(t) for t in tokens]
 
     def _create_context(self) -> Any:
         return None
@@ -1,24 +1,44 @@
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional, Tuple
+
+import regex as re
 
 from ..annotations.range import Range
 from .string_tokenizer import StringTokenizer
 
+# matches runs of characters for which _is_whitespace is false; \s does not include the information separators
+# (U+001C-U+001F), but str.isspace does
+NON_WHITESPACE_REGEX = re.compile(r"[^\s\x1C-\x1F\u200B\uFEFF]+")
+
 
 class WhitespaceTokenizer(StringTokenizer):
+    def tokenize(self, data: str, data_range: Optional[Range[int]] = None) -> Iterable[str]:
+        start, end = (0, len(data)) if data_range is None else (data_range.start, data_range.end)
+        return (data[s:e] for s, e in self._tokenize_as_offsets(data, start, end))
+
     def tokenize_as_ranges(self, data: str, data_range: Optional[Range[int]] = None) -> Iterable[Range[int]]:
-        if data_range is None:
-            data_range = Range.create(0, len(data))
+        start, end = (0, len(data)) if data_range is None else (data_range.start, data_range.end)
+        return (Range.create(s, e) for s, e in self._tokenize_as_offsets(data, start, end))
+
+    def _tokenize_as_offsets(self, data: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        if type(self)._is_whitespace is WhitespaceTokenizer._is_whitespace:
+            return (m.span() for m in NON_WHITESPACE_REGEX.finditer(data, start, end))
+        return self._tokenize_as_offsets_by_character(data, start, end)
+
+    def _tokenize_as_offsets_by_character(self, data: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
         start_index = -1
-        for i in data_range:
+        for i in range(start, end):
             if self._is_whitespace(data[i]):
                 if start_index != -1:
-                    yield Range.create(start_index, i)
+                    yield start_index, i
                 start_index = -1
             elif start_index == -1:
                 start_index = i
 
         if start_index != -1:
-            yield Range.create(start_index, data_range.end)
+            yield start_index, end
+
+    def is_whitespace(self, c: str) -> bool:
+        return self._is_whitespace(c)
 
     def _is_whitespace(self, c: str) -> bool:
         return c.isspace() or c == "\u200b" or c == "\ufeff"
@@ -8,44 +8,38 @@ from .latin_word_tokenizer import LatinWordTokenizer
 class ZwspWordTokenizer(LatinWordTokenizer):
     def _process_character(
         self, data: str, data_range: Range[int], ctxt: LatinWordTokenizer._TokenizeContext
-    ) -> Tuple[Optional[Range[int]], Optional[Range[int]]]:
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
         if data[ctxt.index].isspace():
             end_index = ctxt.index + 1
             while end_index != data_range.end and data[end_index].isspace():
                 end_index += 1
-            token_ranges: Tuple[Optional[Range[int]], Optional[Range[int]]] = (None, None)
+            tokens: Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]] = (None, None)
             # ignore whitespace that is followed by whitespace or punctuation
             if ctxt.index != data_range.end - 1 and (is_punctuation(data[end_index]) or data[end_index].isspace()):
                 if ctxt.word_start != -1:
-                    token_ranges = (Range.create(ctxt.word_start, ctxt.index), None)
+                    tokens = ((ctxt.word_start, ctxt.index), None)
                     ctxt.word_start = -1
             # ignore whitespace that is preceded by whitespace or punctuation
             elif ctxt.index != data_range.start and (
                 is_punctuation(data[ctxt.index - 1]) or data[ctxt.index - 1].isspace()
             ):
                 if ctxt.inner_word_punct != -1:
-                    token_ranges = (
-                        Range.create(ctxt.word_start, ctxt.inner_word_punct),
-                        Range.create(ctxt.inner_word_punct),
+                    tokens = (
+                        (ctxt.word_start, ctxt.inner_word_punct),
+                        (ctxt.inner_word_punct, ctxt.inner_word_punct + 1),
                     )
                     ctxt.word_start = -1
             elif ctxt.word_start == -1:
-                token_ranges = (Range.create(ctxt.index, end_index), None)
+                tokens = ((ctxt.index, end_index), None)
             elif ctxt.inner_word_punct != -1:
-                token_ranges = (
-                    Range.create(ctxt.word_start, ctxt.inner_word_punct),
-                    Range.create(ctxt.inner_word_punct, ctxt.index),
-                )
+                tokens = ((ctxt.word_start, ctxt.inner_word_punct), (ctxt.inner_word_punct, ctxt.index))
                 ctxt.word_start = ctxt.index
             else:
-                token_ranges = (
-                    Range.create(ctxt.word_start, ctxt.index),
-                    Range.create(ctxt.index, end_index),
-                )
+                tokens = ((ctxt.word_start, ctxt.index), (ctxt.index, end_index))
                 ctxt.word_start = -1
             ctxt.inner_word_punct = -1
             ctxt.index = end_index
-            return token_ranges
+            return tokens
         return super()._process_character(data, data_range, ctxt)
 
     def _is_whitespace(self, c: str) -> bool:
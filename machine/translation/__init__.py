@@ -1,47 +1,101 @@
-from .corpus_ops import translate_corpus, word_align_corpus
-from .ecm_score_info import EcmScoreInfo
-from .edit_distance import EditDistance
-from .edit_operation import EditOperation
-from .error_correction_model import ErrorCorrectionModel
-from .evaluation import compute_bleu
-from .fuzzy_edit_distance_word_alignment_method import FuzzyEditDistanceWordAlignmentMethod
-from .hmm_word_alignment_model import HmmWordAlignmentModel
-from .ibm1_word_alignment_model import Ibm1WordAlignmentModel
-from .ibm1_word_confidence_estimator import Ibm1WordConfidenceEstimator
-from .ibm2_word_alignment_model import Ibm2WordAlignmentModel
-from .interactive_translation_engine import InteractiveTranslationEngine
-from .interactive_translation_model import InteractiveTranslationModel
-from .interactive_translator import InteractiveTranslator
-from .interactive_translator_factory import InteractiveTranslatorFactory
-from .null_trainer import NullTrainer
-from .phrase import Phrase
-from .phrase_translation_suggester import PhraseTranslationSuggester
-from .segment_edit_distance import SegmentEditDistance
-from .segment_scorer import SegmentScorer
-from .symmetrization_heuristic import SymmetrizationHeuristic
-from .symmetrized_word_aligner import SymmetrizedWordAligner
-from .symmetrized_word_alignment_model import SymmetrizedWordAlignmentModel
-from .symmetrized_word_alignment_model_trainer import SymmetrizedWordAlignmentModelTrainer
-from .trainer import Trainer, TrainStats
-from .transductive_word_alignment_model import TransductiveWordAlignmentModel
-from .translation_constants import MAX_SEGMENT_LENGTH
-from .translation_engine import TranslationEngine
-from .translation_model import TranslationModel
-from .translation_result import TranslationResult
-from .translation_result_builder import TranslationResultBuilder
-from .translation_sources import TranslationSources
-from .translation_suggester import TranslationSuggester
-from .translation_suggestion import TranslationSuggestion
-from .truecaser import Truecaser
-from .unigram_truecaser import UnigramTruecaser, UnigramTruecaserTrainer
-from .word_aligner import WordAligner
-from .word_alignment_matrix import WordAlignmentMatrix
-from .word_alignment_method import WordAlignmentMethod
-from .word_alignment_model import WordAlignmentModel
-from .word_confidence_estimator import WordConfidenceEstimator
-from .word_edit_distance import WordEditDistance
-from .word_graph import WordGraph
-from .word_graph_arc import WordGraphArc
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .corpus_ops import translate_corpus, word_align_corpus
+    from .ecm_score_info import EcmScoreInfo
+    from .edit_distance import EditDistance
+    from .edit_operation import EditOperation
+    from .error_correction_model import ErrorCorrectionModel
+    from .evaluation import compute_bleu
+    from .fuzzy_edit_distance_word_alignment_method import FuzzyEditDistanceWordAlignmentMethod
+    from .hmm_word_alignment_model import HmmWordAlignmentModel
+    from .ibm1_word_alignment_model import Ibm1WordAlignmentModel
+    from .ibm1_word_confidence_estimator import Ibm1WordConfidenceEstimator
+    from .ibm2_word_alignment_model import Ibm2WordAlignmentModel
+    from .interactive_translation_engine import InteractiveTranslationEngine
+    from .interactive_translation_model import InteractiveTranslationModel
+    from .interactive_translator import InteractiveTranslator
+    from .interactive_translator_factory import InteractiveTranslatorFactory
+    from .null_trainer import NullTrainer
+    from .phrase import Phrase
+    from .phrase_translation_suggester import PhraseTranslationSuggester
+    from .segment_edit_distance import SegmentEditDistance
+    from .segment_scorer import SegmentScorer
+    from .symmetrization_heuristic import SymmetrizationHeuristic
+    from .symmetrized_word_aligner import SymmetrizedWordAligner
+    from .symmetrized_word_alignment_model import SymmetrizedWordAlignmentModel
+    from .symmetrized_word_alignment_model_trainer import SymmetrizedWordAlignmentModelTrainer
+    from .trainer import Trainer, TrainStats
+    from .transductive_word_alignment_model import TransductiveWordAlignmentModel
+    from .translation_constants import MAX_SEGMENT_LENGTH
+    from .translation_engine import TranslationEngine
+    from .translation_model import TranslationModel
+    from .translation_result import TranslationResult
+    from .translation_result_builder import TranslationResultBuilder
+    from .translation_sources import TranslationSources
+    from .translation_suggester import TranslationSuggester
+    from .translation_suggestion import TranslationSuggestion
+    from .truecaser import Truecaser
+    from .unigram_truecaser import UnigramTruecaser, UnigramTruecaserTrainer
+    from .word_aligner import WordAligner
+    from .word_alignment_matrix import WordAlignmentMatrix
+    from .word_alignment_method import WordAlignmentMethod
+    from .word_alignment_model import WordAlignmentModel
+    from .word_confidence_estimator import WordConfidenceEstimator
+    from .word_edit_distance import WordEditDistance
+    from .word_graph import WordGraph
+    from .word_graph_arc import WordGraphArc
+
+_IMPORT_STRUCTURE = {
+    ".corpus_ops": ["translate_corpus", "word_align_corpus"],
+    ".ecm_score_info": ["EcmScoreInfo"],
+    ".edit_distance": ["EditDistance"],
+    ".edit_operation": ["EditOperation"],
+    ".error_correction_model": ["ErrorCorrectionModel"],
+    ".evaluation": ["compute_bleu"],
+    ".fuzzy_edit_distance_word_alignment_method": ["FuzzyEditDistanceWordAlignmentMethod"],
+    ".hmm_word_alignment_model": ["HmmWordAlignmentModel"],
+    ".ibm1_word_alignment_model": ["Ibm1WordAlignmentModel"],
+    ".ibm1_word_confidence_estimator": ["Ibm1WordConfidenceEstimator"],
+    ".ibm2_word_alignment_model": ["Ibm2WordAlignmentModel"],
+    ".interactive_translation_engine": ["InteractiveTranslationEngine"],
+    ".interactive_translation_model": ["InteractiveTranslationModel"],
+    ".interactive_translator": ["InteractiveTranslator"],
+    ".interactive_translator_factory": ["InteractiveTranslatorFactory"],
+    ".null_trainer": ["NullTrainer"],
+    ".phrase": ["Phrase"],
+    ".phrase_translation_suggester": ["PhraseTranslationSuggester"],
+    ".segment_edit_distance": ["SegmentEditDistance"],
+    ".segment_scorer": ["SegmentScorer"],
+    ".symmetrization_heuristic": ["SymmetrizationHeuristic"],
+    ".symmetrized_word_aligner": ["SymmetrizedWordAligner"],
+    ".symmetrized_word_alignment_model": ["SymmetrizedWordAlignmentModel"],
+    ".symmetrized_word_alignment_model_trainer": ["SymmetrizedWordAlignmentModelTrainer"],
+    ".trainer": ["Trainer", "TrainStats"],
+    ".transductive_word_alignment_model": ["TransductiveWordAlignmentModel"],
+    ".translation_constants": ["MAX_SEGMENT_LENGTH"],
+    ".translation_engine": ["TranslationEngine"],
+    ".translation_model": ["TranslationModel"],
+    ".translation_result": ["TranslationResult"],
+    ".translation_result_builder": ["TranslationResultBuilder"],
+    ".translation_sources": ["TranslationSources"],
+    ".translation_suggester": ["TranslationSuggester"],
+    ".translation_suggestion": ["TranslationSuggestion"],
+    ".truecaser": ["Truecaser"],
+    ".unigram_truecaser": ["UnigramTruecaser", "UnigramTruecaserTrainer"],
+    ".word_aligner": ["WordAligner"],
+    ".word_alignment_matrix": ["WordAlignmentMatrix"],
+    ".word_alignment_method": ["WordAlignmentMethod"],
+    ".word_alignment_model": ["WordAlignmentModel"],
+    ".word_confidence_estimator": ["WordConfidenceEstimator"],
+    ".word_edit_distance": ["WordEditDistance"],
+    ".word_graph": ["WordGraph"],
+    ".word_graph_arc": ["WordGraphArc"],
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _IMPORT_STRUCTURE)
 
 __all__ = [
     "compute_bleu",
@@ -30,11 +30,9 @@ class EcmScoreInfo:
             if len(prev_esi.operations) > i:
                 self.operations[positions[i]] = prev_esi.operations[positions[i]]
 
-    def remove_last(self) -> None:
-        if len(self.scores) > 1:
-            self.scores.pop()
-        if len(self.operations) > 1:
-            self.operations.pop()
+    def remove_last(self, count: int = 1) -> None:
+        del self.scores[max(len(self.scores) - count, min(len(self.scores), 1)) :]
+        del self.operations[max(len(self.operations) - count, min(len(self.operations), 1)) :]
 
     def get_last_ins_prefix_word_from_esi(self) -> List[int]:
         results = [0] * len(self.operations)
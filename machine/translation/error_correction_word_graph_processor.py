@@ -129,40 +129,31 @@ class ErrorCorrectionWordGraphProcessor:
             self._state_word_graph_scores[arc.next_state] = word_graph_score
 
     def correct(self, prefix: Sequence[str], is_last_word_complete: bool) -> None:
-        # get valid portion of the processed prefix vector
+        # get valid portion of the processed prefix vector, i.e. the longest common prefix of words that were
+        # processed with the same completeness
         valid_proc_prefix_count = 0
-        for i in range(len(self._prev_prefix)):
-            if i >= len(prefix):
+        for i in range(min(len(self._prev_prefix), len(prefix))):
+            prev_is_word_complete = i < len(self._prev_prefix) - 1 or self._prev_is_last_word_complete
+            is_word_complete = i < len(prefix) - 1 or is_last_word_complete
+            if self._prev_prefix[i] != prefix[i] or prev_is_word_complete != is_word_complete:
                 break
-
-            if i == len(self._prev_prefix) - 1 and i == len(prefix) - 1:
-                if self._prev_prefix[i] == prefix[i] and self._prev_is_last_word_complete == is_last_word_complete:
-                    valid_proc_prefix_count += 1
-            elif self._prev_prefix[i] == prefix[i]:
-                valid_proc_prefix_count += 1
+            valid_proc_prefix_count += 1
 
         diff_size = len(self._prev_prefix) - valid_proc_prefix_count
         if diff_size > 0:
             # adjust size of info for arcs
             for esis in self._arc_ecm_score_infos:
                 for esi in esis:
-                    for i in range(diff_size):
-                        esi.remove_last()
+                    esi.remove_last(diff_size)
 
             # adjust size of info for states
             for state in self._states_involved_in_arcs:
-                for i in range(diff_size):
-                    self._state_ecm_score_infos[state].remove_last()
-                    self._state_best_scores[state].pop()
-                    self._state_best_prev_arcs[state].pop()
-
-        # get difference between prefix and valid portion of processed prefix
-        prefix_diff: List[str] = []
-        for i in range(len(prefix) - valid_proc_prefix_count):
-            prefix_diff.append(prefix[valid_proc_prefix_count + i])
+                self._state_ecm_score_infos[state].remove_last(diff_size)
+                del self._state_best_scores[state][-diff_size:]
+                del self._state_best_prev_arcs[state][-diff_size:]
 
         # process word-graph given prefix difference
-        self._process_word_graph_prefix_diff(prefix_diff, is_last_word_complete)
+        self._process_word_graph_prefix_diff(list(prefix[valid_proc_prefix_count:]), is_last_word_complete)
 
         self._prev_prefix = list(prefix)
         self._prev_is_last_word_complete = is_last_word_complete
@@ -40,10 +40,28 @@ class FuzzyEditDistanceWordAlignmentMethod(WordAlignmentMethod):
         self._scorer = None if self._score_selector is None else SegmentScorer(self._score_selector)
 
     def align(self, source_segment: Sequence[str], target_segment: Sequence[str]) -> WordAlignmentMatrix:
-        if self._scorer is None or self._score_selector is None:
+        paa = self._create_alignment_algorithm(source_segment, target_segment)
+        paa.compute()
+        return self._create_word_alignment_matrix(paa, source_segment, target_segment)
+
+    def align_batch(self, segments: Sequence[Sequence[Sequence[str]]]) -> Sequence[WordAlignmentMatrix]:
+        paas = [
+            self._create_alignment_algorithm(source_segment, target_segment)
+            for source_segment, target_segment in segments
+        ]
+        PairwiseAlignmentAlgorithm.compute_batch(paas)
+        return [
+            self._create_word_alignment_matrix(paa, source_segment, target_segment)
+            for paa, (source_segment, target_segment) in zip(paas, segments)
+        ]
+
+    def _create_alignment_algorithm(
+        self, source_segment: Sequence[str], target_segment: Sequence[str]
+    ) -> PairwiseAlignmentAlgorithm[Sequence[str], int]:
+        if self._scorer is None:
             raise RuntimeError("A score selector has not been assigned.")
 
-        paa = PairwiseAlignmentAlgorithm(
+        return PairwiseAlignmentAlgorithm(
             self._scorer,
             source_segment,
             target_segment,
@@ -52,7 +70,16 @@ class FuzzyEditDistanceWordAlignmentMethod(WordAlignmentMethod):
             expansion_compression_enabled=True,
             transposition_enabled=True,
         )
-        paa.compute()
+
+    def _create_word_alignment_matrix(
+        self,
+        paa: PairwiseAlignmentAlgorithm[Sequence[str], int],
+        source_segment: Sequence[str],
+        target_segment: Sequence[str],
+    ) -> WordAlignmentMatrix:
+        if self._score_selector is None:
+            raise RuntimeError("A score selector has not been assigned.")
+
         alignment = next(iter(paa.get_alignments()))
         wa_matrix = WordAlignmentMatrix.from_word_pairs(len(source_segment), len(target_segment))
         for c in range(alignment.column_count):
@@ -98,9 +125,6 @@ class FuzzyEditDistanceWordAlignmentMethod(WordAlignmentMethod):
 
         return wa_matrix
 
-    def align_batch(self, segments: Sequence[Sequence[Sequence[str]]]) -> Sequence[WordAlignmentMatrix]:
-        return [self.align(source_segment, target_segment) for source_segment, target_segment in segments]
-
     def _compute_alignment_score(self, probability: float, distance_score: float) -> float:
         return log_space_multiple(
             to_log_space(probability) * self.alpha, to_log_space(1.0 - distance_score) * (1.0 - self.alpha)
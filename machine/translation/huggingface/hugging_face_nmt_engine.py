@@ -4,6 +4,7 @@ import gc
 import logging
 import re
 from math import exp, prod
+from time import perf_counter
 from typing import Collection, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 import torch  # pyright: ignore[reportMissingImports]
@@ -40,6 +41,9 @@ class HuggingFaceNmtEngine(TranslationEngine):
         self,
         model: Union[PreTrainedModel, StrPath, str],
         oom_batch_size_backoff_mult: float = 1.0,
+        oom_batch_size_probe_interval: int = 20,
+        batch_by_length: bool = False,
+        max_batch_tokens: Optional[int] = None,
         **pipeline_kwargs,
     ) -> None:
         self._model = model
@@ -95,15 +99,21 @@ class HuggingFaceNmtEngine(TranslationEngine):
             ):
                 raise ValueError(f"The specified model does not support the language code '{tgt_lang}'")
 
-        self._batch_size = int(self._pipeline_kwargs.pop("batch_size", 1))
-
-        self._oom_batch_size_backoff_mult = oom_batch_size_backoff_mult
+        # Sorting segments by length keeps short and long segments out of the same batch, which minimizes padding.
+        # Specifying a token budget implies sorting.
+        self._batch_by_length = batch_by_length or max_batch_tokens is not None
+        self._batch_size_controller = _BatchSizeController(
+            int(self._pipeline_kwargs.pop("batch_size", 1)),
+            max_batch_tokens,
+            oom_batch_size_backoff_mult,
+            oom_batch_size_probe_interval,
+        )
 
         self._pipeline = _TranslationPipeline(
             model=self._model,
             tokenizer=self._tokenizer,
             mpn=self._mpn,
-            batch_size=self._batch_size,
+            batch_size=self._batch_size_controller.batch_size,
             **self._pipeline_kwargs,
         )
 
@@ -111,6 +121,22 @@ class HuggingFaceNmtEngine(TranslationEngine):
     def tokenizer(self) -> PreTrainedTokenizer | PreTrainedTokenizerFast:
         return self._tokenizer
 
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size_controller.batch_size
+
+    @property
+    def max_batch_tokens(self) -> Optional[int]:
+        return self._batch_size_controller.max_batch_tokens
+
+    @property
+    def segments_per_second(self) -> float:
+        return self._batch_size_controller.segments_per_second
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self._batch_size_controller.tokens_per_second
+
     def translate(self, segment: Union[str, Sequence[str]]) -> TranslationResult:
         return self.translate_batch([segment])[0]
 
@@ -123,28 +149,89 @@ class HuggingFaceNmtEngine(TranslationEngine):
     def translate_n_batch(
         self, n: int, segments: Sequence[Union[str, Sequence[str]]]
     ) -> Sequence[Sequence[TranslationResult]]:
-        while True:
-            if type(segments) is str:
-                segments = [segments]
-            else:
-                segments = [segment for segment in segments]
-            outer_batch_size = len(segments)
-            all_results: List[Sequence[TranslationResult]] = []
-            try:
-                for step in range(0, outer_batch_size, self._batch_size):
-                    all_results.extend(self._try_translate_n_batch(n, segments[step : step + self._batch_size]))
-                return all_results
-            except torch.cuda.OutOfMemoryError:
-                if self._oom_batch_size_backoff_mult >= 0.9999 or self._batch_size <= 1:
-                    raise
-                self._batch_size = max(int(round(self._batch_size * self._oom_batch_size_backoff_mult)), 1)
-                logger.warning(f"Out of memory error caught. Reducing batch size to {self._batch_size} and retrying.")
-                self._pipeline = _TranslationPipeline(
-                    model=self._model,
-                    tokenizer=self._tokenizer,
-                    batch_size=self._batch_size,
-                    **self._pipeline_kwargs,
+        if type(segments) is str:
+            segments = [segments]
+        else:
+            segments = [segment for segment in segments]
+        lengths = (
+            self._get_token_lengths(segments)
+            if self._batch_by_length or self._batch_size_controller.can_back_off
+            else [0] * len(segments)
+        )
+        indices: Sequence[int] = range(len(segments))
+        if self._batch_by_length:
+            indices = sorted(indices, key=lambda i: lengths[i])
+
+        all_results: List[Sequence[TranslationResult]] = [[] for _ in segments]
+        for batch in self._get_batches(indices, lengths):
+            self._translate_n_batch(n, segments, lengths, batch, all_results)
+        return all_results
+
+    def _translate_n_batch(
+        self,
+        n: int,
+        segments: Sequence[Union[str, Sequence[str]]],
+        lengths: Sequence[int],
+        batch: Sequence[int],
+        all_results: List[Sequence[TranslationResult]],
+    ) -> None:
+        batch_tokens = len(batch) * max(lengths[i] for i in batch)
+        start = perf_counter()
+        try:
+            batch_results = self._try_translate_n_batch(n, [segments[i] for i in batch])
+        except torch.cuda.OutOfMemoryError:
+            if len(batch) <= 1 or not self._batch_size_controller.back_off(len(batch), batch_tokens):
+                raise
+            logger.warning(
+                "Out of memory error caught. Reducing batch size to "
+                f"{self._batch_size_controller.batch_size} segments ({self._batch_size_controller.max_batch_tokens} "
+                "tokens) and retrying."
+            )
+            gc.collect()
+            torch.cuda.empty_cache()
+            # only the failing batch is retried
+            for sub_batch in self._get_batches(batch, lengths):
+                self._translate_n_batch(n, segments, lengths, sub_batch, all_results)
+            return
+
+        for i, results in zip(batch, batch_results):
+            all_results[i] = results
+        if self._batch_size_controller.record_success(len(batch), batch_tokens, perf_counter() - start):
+            logger.info(
+                f"Increasing batch size to {self._batch_size_controller.batch_size} segments "
+                f"({self._batch_size_controller.max_batch_tokens} tokens). Current throughput: "
+                f"{self._batch_size_controller.segments_per_second:.2f} segments/s, "
+                f"{self._batch_size_controller.tokens_per_second:.2f} tokens/s."
+            )
+
+    def _get_batches(self, indices: Iterable[int], lengths: Sequence[int]) -> Iterable[Sequence[int]]:
+        batch: List[int] = []
+        batch_length = 0
+        for i in indices:
+            # the limits are checked for every batch, since they can change while the batches are translated
+            max_batch_tokens = self._batch_size_controller.max_batch_tokens
+            if len(batch) > 0 and (
+                len(batch) == self._batch_size_controller.batch_size
+                or (
+                    max_batch_tokens is not None and (len(batch) + 1) * max(batch_length, lengths[i]) > max_batch_tokens
                 )
+            ):
+                yield batch
+                batch = []
+                batch_length = 0
+            batch.append(i)
+            batch_length = max(batch_length, lengths[i])
+        if len(batch) > 0:
+            yield batch
+
+    def _get_token_lengths(self, segments: Sequence[Union[str, Sequence[str]]]) -> List[int]:
+        lengths = [len(segment) if not isinstance(segment, str) else 0 for segment in segments]
+        str_indices = [i for i, segment in enumerate(segments) if isinstance(segment, str)]
+        if len(str_indices) > 0:
+            encodings = self._tokenizer([cast(str, segments[i]) for i in str_indices], add_special_tokens=False)
+            for i, input_ids in zip(str_indices, encodings["input_ids"]):
+                lengths[i] = len(input_ids)
+        return lengths
 
     def _try_translate_n_batch(
         self, n: int, segments: Sequence[Union[str, Sequence[str]]]
@@ -153,7 +240,7 @@ class HuggingFaceNmtEngine(TranslationEngine):
         i = 0
         for outputs in cast(
             Iterable[Union[List[dict], dict]],
-            self._pipeline(segments, num_return_sequences=n),
+            self._pipeline(segments, num_return_sequences=n, batch_size=len(segments)),
         ):
             if isinstance(outputs, dict):
                 outputs = [outputs]
@@ -167,9 +254,8 @@ class HuggingFaceNmtEngine(TranslationEngine):
                 if output["sequence_score"] is not None:
                     builder.set_sequence_confidence(exp(output["sequence_score"]))
                 word_pairs: Optional[Collection[Union[AlignedWordPair, Tuple[int, int]]]] = None
-                if output.get("token_attentions") is not None:
-                    src_indices = torch.argmax(output["token_attentions"], dim=1).tolist()
-                    word_pairs = set(zip(src_indices, range(output_length)))
+                if output.get("token_alignment") is not None:
+                    word_pairs = set(zip(output["token_alignment"], range(output_length)))
                 wa_matrix = WordAlignmentMatrix.from_word_pairs(len(input_tokens), output_length, word_pairs)
                 builder.mark_phrase(Range.create(0, len(input_tokens)), wa_matrix)
                 segment_results.append(builder.to_result(output["translation_text"]))
@@ -189,6 +275,81 @@ class HuggingFaceNmtEngine(TranslationEngine):
             torch.cuda.empty_cache()
 
 
+class _BatchSizeController:
+    def __init__(
+        self, max_batch_size: int, max_batch_tokens: Optional[int], backoff_mult: float, probe_interval: int
+    ) -> None:
+        self._max_batch_size = max_batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._backoff_mult = backoff_mult
+        self._probe_interval = probe_interval
+        self._current_probe_interval = probe_interval
+
+        self.batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self._success_count = 0
+        self._probing = False
+
+        self._segment_count = 0
+        self._token_count = 0
+        self._elapsed = 0.0
+
+    @property
+    def can_back_off(self) -> bool:
+        return self._backoff_mult < 0.9999
+
+    @property
+    def segments_per_second(self) -> float:
+        return self._segment_count / self._elapsed if self._elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self._token_count / self._elapsed if self._elapsed > 0 else 0.0
+
+    def back_off(self, batch_size: int, batch_tokens: int) -> bool:
+        if not self.can_back_off:
+            return False
+        if self._probing:
+            # the larger limits did not fit, so wait longer before probing again
+            self._current_probe_interval *= 2
+        self._probing = False
+        self._success_count = 0
+        # the limits always shrink below the failing batch, so that it is split when it is retried
+        self.batch_size = max(min(int(round(batch_size * self._backoff_mult)), batch_size - 1), 1)
+        if batch_tokens > 0:
+            self.max_batch_tokens = max(min(int(round(batch_tokens * self._backoff_mult)), batch_tokens - 1), 1)
+        return True
+
+    def record_success(self, segment_count: int, token_count: int, elapsed: float) -> bool:
+        self._segment_count += segment_count
+        self._token_count += token_count
+        self._elapsed += elapsed
+        self._probing = False
+        if self._probe_interval <= 0 or (
+            self.batch_size == self._max_batch_size and self.max_batch_tokens == self._max_batch_tokens
+        ):
+            return False
+
+        self._success_count += 1
+        if self._success_count < self._current_probe_interval:
+            return False
+
+        self._success_count = 0
+        self._probing = True
+        self.batch_size = min(
+            max(int(round(self.batch_size / self._backoff_mult)), self.batch_size + 1), self._max_batch_size
+        )
+        if self.max_batch_tokens is not None:
+            max_batch_tokens = max(int(round(self.max_batch_tokens / self._backoff_mult)), self.max_batch_tokens + 1)
+            if self._max_batch_tokens is not None:
+                self.max_batch_tokens = min(max_batch_tokens, self._max_batch_tokens)
+            elif self.batch_size == self._max_batch_size:
+                self.max_batch_tokens = None
+            else:
+                self.max_batch_tokens = max_batch_tokens
+        return True
+
+
 class _TranslationPipeline(TranslationPipeline):
     def __init__(
         self,
@@ -344,6 +505,8 @@ class _TranslationPipeline(TranslationPipeline):
                 )
         output_ids = output_ids.reshape(in_b, n_sequences, seq_len)
         token_logprobs = token_logprobs.reshape(in_b, n_sequences, seq_len)
+        if sequences_scores is not None:
+            sequences_scores = sequences_scores.reshape(in_b, n_sequences)
 
         return {
             "input_ids": model_inputs["input_ids"],
@@ -357,59 +520,53 @@ class _TranslationPipeline(TranslationPipeline):
     def postprocess(self, model_outputs, clean_up_tokenization_spaces=False):
         if self.tokenizer is None:
             raise RuntimeError("No tokenizer is specified.")
-        all_special_ids = set(self.tokenizer.all_special_ids)
 
         input_ids = model_outputs["input_ids"][0]
-        input_indices: List[int] = []
-        for i, input_id in enumerate(input_ids):
-            id = cast(int, input_id.item())
-            if id not in all_special_ids:
-                input_indices.append(i)
+        output_ids = model_outputs["output_ids"][0]
+        all_special_ids = torch.tensor(self.tokenizer.all_special_ids, device=input_ids.device)
+        input_mask = ~torch.isin(input_ids, all_special_ids)
+        output_mask = ~torch.isin(output_ids, all_special_ids.to(output_ids.device))
         input_tokens = model_outputs["input_tokens"][0]
 
-        records = []
-
-        has_attentions = model_outputs.get("attentions") is not None and model_outputs["attentions"][0] is not None
-        has_sequence_scores = model_outputs["sequences_scores"] is not None
-        zipped = zip(
-            model_outputs["output_ids"][0],
-            model_outputs["scores"][0],
-            model_outputs["sequences_scores"] if has_sequence_scores else iter(lambda: None, 1),
-            model_outputs["attentions"][0] if has_attentions else iter(lambda: None, 1),
+        # the special tokens of all hypotheses are filtered out at once and the results are split per hypothesis
+        output_lengths: List[int] = output_mask.sum(dim=1).tolist()
+        output_tokens: List[str] = self.tokenizer.convert_ids_to_tokens(output_ids[output_mask].tolist())
+        scores: List[float] = model_outputs["scores"][0][output_mask].tolist()
+        translation_texts = self.tokenizer.batch_decode(
+            output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=clean_up_tokenization_spaces
         )
-        for item in zipped:
-            output_ids, scores, sequence_score, attentions = cast(
-                Tuple[torch.Tensor, torch.Tensor, Optional[float], Optional[torch.Tensor]], item
-            )
-
-            output_tokens: List[str] = []
-            output_indices: List[int] = []
-            for i, output_id in enumerate(output_ids):
-                id = cast(int, output_id.item())
-                if id not in all_special_ids:
-                    output_tokens.append(self.tokenizer.convert_ids_to_tokens(id))
-                    output_indices.append(i)
-
-            scores = scores[output_indices]
+        sequence_scores: List[Optional[float]] = (
+            model_outputs["sequences_scores"][0].tolist()
+            if model_outputs["sequences_scores"] is not None
+            else [None] * len(output_lengths)
+        )
+        alignment: Optional[List[int]] = None
+        if (
+            model_outputs.get("attentions") is not None
+            and model_outputs["attentions"][0] is not None
+            and bool(input_mask.any())
+        ):
+            attentions = cast(torch.Tensor, model_outputs["attentions"][0])
+            # the source indices are relative to the non-special input tokens
+            alignment = torch.argmax(attentions[:, :, input_mask.to(attentions.device)], dim=2)[
+                output_mask.to(attentions.device)
+            ].tolist()
 
+        records = []
+        start = 0
+        for output_length, translation_text, sequence_score in zip(output_lengths, translation_texts, sequence_scores):
+            end = start + output_length
             record = {
                 "input_tokens": input_tokens,
-                "translation_tokens": output_tokens,
-                "token_scores": scores,
+                "translation_tokens": output_tokens[start:end],
+                "token_scores": scores[start:end],
                 "sequence_score": sequence_score,
-                "translation_text": self.tokenizer.decode(
-                    output_ids,
-                    skip_special_tokens=True,
-                    clean_up_tokenization_spaces=clean_up_tokenization_spaces,
-                ),
+                "translation_text": translation_text,
             }
-
-            if attentions is not None:
-                attentions = attentions[output_indices]
-                attentions = attentions[:, input_indices]
-                record["token_attentions"] = attentions
-
+            if alignment is not None:
+                record["token_alignment"] = alignment[start:end]
             records.append(record)
+            start = end
 
         return records
 
@@ -1,9 +1,10 @@
-from typing import Generator, List, Sequence
+from typing import Generator, List, Sequence, Tuple
 
 from ..annotations.range import Range
 from ..tokenization.detokenizer import Detokenizer
 from ..tokenization.range_tokenizer import RangeTokenizer
 from ..tokenization.tokenization_utils import get_ranges, split
+from ..tokenization.whitespace_tokenizer import WhitespaceTokenizer
 from .error_correction_model import ErrorCorrectionModel
 from .error_correction_word_graph_processor import ErrorCorrectionWordGraphProcessor
 from .interactive_translation_engine import InteractiveTranslationEngine
@@ -28,12 +29,13 @@ class InteractiveTranslator:
         self._engine = engine
         self._target_tokenizer = target_tokenizer
         self._prefix_word_ranges: List[Range[int]] = []
+        self._prefix_words: List[str] = []
         self._prefix = ""
         self._is_last_word_complete = True
         self._word_graph_processor = ErrorCorrectionWordGraphProcessor(ecm, target_detokenizer, word_graph)
         self._target_detokenizer = target_detokenizer
         self._sentence_start = sentence_start
-        self._correct()
+        self._correct("")
 
     @property
     def target_detokenizer(self) -> Detokenizer[str, str]:
@@ -69,13 +71,15 @@ class InteractiveTranslator:
 
     def set_prefix(self, prefix: str) -> None:
         if self._prefix != prefix:
+            prev_prefix = self._prefix
             self._prefix = prefix
-            self._correct()
+            self._correct(prev_prefix)
 
     def append_to_prefix(self, addition: str) -> None:
         if addition != "":
+            prev_prefix = self._prefix
             self._prefix += addition
-            self._correct()
+            self._correct(prev_prefix)
 
     def approve(self, aligned_only: bool) -> None:
         if not self.is_segment_valid or len(self.prefix_word_ranges) > MAX_SEGMENT_LENGTH:
@@ -96,12 +100,43 @@ class InteractiveTranslator:
     def get_current_results(self) -> Generator[TranslationResult, None, None]:
         return self._word_graph_processor.get_results()
 
-    def _correct(self) -> None:
-        self._prefix_word_ranges = list(self._target_tokenizer.tokenize_as_ranges(self._prefix))
+    def _correct(self, prev_prefix: str) -> None:
+        valid_word_count, start = self._get_valid_prefix_word_count(prev_prefix)
+        del self._prefix_word_ranges[valid_word_count:]
+        del self._prefix_words[valid_word_count:]
+        suffix_word_ranges = list(
+            self._target_tokenizer.tokenize_as_ranges(self._prefix, Range.create(start, len(self._prefix)))
+        )
+        self._prefix_word_ranges.extend(suffix_word_ranges)
+        self._prefix_words.extend(split(self._prefix, suffix_word_ranges))
         self._is_last_word_complete = len(self._prefix_word_ranges) == 0 or self._prefix_word_ranges[-1].end < len(
             self._prefix
         )
-        self._word_graph_processor.correct(split(self._prefix, self._prefix_word_ranges), self._is_last_word_complete)
+        self._word_graph_processor.correct(self._prefix_words, self._is_last_word_complete)
+
+    def _get_valid_prefix_word_count(self, prev_prefix: str) -> Tuple[int, int]:
+        # Whitespace-based tokenizers never produce a token that spans whitespace, so the words that end before the
+        # last whitespace character in the common prefix of the previous and the current prefix are unchanged and only
+        # the remainder needs to be retokenized.
+        if not isinstance(self._target_tokenizer, WhitespaceTokenizer):
+            return 0, 0
+
+        common_prefix_len = 0
+        for prev_c, c in zip(prev_prefix, self._prefix):
+            if prev_c != c:
+                break
+            common_prefix_len += 1
+
+        start = common_prefix_len - 1
+        while start >= 0 and not self._target_tokenizer.is_whitespace(self._prefix[start]):
+            start -= 1
+        if start < 0:
+            return 0, 0
+
+        valid_word_count = len(self._prefix_word_ranges)
+        while valid_word_count > 0 and self._prefix_word_ranges[valid_word_count - 1].end > start:
+            valid_word_count -= 1
+        return valid_word_count, start
 
     def _get_aligned_source_segment(self, result: TranslationResult) -> Sequence[Range[int]]:
         source_length = 0
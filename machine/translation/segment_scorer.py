@@ -1,6 +1,8 @@
 from typing import Callable, Optional, Sequence
 
-from ..sequence_alignment.pairwise_alignment_scorer import PairwiseAlignmentScorer
+import numpy as np
+
+from ..sequence_alignment.pairwise_alignment_scorer import PairwiseAlignmentScoreMatrices, PairwiseAlignmentScorer
 
 MAX_VALUE = 100000
 
@@ -52,3 +54,30 @@ class SegmentScorer(PairwiseAlignmentScorer[Sequence[str], int]):
 
     def get_max_score2(self, sequence1: Sequence[str], sequence2: Sequence[str], q: int) -> int:
         return MAX_VALUE
+
+    def get_score_matrices(
+        self, sequence1: Sequence[str], items1: Sequence[int], sequence2: Sequence[str], items2: Sequence[int]
+    ) -> Optional[PairwiseAlignmentScoreMatrices]:
+        shape = (len(items1) + 1, len(items2) + 1)
+        substitution = np.zeros(shape, dtype=np.int64)
+        substitution[1:, 1:] = np.array(
+            [[self.get_substitution_score(sequence1, p, sequence2, q) for q in items2] for p in items1], dtype=np.int64
+        ).reshape(len(items1), len(items2))
+        insertion = np.zeros(shape, dtype=np.int64)
+        insertion[:, 1:] = np.array(
+            [self.get_insertion_score(sequence1, None, sequence2, q) for q in items2], dtype=np.int64
+        )
+        deletion = np.zeros(shape, dtype=np.int64)
+        deletion[1:, :] = np.array(
+            [self.get_deletion_score(sequence1, p, sequence2, None) for p in items1], dtype=np.int64
+        )[:, None]
+
+        expansion = np.zeros(shape, dtype=np.int64)
+        expansion[:, 1:] = (substitution[:, :-1] + substitution[:, 1:]) // 2
+        compression = np.zeros(shape, dtype=np.int64)
+        compression[1:, :] = (substitution[:-1, :] + substitution[1:, :]) // 2
+        transposition = np.zeros(shape, dtype=np.int64)
+        transposition[1:, 1:] = (substitution[:-1, 1:] + substitution[1:, :-1]) // 2
+        return PairwiseAlignmentScoreMatrices(
+            insertion, deletion, substitution, expansion=expansion, compression=compression, transposition=transposition
+        )
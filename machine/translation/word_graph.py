@@ -1,17 +1,24 @@
-from dataclasses import dataclass, field
-from typing import AbstractSet, Dict, Generator, Iterable, List, Sequence, Set, Tuple
+from typing import AbstractSet, Generator, Iterable, List, Optional, Sequence, Tuple
 
-from ..statistics.log_space import LOG_SPACE_ZERO, log_space_multiple
+import numpy as np
+import numpy.typing as npt
+
+from ..statistics.log_space import LOG_SPACE_ZERO
 from .word_graph_arc import WordGraphArc
 
 EMPTY_ARC_INDICES: Sequence[int] = []
 WORD_GRAPH_INITIAL_STATE = 0
 
 
-@dataclass(frozen=True)
-class StateInfo:
-    prev_arc_indices: List[int] = field(default_factory=list)
-    next_arc_indices: List[int] = field(default_factory=list)
+class _ArcLevels:
+    """Arc indices grouped by the topological level of one of the arc's states, in arc order within each level."""
+
+    def __init__(self, levels: npt.NDArray[np.int64], level_count: int) -> None:
+        self.arc_indices = np.argsort(levels, kind="stable")
+        self.offsets = np.searchsorted(levels[self.arc_indices], np.arange(level_count + 1))
+
+    def get(self, level: int) -> npt.NDArray[np.intp]:
+        return self.arc_indices[self.offsets[level] : self.offsets[level + 1]]
 
 
 class WordGraph:
@@ -23,23 +30,23 @@ class WordGraph:
         initial_state_score: float = 0,
     ) -> None:
         self._source_tokens = list(source_tokens)
-        self._states: Dict[int, StateInfo] = {}
-        arc_list: List[WordGraphArc] = []
-        max_state = -1
-        for arc in arcs:
-            if arc.next_state > max_state:
-                max_state = arc.next_state
-            if arc.prev_state > max_state:
-                max_state = arc.prev_state
-
-            arc_index = len(arc_list)
-            self._get_or_create_state_info(arc.prev_state).next_arc_indices.append(arc_index)
-            self._get_or_create_state_info(arc.next_state).prev_arc_indices.append(arc_index)
-            arc_list.append(arc)
-        self._arcs = arc_list
-        self._state_count = max_state + 1
+        self._arcs = list(arcs)
+        # the graph structure is stored in compressed sparse row form: the arc objects are only needed for the arc
+        # contents, the scoring passes operate on the arrays
+        arc_count = len(self._arcs)
+        self._arc_prev_states = np.fromiter((arc.prev_state for arc in self._arcs), dtype=np.intp, count=arc_count)
+        self._arc_next_states = np.fromiter((arc.next_state for arc in self._arcs), dtype=np.intp, count=arc_count)
+        self._arc_scores = np.fromiter((arc.score for arc in self._arcs), dtype=np.float64, count=arc_count)
+        self._state_count = (
+            int(max(self._arc_prev_states.max(), self._arc_next_states.max())) + 1 if arc_count > 0 else 0
+        )
+        self._next_arc_indices, self._next_arc_offsets = self._create_index(self._arc_prev_states)
+        self._prev_arc_indices, self._prev_arc_offsets = self._create_index(self._arc_next_states)
         self._final_states = set(final_states)
         self._initial_state_score = initial_state_score
+        self._state_levels: Optional[npt.NDArray[np.int64]] = None
+        self._arcs_by_prev_level: Optional[_ArcLevels] = None
+        self._arcs_by_next_level: Optional[_ArcLevels] = None
 
     @property
     def source_tokens(self) -> Sequence[str]:
@@ -66,27 +73,35 @@ class WordGraph:
         return len(self._arcs) == 0
 
     def get_prev_arc_indices(self, state: int) -> Sequence[int]:
-        state_info = self._states.get(state)
-        if state_info is None:
+        if state < 0 or state >= self._state_count:
             return EMPTY_ARC_INDICES
-        return state_info.prev_arc_indices
+        return self._prev_arc_indices[self._prev_arc_offsets[state] : self._prev_arc_offsets[state + 1]].tolist()
 
     def get_next_arc_indices(self, state: int) -> Sequence[int]:
-        state_info = self._states.get(state)
-        if state_info is None:
+        if state < 0 or state >= self._state_count:
             return EMPTY_ARC_INDICES
-        return state_info.next_arc_indices
+        return self._next_arc_indices[self._next_arc_offsets[state] : self._next_arc_offsets[state + 1]].tolist()
 
     def compute_rest_scores(self) -> List[float]:
-        rest_scores: List[float] = [LOG_SPACE_ZERO] * self._state_count
+        rest_scores = np.full(self._state_count, LOG_SPACE_ZERO, dtype=np.float64)
         for state in self._final_states:
-            rest_scores[state] = self._initial_state_score
-
-        for arc in reversed(self._arcs):
-            score = log_space_multiple(arc.score, rest_scores[arc.next_state])
-            if score > rest_scores[arc.prev_state]:
-                rest_scores[arc.prev_state] = score
-        return rest_scores
+            if state < self._state_count:
+                rest_scores[state] = self._initial_state_score
+        if self.is_empty:
+            return rest_scores.tolist()
+
+        state_levels, arcs_by_prev_level, _ = self._get_levels()
+        # the next state of an arc is always at a higher level than the previous state, so processing the levels in
+        # reverse order ensures that the rest score of a state is final before it is used
+        for level in range(int(state_levels.max()), -1, -1):
+            arc_indices = arcs_by_prev_level.get(level)
+            if len(arc_indices) == 0:
+                continue
+            scores = np.maximum(
+                self._arc_scores[arc_indices] + rest_scores[self._arc_next_states[arc_indices]], LOG_SPACE_ZERO
+            )
+            np.maximum.at(rest_scores, self._arc_prev_states[arc_indices], scores)
+        return rest_scores.tolist()
 
     def get_best_path_from_state_to_final_state(self, state: int) -> Iterable[WordGraphArc]:
         arcs = list(self._get_best_path_from_final_state_to_state(state))
@@ -120,31 +135,66 @@ class WordGraph:
         if self.is_empty:
             return [], []
 
-        prev_scores: List[float] = [LOG_SPACE_ZERO] * self._state_count
-        state_best_prev_arcs = [0] * self._state_count
+        prev_scores = np.full(self._state_count, LOG_SPACE_ZERO, dtype=np.float64)
+        state_best_prev_arcs = np.zeros(self._state_count, dtype=np.intp)
+        accessible_states = np.zeros(self._state_count, dtype=np.bool_)
 
         if state == WORD_GRAPH_INITIAL_STATE:
             prev_scores[WORD_GRAPH_INITIAL_STATE] = self.initial_state_score
         else:
             prev_scores[state] = 0
-
-        accessible_states: Set[int] = {state}
-        for arc_index in range(len(self.arcs)):
-            arc = self.arcs[arc_index]
-            if arc.prev_state in accessible_states:
-                score = log_space_multiple(arc.score, prev_scores[arc.prev_state])
-                if score > prev_scores[arc.next_state]:
-                    prev_scores[arc.next_state] = score
-                    state_best_prev_arcs[arc.next_state] = arc_index
-                accessible_states.add(arc.next_state)
-            else:
-                if arc.next_state not in accessible_states:
-                    prev_scores[arc.next_state] = LOG_SPACE_ZERO
-        return prev_scores, state_best_prev_arcs
-
-    def _get_or_create_state_info(self, state: int) -> StateInfo:
-        state_info = self._states.get(state)
-        if state_info is None:
-            state_info = StateInfo()
-            self._states[state] = state_info
-        return state_info
+        accessible_states[state] = True
+
+        state_levels, _, arcs_by_next_level = self._get_levels()
+        for level in range(int(state_levels[state]) + 1, int(state_levels.max()) + 1):
+            arc_indices = arcs_by_next_level.get(level)
+            arc_indices = arc_indices[accessible_states[self._arc_prev_states[arc_indices]]]
+            if len(arc_indices) == 0:
+                continue
+            next_states = self._arc_next_states[arc_indices]
+            accessible_states[next_states] = True
+            scores = np.maximum(
+                self._arc_scores[arc_indices] + prev_scores[self._arc_prev_states[arc_indices]], LOG_SPACE_ZERO
+            )
+            # pick the first arc with the best score for each next state
+            order = np.lexsort((arc_indices, -scores, next_states))
+            next_states = next_states[order]
+            best = order[np.concatenate(([True], next_states[1:] != next_states[:-1]))]
+            best = best[scores[best] > LOG_SPACE_ZERO]
+            prev_scores[self._arc_next_states[arc_indices[best]]] = scores[best]
+            state_best_prev_arcs[self._arc_next_states[arc_indices[best]]] = arc_indices[best]
+        return prev_scores.tolist(), state_best_prev_arcs.tolist()
+
+    def _create_index(self, states: npt.NDArray[np.intp]) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        arc_indices = np.argsort(states, kind="stable")
+        offsets = np.zeros(self._state_count + 1, dtype=np.intp)
+        np.cumsum(np.bincount(states, minlength=self._state_count), out=offsets[1:])
+        return arc_indices, offsets
+
+    def _get_levels(self) -> Tuple[npt.NDArray[np.int64], _ArcLevels, _ArcLevels]:
+        if self._state_levels is None or self._arcs_by_prev_level is None or self._arcs_by_next_level is None:
+            self._state_levels = self._compute_state_levels()
+            level_count = int(self._state_levels.max()) + 1
+            self._arcs_by_prev_level = _ArcLevels(self._state_levels[self._arc_prev_states], level_count)
+            self._arcs_by_next_level = _ArcLevels(self._state_levels[self._arc_next_states], level_count)
+        return self._state_levels, self._arcs_by_prev_level, self._arcs_by_next_level
+
+    def _compute_state_levels(self) -> npt.NDArray[np.int64]:
+        # the level of a state is the length of the longest path from a state without incoming arcs, which is computed
+        # by removing one layer of states with no remaining incoming arcs at a time
+        state_levels = np.zeros(self._state_count, dtype=np.int64)
+        in_degrees = np.bincount(self._arc_next_states, minlength=self._state_count)
+        states = np.flatnonzero(in_degrees == 0)
+        level = 0
+        while len(states) > 0:
+            state_levels[states] = level
+            starts = self._next_arc_offsets[states]
+            lengths = self._next_arc_offsets[states + 1] - starts
+            arc_indices = self._next_arc_indices[
+                np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            ]
+            removed_in_degrees = np.bincount(self._arc_next_states[arc_indices], minlength=self._state_count)
+            in_degrees -= removed_in_degrees
+            states = np.flatnonzero((removed_in_degrees > 0) & (in_degrees == 0))
+            level += 1
+        return state_levels
@@ -0,0 +1,116 @@
+import gzip
+import os
+import tarfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from io import BufferedIOBase
+from pathlib import Path
+from typing import IO, BinaryIO, Deque, Iterator, Optional, Union
+
+from .typeshed import StrPath
+
+DEFAULT_GZIP_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class ParallelGzipWriter(BufferedIOBase):
+    """Writes a multi-member gzip stream, compressing independent blocks on a thread pool.
+
+    Every block is a complete gzip member, so the output can be read by any gzip reader, including ``tar -xzf``
+    and :mod:`tarfile`. zlib releases the GIL while compressing, so the blocks are compressed in parallel.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        max_workers: Optional[int] = None,
+        block_size: int = DEFAULT_GZIP_BLOCK_SIZE,
+        compresslevel: int = 9,
+    ) -> None:
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, 8)
+        self._fileobj = fileobj
+        self._max_workers = max_workers
+        self._block_size = block_size
+        self._compresslevel = compresslevel
+        self._buffer = bytearray()
+        self._block_count = 0
+        # limit the number of blocks in memory at once
+        self._pending: Deque[Future[bytes]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            # an empty stream still needs one gzip member to be valid
+            if len(self._buffer) > 0 or self._block_count == 0:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while len(self._pending) > 0:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+    def _submit(self, block: bytes) -> None:
+        self._block_count += 1
+        if self._executor is None:
+            self._fileobj.write(_compress_block(block, self._compresslevel))
+            return
+        if len(self._pending) >= 2 * self._max_workers:
+            self._fileobj.write(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(_compress_block, block, self._compresslevel))
+
+
+def _compress_block(block: bytes, compresslevel: int) -> bytes:
+    # a fixed mtime keeps the output deterministic
+    return gzip.compress(block, compresslevel, mtime=0)
+
+
+@contextmanager
+def create_tar_gz(
+    path: StrPath,
+    max_workers: Optional[int] = None,
+    block_size: int = DEFAULT_GZIP_BLOCK_SIZE,
+    compresslevel: int = 9,
+) -> Iterator[tarfile.TarFile]:
+    with ExitStack() as stack:
+        file = stack.enter_context(open(path, "wb"))
+        writer = stack.enter_context(ParallelGzipWriter(file, max_workers, block_size, compresslevel))
+        yield stack.enter_context(tarfile.open(fileobj=writer, mode="w|"))
+
+
+def extract_tar_gz(source: Union[StrPath, BinaryIO], dest_dir: StrPath) -> Path:
+    """Extracts a gzipped tar archive in a single streaming pass.
+
+    ``source`` can be a path or a readable binary stream, such as a download stream, so the archive does not need to
+    be written to a temporary file first.
+    """
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with ExitStack() as stack:
+        if isinstance(source, (str, os.PathLike)):
+            source = stack.enter_context(open(source, "rb"))
+        # GzipFile reads every member of a multi-member stream, unlike the stream mode of tarfile
+        gz = stack.enter_context(gzip.GzipFile(fileobj=source, mode="rb"))
+        tar = stack.enter_context(tarfile.open(fileobj=gz, mode="r|"))
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest_dir, filter="data")
+        else:
+            tar.extractall(dest_dir)
+    return dest_dir
@@ -1,7 +1,7 @@
 from os import PathLike
 from typing import IO, BinaryIO, cast
 
-from charset_normalizer import from_fp, from_path
+from charset_normalizer import from_bytes, from_fp, from_path
 
 from .typeshed import StrPath
 
@@ -18,3 +18,10 @@ def detect_encoding_from_stream(stream: IO[bytes]) -> str:
     if match is None:
         return "utf-8"
     return match.encoding
+
+
+def detect_encoding_from_bytes(data: bytes) -> str:
+    match = from_bytes(data).best()
+    if match is None:
+        return "utf-8"
+    return match.encoding
@@ -0,0 +1,23 @@
+from importlib import import_module
+from typing import Any, Callable, List, Mapping, Sequence, Tuple
+
+
+def lazy_import(
+    package_name: str, import_structure: Mapping[str, Sequence[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    module_names = {name: module_name for module_name, names in import_structure.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module_name = module_names.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name, package_name), name)
+        # cache the value in the package, so that __getattr__ is not called again for this name
+        package = import_module(package_name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(import_module(package_name))) | module_names.keys())
+
+    return __getattr__, __dir__
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import random
+import sys
+from typing import Callable, Dict, FrozenSet, Iterable, List
+
 import numpy as np
 from networkx import DiGraph, is_isomorphic
 from networkx.algorithms.isomorphism import numerical_edge_match
@@ -89,5 +93,125 @@ def test_cluster_two_data_objects() -> None:
     )
 
 
+def test_cluster_random() -> None:
+    for seed in range(20):
+        rand = random.Random(seed)
+        count = rand.randint(3, 40)
+        data_objects = [f"O{i}" for i in range(count)]
+        # rounded distances produce ties
+        distances = {
+            frozenset([o1, o2]): float(rand.randint(1, 10)) if seed % 2 == 0 else rand.random()
+            for i, o1 in enumerate(data_objects)
+            for o2 in data_objects[i + 1 :]
+        }
+
+        def get_distance(o1: str, o2: str) -> float:
+            return distances[frozenset([o1, o2])]
+
+        tree = UpgmaClusterer[str](get_distance).generate_clusters(data_objects)
+        expected_tree = _generate_clusters_reference(get_distance, data_objects)
+
+        assert is_isomorphic(
+            tree, expected_tree, node_match=cluster_node_match, edge_match=numerical_edge_match("weight", 0)
+        )
+        assert [c.data_objects for c in tree.nodes] == [c.data_objects for c in expected_tree.nodes]
+
+
+def test_generate_cluster_tree() -> None:
+    upgma = UpgmaClusterer[str](lambda o1, o2: 1 if {o1, o2} == {"A", "B"} else 3)
+    cluster_tree = upgma.generate_cluster_tree(["A", "B", "C"])
+
+    assert [c.description for c in cluster_tree.clusters] == ["A", "B", "C", "BRANCH", "BRANCH"]
+    assert cluster_tree.parents.tolist() == [3, 3, 4, 4, -1]
+    assert cluster_tree.branch_lengths.tolist() == [0.5, 0.5, 1.5, 1.0, 0.0]
+
+
 def cluster_node_match(n1: dict, n2: dict) -> bool:
     return n1["cluster"].data_objects == n2["cluster"].data_objects
+
+
+def _generate_clusters_reference(
+    get_distance: Callable[[str, str], float], data_objects: Iterable[str]
+) -> DiGraph[Cluster[str]]:
+    tree: DiGraph[Cluster[str]] = DiGraph()
+    clusters: List[Cluster[str]] = []
+    for data_object in data_objects:
+        cluster = Cluster[str](data_object, description=str(data_object))
+        clusters.append(cluster)
+        tree.add_node(cluster, cluster=cluster)
+
+    distances: Dict[FrozenSet[Cluster[str]], float] = {}
+    heights: Dict[Cluster[str], float] = {}
+    for i in range(len(clusters)):
+        for j in range(i + 1, len(clusters)):
+            distance = get_distance(next(iter(clusters[i].data_objects)), next(iter(clusters[j].data_objects)))
+            distances[frozenset([clusters[i], clusters[j]])] = distance
+        heights[clusters[i]] = 0
+
+    while len(clusters) >= 2:
+        min_i = 0
+        min_j = 0
+        min_dist = sys.float_info.max
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                dist = distances[frozenset([clusters[i], clusters[j]])]
+                if dist < min_dist:
+                    min_dist = dist
+                    min_i = i
+                    min_j = j
+
+        i_cluster = clusters[min_i]
+        j_cluster = clusters[min_j]
+        del distances[frozenset([i_cluster, j_cluster])]
+
+        u_cluster = Cluster[str](description="BRANCH")
+        tree.add_node(u_cluster, cluster=u_cluster)
+
+        height = min_dist / 2
+        heights[u_cluster] = height
+
+        i_count = _get_all_data_objects_count(tree, i_cluster)
+        i_len = height - heights[i_cluster]
+        if i_len <= 0 and tree.out_degree(i_cluster) > 0:
+            for _, target, data in tree.out_edges(i_cluster, data=True):
+                tree.add_edge(u_cluster, target, weight=data["weight"])
+            tree.remove_node(i_cluster)
+        else:
+            tree.remove_edges_from(tree.in_edges(i_cluster))
+            tree.add_edge(u_cluster, i_cluster, weight=max(i_len, 0))
+        j_count = _get_all_data_objects_count(tree, j_cluster)
+        j_len = height - heights[j_cluster]
+        if j_len <= 0 and tree.out_degree(j_cluster) > 0:
+            for _, target, data in tree.out_edges(j_cluster, data=True):
+                tree.add_edge(u_cluster, target, weight=data["weight"])
+            tree.remove_node(j_cluster)
+        else:
+            tree.remove_edges_from(tree.in_edges(j_cluster))
+            tree.add_edge(u_cluster, j_cluster, weight=max(j_len, 0))
+
+        i_weight = i_count / (i_count + j_count)
+        j_weight = j_count / (i_count + j_count)
+        for k_cluster in clusters:
+            if k_cluster is i_cluster or k_cluster is j_cluster:
+                continue
+            ki_key = frozenset([k_cluster, i_cluster])
+            kj_key = frozenset([k_cluster, j_cluster])
+            distances[frozenset([k_cluster, u_cluster])] = (i_weight * distances[ki_key]) + (
+                j_weight * distances[kj_key]
+            )
+            del distances[ki_key]
+            del distances[kj_key]
+        del clusters[min_j]
+        del clusters[min_i]
+        clusters.append(u_cluster)
+
+    return tree
+
+
+def _get_all_data_objects_count(tree: DiGraph[Cluster[str]], cluster: Cluster[str]) -> int:
+    if tree.out_degree(cluster) == 0:
+        return len(cluster.data_objects)
+    return sum(
+        (_get_all_data_objects_count(tree, edge[1]) for edge in tree.out_edges(cluster)),
+        len(cluster.data_objects),
+    )
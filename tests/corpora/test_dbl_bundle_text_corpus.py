@@ -1,5 +1,13 @@
+from typing import Any, List
+from zipfile import ZipFile
+
+from pytest import MonkeyPatch
+from testutils.corpora_test_helpers import USX_TEST_PROJECT_PATH
 from testutils.dbl_bundle_test_environment import DblBundleTestEnvironment
 
+import machine.corpora.shared_zip_archive as shared_zip_archive
+from machine.corpora import UsxFileTextCorpus
+
 
 def test_texts() -> None:
     with DblBundleTestEnvironment() as env:
@@ -14,3 +22,25 @@ def test_get_text() -> None:
 
         luk = env.corpus.get_text("LUK")
         assert luk is None
+
+
+def test_get_rows_opens_archive_once(monkeypatch: MonkeyPatch) -> None:
+    opened_archives: List[str] = []
+
+    class _CountingZipFile(ZipFile):
+        def __init__(self, file: Any, *args: Any, **kwargs: Any) -> None:
+            opened_archives.append(str(file))
+            super().__init__(file, *args, **kwargs)
+
+    monkeypatch.setattr(shared_zip_archive, "ZipFile", _CountingZipFile)
+    with DblBundleTestEnvironment() as env:
+        assert len(opened_archives) == 1
+
+        rows = [(r.text_id, r.ref, r.text, r.flags) for r in env.corpus]
+        assert len(opened_archives) == 2
+
+        expected_corpus = UsxFileTextCorpus(USX_TEST_PROJECT_PATH / "release" / "USX_1", env.corpus.versification)
+        assert rows == [(r.text_id, r.ref, r.text, r.flags) for r in expected_corpus]
+
+        assert env.corpus.count() == len(rows)
+        assert len(opened_archives) == 3
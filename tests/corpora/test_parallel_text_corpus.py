@@ -1,7 +1,9 @@
+import time
 from io import StringIO
-from typing import Any, Iterable, List, Optional, Tuple, cast
+from typing import Any, Callable, Iterable, List, Optional, Tuple, cast
 
 import pandas as pd
+import pytest
 from datasets.arrow_dataset import Dataset
 
 from machine.corpora import (
@@ -12,6 +14,7 @@ from machine.corpora import (
     MemoryAlignmentCollection,
     MemoryText,
     ParallelTextCorpus,
+    ParallelTextRow,
     ScriptureRef,
     StandardParallelTextCorpus,
     TextRow,
@@ -1627,6 +1630,135 @@ def test_from_hf_dataset() -> None:
     assert set_equals(rows[2].aligned_word_pairs, [AlignedWordPair(2, 2)])
 
 
+def test_from_pandas_text_ids() -> None:
+    df = pd.DataFrame(
+        {
+            "text": ["text1", "text2", "text1", "text3"],
+            "ref": [1, 2, 3, 4],
+            "source": ["source segment 1 .", "source segment 2 .", "", "source segment 4 ."],
+            "target": ["target segment 1 .", "target segment 2 .", "target segment 3 .", "target segment 4 ."],
+        }
+    )
+    parallel_corpus = ParallelTextCorpus.from_pandas(df)
+    assert parallel_corpus.count(text_ids=["text1", "text3"]) == 3
+    assert parallel_corpus.count(include_empty=False, text_ids=["text1", "text3"]) == 2
+    assert parallel_corpus.count(text_ids=["text4"]) == 0
+    rows = list(parallel_corpus.get_rows(["text1", "text3"]))
+    assert [(row.text_id, row.ref) for row in rows] == [("text1", 1), ("text1", 3), ("text3", 4)]
+
+    parallel_corpus = ParallelTextCorpus.from_pandas(df.drop(columns=["text"]), default_text_id="text1")
+    assert parallel_corpus.count(text_ids=["text1"]) == 4
+    assert parallel_corpus.count(text_ids=["text2"]) == 0
+    assert len(list(parallel_corpus.get_rows(["text1"]))) == 4
+    assert not any(parallel_corpus.get_rows(["text2"]))
+
+
+def test_from_pandas_many_rows() -> None:
+    size = 25000
+    df = pd.DataFrame(
+        {
+            "text": [f"text{i % 3}" for i in range(size)],
+            "source": [f"source segment {i} ." if i % 7 != 0 else "" for i in range(size)],
+            "target": [f"target segment {i} ." for i in range(size)],
+            "alignment": [f"0-0 {i % 5}-1" for i in range(size)],
+        },
+        index=range(10, size + 10),
+    )
+    parallel_corpus = ParallelTextCorpus.from_pandas(df)
+    assert parallel_corpus.count(include_empty=False) == size - len(range(0, size, 7))
+    assert [_parallel_row_to_tuple(row) for row in parallel_corpus] == [
+        (
+            f"text{i % 3}",
+            [i + 10],
+            [f"source segment {i} ."] if i % 7 != 0 else [],
+            [f"target segment {i} ."],
+            [AlignedWordPair(0, 0), AlignedWordPair(i % 5, 1)],
+        )
+        for i in range(size)
+    ]
+
+
+def test_from_hf_dataset_text_ids() -> None:
+    ds = Dataset.from_dict(
+        {
+            "text": ["text1", "text2", "text1"],
+            "translation": [
+                {"src": "source segment 1 .", "trg": "target segment 1 ."},
+                {"src": "source segment 2 .", "trg": "target segment 2 ."},
+                {"src": "source segment 3 .", "trg": ""},
+            ],
+        }
+    )
+    parallel_corpus = ParallelTextCorpus.from_hf_dataset(ds, "src", "trg")
+    assert parallel_corpus.count(text_ids=["text1"]) == 2
+    assert parallel_corpus.count(include_empty=False, text_ids=["text1"]) == 1
+    rows = list(parallel_corpus.get_rows(["text1"]))
+    assert [(row.text_id, row.ref, row.target_segment) for row in rows] == [
+        ("text1", 0, ["target segment 1 ."]),
+        ("text1", 1, []),
+    ]
+
+
+def test_from_hf_iterable_dataset_many_rows() -> None:
+    size = 25000
+    ds = Dataset.from_dict(
+        {
+            "ref": [[i, i + 1] for i in range(size)],
+            "translation": [
+                {"language": ["src", "trg"], "translation": [f"source segment {i} .", f"target segment {i} ."]}
+                for i in range(size)
+            ],
+            "alignment": [{"src": [0, 1], "trg": [0, i % 3]} for i in range(size)],
+        }
+    ).to_iterable_dataset()
+    parallel_corpus = ParallelTextCorpus.from_hf_dataset(ds, "src", "trg", default_text_id="text1")
+    assert parallel_corpus.count() == size
+    assert [_parallel_row_to_tuple(row) for row in parallel_corpus] == [
+        (
+            "text1",
+            [i, i + 1],
+            [f"source segment {i} ."],
+            [f"target segment {i} ."],
+            [AlignedWordPair(0, 0), AlignedWordPair(1, i % 3)],
+        )
+        for i in range(size)
+    ]
+
+
+@pytest.mark.benchmark
+def test_from_pandas_throughput(record_property: Callable[[str, object], None]) -> None:
+    size = 1_000_000
+    df = pd.DataFrame(
+        {
+            "text": [f"text{i % 3}" for i in range(size)],
+            "ref": range(size),
+            "source": [f"source segment {i} ." if i % 7 != 0 else "" for i in range(size)],
+            "target": [f"target segment {i} ." for i in range(size)],
+            "alignment": [f"0-0 {i % 5}-1" for i in range(size)],
+        }
+    )
+    parallel_corpus = ParallelTextCorpus.from_pandas(df)
+    _check_corpus_throughput(parallel_corpus, size, record_property)
+
+
+@pytest.mark.benchmark
+def test_from_hf_dataset_throughput(record_property: Callable[[str, object], None]) -> None:
+    size = 1_000_000
+    ds = Dataset.from_dict(
+        {
+            "text": [f"text{i % 3}" for i in range(size)],
+            "ref": range(size),
+            "translation": [
+                {"src": f"source segment {i} ." if i % 7 != 0 else "", "trg": f"target segment {i} ."}
+                for i in range(size)
+            ],
+            "alignment": [{"src": [0, i % 5], "trg": [0, 1]} for i in range(size)],
+        }
+    )
+    parallel_corpus = ParallelTextCorpus.from_hf_dataset(ds, "src", "trg")
+    _check_corpus_throughput(parallel_corpus, size, record_property)
+
+
 def test_count_no_rows() -> None:
     source_corpus = DictionaryTextCorpus()
     target_corpus = DictionaryTextCorpus()
@@ -1704,6 +1836,28 @@ def alignment_row(text_id: str, ref: int, *pairs: AlignedWordPair) -> AlignmentR
     return AlignmentRow(text_id, ref, list(pairs))
 
 
+def _check_corpus_throughput(
+    parallel_corpus: ParallelTextCorpus, size: int, record_property: Callable[[str, object], None]
+) -> None:
+    # every seventh row has an empty source segment and the rows are spread evenly over three texts
+    start = time.perf_counter()
+    assert sum(1 for _ in parallel_corpus) == size
+    record_property("iterate_elapsed", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    assert parallel_corpus.count(include_empty=False) == size - len(range(0, size, 7))
+    record_property("count_non_empty_elapsed", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    assert parallel_corpus.count(text_ids=["text0", "text2"]) == len(range(0, size, 3)) + len(range(2, size, 3))
+    record_property("count_text_ids_elapsed", time.perf_counter() - start)
+
+
+def _parallel_row_to_tuple(row: ParallelTextRow) -> tuple:
+    aligned_word_pairs = None if row.aligned_word_pairs is None else list(row.aligned_word_pairs)
+    return (row.text_id, list(row.source_refs), row.source_segment, row.target_segment, aligned_word_pairs)
+
+
 def set_equals(x: Optional[Iterable], y: Optional[Iterable]) -> bool:
     if x is None:
         return y is None
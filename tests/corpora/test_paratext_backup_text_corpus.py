@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, ContextManager
+from typing import Any, ContextManager, List
+from zipfile import ZipFile
 
-from testutils.corpora_test_helpers import create_test_paratext_backup
+from pytest import MonkeyPatch
+from testutils.corpora_test_helpers import USFM_TEST_PROJECT_PATH, create_test_paratext_backup
 
-from machine.corpora import ParatextBackupTextCorpus
+import machine.corpora.shared_zip_archive as shared_zip_archive
+from machine.corpora import ParatextBackupTextCorpus, ParatextTextCorpus
 
 
 def test_texts() -> None:
@@ -28,6 +31,28 @@ def test_get_text() -> None:
         assert not any(jhn.get_rows())
 
 
+def test_get_rows_opens_archive_once(monkeypatch: MonkeyPatch) -> None:
+    opened_archives: List[str] = []
+
+    class _CountingZipFile(ZipFile):
+        def __init__(self, file: Any, *args: Any, **kwargs: Any) -> None:
+            opened_archives.append(str(file))
+            super().__init__(file, *args, **kwargs)
+
+    monkeypatch.setattr(shared_zip_archive, "ZipFile", _CountingZipFile)
+    with _TestEnvironment() as env:
+        assert len(opened_archives) == 1
+
+        rows = [(r.text_id, r.ref, r.text, r.flags) for r in env.corpus]
+        assert len(opened_archives) == 2
+
+        expected_corpus = ParatextTextCorpus(USFM_TEST_PROJECT_PATH)
+        assert rows == [(r.text_id, r.ref, r.text, r.flags) for r in expected_corpus]
+
+        assert env.corpus.count() == len(rows)
+        assert len(opened_archives) == 3
+
+
 class _TestEnvironment(ContextManager["_TestEnvironment"]):
     def __init__(self) -> None:
         self._temp_dir = TemporaryDirectory()
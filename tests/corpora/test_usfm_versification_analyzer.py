@@ -4,8 +4,13 @@ from typing import Dict, List, Optional, Set
 from testutils.memory_paratext_project_file_handler import DefaultParatextProjectSettings
 from testutils.memory_usfm_versification_analyzer import MemoryUsfmVersificationAnalyzer
 
-from machine.corpora import ParatextProjectSettings, UsfmVersificationAnalysis, UsfmVersificationDiagnosticType
-from machine.scripture import ENGLISH_VERSIFICATION, ORIGINAL_VERSIFICATION, Versification
+from machine.corpora import (
+    ParatextProjectSettings,
+    UsfmVersificationAnalysis,
+    UsfmVersificationDiagnostic,
+    UsfmVersificationDiagnosticType,
+)
+from machine.scripture import ENGLISH_VERSIFICATION, ORIGINAL_VERSIFICATION, VerseRef, Versification
 
 
 def test_no_errors():
@@ -90,6 +95,71 @@ def test_missing_chapter():
     assert str(analysis.diagnostics[0].references[0]) == "3JN 1:1-15"
 
 
+def test_missing_books():
+    env = _TestEnvironment(
+        files={
+            "653JNTest.SFM": r"""\id 3JN
+    \c 1
+    \v 1-15
+    """
+        }
+    )
+    analysis = env.analyze_usfm_versification(only_books=["1JN", "2JN", "3JN"])
+    assert len(analysis.diagnostics) == 1
+    assert analysis.total_num_encountered_verses == 15
+    assert analysis.total_num_affected_verses == 118
+    assert analysis.diagnostics[0].type == UsfmVersificationDiagnosticType.MISSING
+    assert [str(vr) for vr in analysis.diagnostics[0].references] == [
+        "1JN 1:1-10",
+        "1JN 2:1-29",
+        "1JN 3:1-24",
+        "1JN 4:1-21",
+        "1JN 5:1-21",
+        "2JN 1:1-13",
+    ]
+
+
+def test_diagnostic_extend():
+    diagnostic = UsfmVersificationDiagnostic(
+        type=UsfmVersificationDiagnosticType.EXTRA,
+        references=[VerseRef.from_string("MAT 1:1-3")],
+        filename=None,
+        line_numbers=[1],
+    )
+    diagnostic.extend(VerseRef.from_string("MAT 1:4-5"), 2)
+    diagnostic.extend(VerseRef.from_string("MAT 1:6"), 3)
+    diagnostic.extend(VerseRef.from_string("MAT 1:8"), 4)
+    diagnostic.extend(VerseRef.from_string("MAT 2:9"), 5)
+    diagnostic.extend(VerseRef.from_string("MRK 2:10"), 6)
+
+    assert diagnostic.num_affected_verses == 9
+    assert [str(vr) for vr in diagnostic.references] == ["MAT 1:1-6", "MAT 1:8", "MAT 2:9", "MRK 2:10"]
+    assert diagnostic.line_numbers == [1, 2, 3, 4, 5, 6]
+
+
+def test_diagnostic_extend_read_references():
+    diagnostic = UsfmVersificationDiagnostic(
+        type=UsfmVersificationDiagnosticType.MISSING,
+        references=[VerseRef.from_string("MAT 1:1")],
+        filename=None,
+        line_numbers=[],
+    )
+    diagnostic.extend(VerseRef.from_string("MAT 1:2"))
+    assert [str(vr) for vr in diagnostic.references] == ["MAT 1:1-2"]
+    assert diagnostic == UsfmVersificationDiagnostic(
+        type=UsfmVersificationDiagnosticType.MISSING,
+        references=[VerseRef.from_string("MAT 1:1-2")],
+        filename=None,
+        line_numbers=[],
+    )
+
+    diagnostic.references[-1] = VerseRef.from_string("MAT 1:5")
+    diagnostic.extend(VerseRef.from_string("MAT 1:3"))
+    diagnostic.extend(VerseRef.from_string("MAT 1:4"))
+    assert [str(vr) for vr in diagnostic.references] == ["MAT 1:5", "MAT 1:3-4"]
+    assert diagnostic.num_affected_verses == 3
+
+
 def test_extra_verse():
     env = _TestEnvironment(
         files={
@@ -461,6 +531,98 @@ def test_unsupported_cross_chapter_verse_reference():
     assert str(analysis.diagnostics[2].references[0]) == "LEV 7:1-38"
 
 
+def test_parallel_analysis():
+    env = _TestEnvironment(
+        files={
+            "03LEVTest.SFM": r"""\id LEV
+    \c 6
+    \v 1
+    \v 2
+    \v 6-9
+    \v 10-30
+    """,
+            "642JNTest.SFM": r"""\id 2JN
+    \c 1
+    \v 1
+    \v 2
+    \v 3
+    \v 5-4
+    \v 6
+    \v 7
+    \v 8
+    \v 9
+    \v 10
+    \v 11
+    \v 12
+    \v 13
+    \v 14
+    """,
+            "66JUDTest.SFM": r"""\id JUD
+    \c 1
+    \v 1
+    \v 2
+    \v 4
+    \v 5
+    \v 6
+    \v 7
+    \v 8
+    \v 9
+    \v 10
+    \v 11
+    \v 12
+    \v 13a
+    \v 13b
+    \v 14
+    \v 15
+    \v 16
+    \v 17
+    \v 18-19
+    \v 20
+    \v 21
+    \v 22
+    \v 23
+    \v 24
+    \c a
+    \v 1
+    """,
+            "67REVTest.SFM": r"""\id REV
+    \c 1
+    \v 1
+    \v 2
+    \v 3
+    \v 21
+    \c 22
+    \v 1
+    \v 2-3
+    \v 21
+    """,
+        },
+        settings=DefaultParatextProjectSettings(versification=ENGLISH_VERSIFICATION),
+    )
+
+    for only_books in [None, ["LEV", "2JN", "3JN", "JUD", "REV"]]:
+        serial_analysis = env.analyze_usfm_versification(only_books=only_books)
+        parallel_analysis = env.analyze_usfm_versification(only_books=only_books, max_workers=2)
+        assert _analysis_to_tuple(parallel_analysis) == _analysis_to_tuple(serial_analysis)
+
+    only_chapters = {"LEV": {6}, "JUD": None, "REV": {1, 22}}
+    serial_analysis = env.analyze_usfm_versification(only_chapters=only_chapters)
+    parallel_analysis = env.analyze_usfm_versification(only_chapters=only_chapters, max_workers=2)
+    assert _analysis_to_tuple(parallel_analysis) == _analysis_to_tuple(serial_analysis)
+    assert {d.type for d in serial_analysis.diagnostics} == set(UsfmVersificationDiagnosticType)
+
+
+def _analysis_to_tuple(analysis: UsfmVersificationAnalysis) -> tuple:
+    return (
+        analysis.total_num_affected_verses,
+        analysis.total_num_encountered_verses,
+        [
+            (d.type, [str(vr) for vr in d.references], d.filename, d.line_numbers, d.num_affected_verses)
+            for d in analysis.diagnostics
+        ],
+    )
+
+
 class _TestEnvironment:
     def __init__(self, settings: Optional[ParatextProjectSettings] = None, files: Optional[Dict[str, str]] = None):
         self._settings = settings
@@ -471,13 +633,14 @@ class _TestEnvironment:
         self,
         only_books: Optional[List[str]] = None,
         only_chapters: Optional[Dict[str, Optional[Set[int]]]] = None,
+        max_workers: int = 1,
     ) -> UsfmVersificationAnalysis:
         if only_chapters is not None:
-            return self.analyzer.analyze_usfm_versification(only_chapters)
+            return self.analyzer.analyze_usfm_versification(only_chapters, max_workers=max_workers)
         book_ids_and_chapters: Optional[Dict[str, Optional[Set[int]]]] = (
             {book: None for book in only_books} if only_books is not None else None
         )
-        return self.analyzer.analyze_usfm_versification(book_ids_and_chapters)
+        return self.analyzer.analyze_usfm_versification(book_ids_and_chapters, max_workers=max_workers)
 
 
 def get_custom_versification(
@@ -0,0 +1,253 @@
+import hashlib
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from clearml import StorageManager
+from pytest import MonkeyPatch, raises
+
+from machine.jobs import ClearMLSharedFileService, FileTransfer, RemoteFileInfo, RetryPolicy, StorageBackend
+
+
+def test_download_file(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({"s3://bucket/file.txt": b"Hello, world!"})
+    transfer = FileTransfer(backend, sleep=_no_sleep)
+
+    local_path = transfer.download_file("s3://bucket/file.txt", tmp_path / "file.txt")
+
+    assert local_path.read_bytes() == b"Hello, world!"
+    assert not (tmp_path / "file.txt.partial").exists()
+    assert backend.read_offsets == [0]
+
+
+def test_download_file_resumes_partial_download(tmp_path: Path) -> None:
+    content = bytes(range(256)) * 16
+    backend = _FakeStorageBackend({"s3://bucket/file.bin": content}, chunk_size=512)
+    backend.fail_reads_after_bytes = [1536]
+    delays: List[float] = []
+    transfer = FileTransfer(backend, sleep=delays.append)
+
+    local_path = transfer.download_file("s3://bucket/file.bin", tmp_path / "file.bin")
+
+    assert local_path.read_bytes() == content
+    assert backend.read_offsets == [0, 1536]
+    assert len(delays) == 1
+
+
+def test_download_file_restarts_on_checksum_mismatch(tmp_path: Path) -> None:
+    content = b"The quick brown fox jumps over the lazy dog."
+    backend = _FakeStorageBackend({"s3://bucket/file.txt": content})
+    backend.corrupt_reads = 1
+    transfer = FileTransfer(backend, sleep=_no_sleep)
+
+    local_path = transfer.download_file("s3://bucket/file.txt", tmp_path / "file.txt")
+
+    assert local_path.read_bytes() == content
+    assert backend.read_offsets == [0, 0]
+
+
+def test_download_file_discards_stale_partial_file(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({"s3://bucket/file.txt": b"short"})
+    (tmp_path / "file.txt.partial").write_bytes(b"a much longer stale partial file")
+    transfer = FileTransfer(backend, sleep=_no_sleep)
+
+    local_path = transfer.download_file("s3://bucket/file.txt", tmp_path / "file.txt")
+
+    assert local_path.read_bytes() == b"short"
+    assert backend.read_offsets == [0]
+
+
+def test_download_file_gives_up(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({"s3://bucket/file.txt": b"Hello, world!"})
+    backend.fail_info = 5
+    delays: List[float] = []
+    transfer = FileTransfer(backend, retry_policy=RetryPolicy(max_attempts=3), sleep=delays.append)
+
+    with raises(ConnectionError):
+        transfer.download_file("s3://bucket/file.txt", tmp_path / "file.txt")
+    assert len(delays) == 2
+    assert not (tmp_path / "file.txt").exists()
+
+
+def test_download_files(tmp_path: Path) -> None:
+    files = {f"s3://bucket/file{i}.txt": f"content {i}".encode() for i in range(8)}
+    backend = _FakeStorageBackend(files, read_barrier=threading.Barrier(4, timeout=10))
+    transfer = FileTransfer(backend, max_workers=4, sleep=_no_sleep)
+
+    local_paths = transfer.download_files([(uri, tmp_path / uri.rsplit("/", 1)[1]) for uri in files])
+
+    assert local_paths == [tmp_path / f"file{i}.txt" for i in range(8)]
+    assert [p.read_bytes() for p in local_paths] == list(files.values())
+    assert backend.max_concurrent_reads == 4
+
+
+def test_upload_file(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({})
+    backend.fail_writes = 2
+    delays: List[float] = []
+    transfer = FileTransfer(backend, sleep=delays.append)
+    local_path = tmp_path / "file.txt"
+    local_path.write_bytes(b"Hello, world!")
+
+    transfer.upload_file(local_path, "s3://bucket/file.txt")
+
+    assert backend.files["s3://bucket/file.txt"] == b"Hello, world!"
+    assert len(delays) == 2
+
+
+def test_upload_file_gives_up_on_size_mismatch(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({})
+    backend.truncate_writes = True
+    delays: List[float] = []
+    transfer = FileTransfer(backend, retry_policy=RetryPolicy(max_attempts=3), sleep=delays.append)
+    local_path = tmp_path / "file.txt"
+    local_path.write_bytes(b"Hello, world!")
+
+    with raises(RuntimeError):
+        transfer.upload_file(local_path, "s3://bucket/file.txt")
+    assert len(delays) == 2
+
+
+def test_upload_files(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend({})
+    transfer = FileTransfer(backend, sleep=_no_sleep)
+    local_paths = []
+    for i in range(5):
+        local_path = tmp_path / f"file{i}.txt"
+        local_path.write_bytes(f"content {i}".encode())
+        local_paths.append(local_path)
+
+    transfer.upload_files([(p, f"s3://bucket/{p.name}") for p in local_paths])
+
+    assert backend.files == {f"s3://bucket/file{i}.txt": f"content {i}".encode() for i in range(5)}
+
+
+def test_exists_file() -> None:
+    backend = _FakeStorageBackend({"s3://bucket/file.txt": b""})
+    transfer = FileTransfer(backend, sleep=_no_sleep)
+
+    assert transfer.exists_file("s3://bucket/file.txt")
+    assert not transfer.exists_file("s3://bucket/missing.txt")
+
+
+def test_retry_policy_get_delay() -> None:
+    policy = RetryPolicy(initial_delay=1.0, max_delay=10.0, multiplier=2.0)
+
+    for attempt, max_delay in enumerate([1.0, 2.0, 4.0, 8.0, 10.0, 10.0]):
+        delays = [policy.get_delay(attempt) for _ in range(100)]
+        assert all(0 <= d <= max_delay for d in delays)
+        # jitter spreads the delays out, so clients that fail together do not retry together
+        assert len(set(delays)) > 1
+
+
+def test_clearml_shared_file_service_download_files(tmp_path: Path) -> None:
+    backend = _FakeStorageBackend(
+        {
+            "s3://bucket/folder/builds/build1/train.src.txt": b"source",
+            "s3://bucket/folder/builds/build1/train.trg.txt": b"target",
+        }
+    )
+    backend.fail_reads_after_bytes = [0]
+    config = SimpleNamespace(
+        build_id="build1", data_dir=str(tmp_path), shared_file_uri="s3://bucket/", shared_file_folder="folder"
+    )
+    service = ClearMLSharedFileService(config, transfer=FileTransfer(backend, sleep=_no_sleep))
+
+    local_paths = service.download_files(["builds/build1/train.src.txt", "builds/build1/train.trg.txt"])
+
+    assert local_paths == [
+        tmp_path / "folder" / "builds" / "build1" / "train.src.txt",
+        tmp_path / "folder" / "builds" / "build1" / "train.trg.txt",
+    ]
+    assert [p.read_bytes() for p in local_paths] == [b"source", b"target"]
+
+
+def test_clearml_shared_file_service_upload_folder_gives_up(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    uploads: List[Tuple[str, str]] = []
+
+    def upload_folder(local_folder: str, remote_url: str) -> Optional[str]:
+        uploads.append((local_folder, remote_url))
+        return None
+
+    monkeypatch.setattr(StorageManager, "upload_folder", upload_folder)
+    monkeypatch.setattr("machine.jobs.file_transfer.time.sleep", _no_sleep)
+    config = SimpleNamespace(
+        build_id="build1", data_dir=str(tmp_path), shared_file_uri="s3://bucket/", shared_file_folder="folder"
+    )
+    service = ClearMLSharedFileService(
+        config, transfer=FileTransfer(_FakeStorageBackend({})), retry_policy=RetryPolicy(max_attempts=3)
+    )
+
+    with raises(RuntimeError):
+        service._upload_folder("builds/build1/model", tmp_path / "model")
+    assert uploads == [(str(tmp_path / "model"), "s3://bucket/folder/builds/build1/model")] * 3
+
+
+def _no_sleep(delay: float) -> None:
+    pass
+
+
+class _FakeStorageBackend(StorageBackend):
+    def __init__(
+        self, files: Dict[str, bytes], chunk_size: int = 4, read_barrier: Optional[threading.Barrier] = None
+    ) -> None:
+        self.files = dict(files)
+        self.chunk_size = chunk_size
+        self.read_barrier = read_barrier
+        self.fail_info = 0
+        self.fail_writes = 0
+        self.truncate_writes = False
+        self.corrupt_reads = 0
+        self.fail_reads_after_bytes: List[int] = []
+        self.read_offsets: List[int] = []
+        self.max_concurrent_reads = 0
+        self._concurrent_reads = 0
+        self._lock = threading.Lock()
+
+    def get_file_info(self, uri: str) -> RemoteFileInfo:
+        with self._lock:
+            if self.fail_info > 0:
+                self.fail_info -= 1
+                raise ConnectionError("Connection reset.")
+        if uri not in self.files:
+            raise FileNotFoundError(uri)
+        content = self.files[uri]
+        return RemoteFileInfo(len(content), hashlib.sha256(content).hexdigest())
+
+    def read_file(self, uri: str, offset: int = 0) -> Iterable[bytes]:
+        with self._lock:
+            self.read_offsets.append(offset)
+            self._concurrent_reads += 1
+            self.max_concurrent_reads = max(self.max_concurrent_reads, self._concurrent_reads)
+            fail_after = self.fail_reads_after_bytes.pop(0) if len(self.fail_reads_after_bytes) > 0 else None
+            corrupt = self.corrupt_reads > 0
+            if corrupt:
+                self.corrupt_reads -= 1
+        try:
+            if self.read_barrier is not None:
+                self.read_barrier.wait()
+            content = self.files[uri]
+            if corrupt:
+                content = content[::-1]
+            sent = 0
+            for i in range(offset, len(content), self.chunk_size):
+                if fail_after is not None and sent >= fail_after:
+                    raise ConnectionError("Connection reset.")
+                chunk = content[i : i + self.chunk_size]
+                sent += len(chunk)
+                yield chunk
+        finally:
+            with self._lock:
+                self._concurrent_reads -= 1
+
+    def write_file(self, local_path: Path, uri: str) -> None:
+        with self._lock:
+            if self.fail_writes > 0:
+                self.fail_writes -= 1
+                raise ConnectionError("Connection reset.")
+        content = local_path.read_bytes()
+        self.files[uri] = content[:-1] if self.truncate_writes else content
+
+    def exists_file(self, uri: str) -> bool:
+        return uri in self.files
@@ -59,6 +59,17 @@ def test_run(decoy: Decoy) -> None:
     decoy.verify(env.translation_file_service.save_model(Path("model.tar.gz"), "models/save-model.tar.gz"), times=1)
 
 
+def test_run_multiple_batches(decoy: Decoy) -> None:
+    env = _TestEnvironment(decoy, pretranslation_count=5, inference_batch_size=2)
+    env.job.run()
+
+    pretranslations = json.loads(env.target_pretranslations)
+    assert [pi["textId"] for pi in pretranslations] == ["text1", "text2", "text3", "text4", "text5"]
+    assert all(pi["translation"] == "Please, I have booked a room." for pi in pretranslations)
+    if is_eflomal_available():
+        assert all(len(pi["alignment"]) > 0 for pi in pretranslations)
+
+
 def test_cancel(decoy: Decoy) -> None:
     env = _TestEnvironment(decoy)
     checker = _CancellationChecker(3)
@@ -69,7 +80,7 @@ def test_cancel(decoy: Decoy) -> None:
 
 
 class _TestEnvironment:
-    def __init__(self, decoy: Decoy) -> None:
+    def __init__(self, decoy: Decoy, pretranslation_count: int = 1, inference_batch_size: int = 100) -> None:
         self.source_tokenizer_trainer = decoy.mock(cls=Trainer)
         self.target_tokenizer_trainer = decoy.mock(cls=Trainer)
 
@@ -81,31 +92,28 @@ class _TestEnvironment:
 
         self.engine = decoy.mock(cls=TranslationEngine)
         decoy.when(self.engine.__enter__()).then_return(self.engine)
-        decoy.when(self.engine.translate_batch(matchers.Anything())).then_return(
-            [
-                TranslationResult(
-                    translation="Please, I have booked a room.",
-                    source_tokens="Por favor , tengo reservada una habitación .".split(),
-                    target_tokens="Please , I have booked a room .".split(),
-                    confidences=[0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
-                    sequence_confidence=0.5,
-                    sources=[
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                        TranslationSources.NMT,
-                    ],
-                    alignment=WordAlignmentMatrix.from_word_pairs(
-                        8, 8, {(0, 0), (1, 0), (2, 1), (3, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7)}
-                    ),
-                    phrases=[Phrase(Range.create(0, 8), 8)],
-                )
-            ]
+        result = TranslationResult(
+            translation="Please, I have booked a room.",
+            source_tokens="Por favor , tengo reservada una habitación .".split(),
+            target_tokens="Please , I have booked a room .".split(),
+            confidences=[0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            sequence_confidence=0.5,
+            sources=[
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+                TranslationSources.NMT,
+            ],
+            alignment=WordAlignmentMatrix.from_word_pairs(
+                8, 8, {(0, 0), (1, 0), (2, 1), (3, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7)}
+            ),
+            phrases=[Phrase(Range.create(0, 8), 8)],
         )
+        decoy.when(self.engine.translate_batch(matchers.Anything())).then_do(lambda segments: [result] * len(segments))
 
         self.nmt_model_factory = decoy.mock(cls=NmtModelFactory)
         decoy.when(self.nmt_model_factory.train_tokenizer).then_return(True)
@@ -125,23 +133,22 @@ class _TestEnvironment:
         decoy.when(self.translation_file_service.exists_source_corpus()).then_return(True)
         decoy.when(self.translation_file_service.exists_target_corpus()).then_return(True)
 
+        decoy.when(self.translation_file_service.count_source_pretranslations()).then_return(pretranslation_count)
         decoy.when(self.translation_file_service.get_source_pretranslations()).then_do(
             lambda: ContextManagedGenerator(
                 (
-                    pi
-                    for pi in [
-                        PretranslationInfo(
-                            corpusId="corpus1",
-                            textId="text1",
-                            sourceRefs=["ref1"],
-                            targetRefs=["ref1"],
-                            translation="Por favor, tengo reservada una habitación.",
-                            sourceTokens=[],
-                            translationTokens=[],
-                            alignment="",
-                            sequenceConfidence=0.5,
-                        )
-                    ]
+                    PretranslationInfo(
+                        corpusId="corpus1",
+                        textId=f"text{i}",
+                        sourceRefs=[f"ref{i}"],
+                        targetRefs=[f"ref{i}"],
+                        translation="Por favor, tengo reservada una habitación.",
+                        sourceTokens=[],
+                        translationTokens=[],
+                        alignment="",
+                        sequenceConfidence=0.5,
+                    )
+                    for i in range(1, pretranslation_count + 1)
                 )
             )
         )
@@ -166,7 +173,7 @@ class _TestEnvironment:
                     "src_lang": "es",
                     "trg_lang": "en",
                     "save_model": "save-model",
-                    "inference_batch_size": 100,
+                    "inference_batch_size": inference_batch_size,
                     "align_pretranslations": True,
                 }
             ),
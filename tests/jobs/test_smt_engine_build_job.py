@@ -1,17 +1,19 @@
 import json
+import os
 from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, List, Optional, Sequence, Union
 
 from decoy import Decoy, matchers
 from pytest import raises
 from testutils.mock_settings import MockSettings
 
 from machine.annotations import Range
-from machine.corpora import DictionaryTextCorpus, MemoryText, TextRow
+from machine.corpora import DictionaryTextCorpus, MemoryText, ParallelTextCorpus, TextCorpus, TextRow
 from machine.jobs import DictToJsonWriter, PretranslationInfo, SmtEngineBuildJob, SmtModelFactory
 from machine.jobs.translation_file_service import TranslationFileService
+from machine.tokenization import Detokenizer, Tokenizer
 from machine.translation import (
     Phrase,
     Trainer,
@@ -19,10 +21,11 @@ from machine.translation import (
     TranslationResult,
     TranslationSources,
     Truecaser,
+    UnigramTruecaser,
     WordAlignmentMatrix,
 )
 from machine.translation.translation_engine import TranslationEngine
-from machine.utils import CanceledError, ContextManagedGenerator
+from machine.utils import CanceledError, ContextManagedGenerator, ProgressStatus
 
 
 def test_run(decoy: Decoy) -> None:
@@ -38,6 +41,25 @@ def test_run(decoy: Decoy) -> None:
     )
 
 
+def test_run_parallel(decoy: Decoy, tmp_path: Path) -> None:
+    env = _TestEnvironment(
+        decoy,
+        smt_model_factory=_TestSmtModelFactory(tmp_path),
+        pretranslation_count=7,
+        inference_batch_size=2,
+        inference_workers=2,
+    )
+    env.job.run()
+
+    pretranslations = json.loads(env.target_pretranslations)
+    assert [pi["textId"] for pi in pretranslations] == [f"text{i}" for i in range(1, 8)]
+    assert all(pi["translation"] == "POR FAVOR, TENGO RESERVADA UNA HABITACIÓN." for pi in pretranslations)
+    # every worker closes its engine when the pool shuts down
+    created_pids = {p.suffix for p in tmp_path.glob("created.*")}
+    assert len(created_pids) > 0
+    assert {p.suffix for p in tmp_path.glob("closed.*")} == created_pids
+
+
 def test_cancel(decoy: Decoy) -> None:
     env = _TestEnvironment(decoy)
     checker = _CancellationChecker(3)
@@ -48,7 +70,14 @@ def test_cancel(decoy: Decoy) -> None:
 
 
 class _TestEnvironment:
-    def __init__(self, decoy: Decoy) -> None:
+    def __init__(
+        self,
+        decoy: Decoy,
+        smt_model_factory: Optional[SmtModelFactory] = None,
+        pretranslation_count: int = 1,
+        inference_batch_size: int = 100,
+        inference_workers: int = 1,
+    ) -> None:
         self.model_trainer = decoy.mock(cls=Trainer)
         decoy.when(self.model_trainer.__enter__()).then_return(self.model_trainer)
         stats = TrainStats()
@@ -88,18 +117,21 @@ class _TestEnvironment:
         decoy.when(self.truecaser_trainer.__enter__()).then_return(self.truecaser_trainer)
         self.truecaser = decoy.mock(cls=Truecaser)
 
-        self.smt_model_factory = decoy.mock(cls=SmtModelFactory)
-        decoy.when(self.smt_model_factory.create_model_trainer(matchers.Anything(), matchers.Anything())).then_return(
-            self.model_trainer
-        )
-        decoy.when(
-            self.smt_model_factory.create_engine(matchers.Anything(), matchers.Anything(), matchers.Anything())
-        ).then_return(self.engine)
-        decoy.when(
-            self.smt_model_factory.create_truecaser_trainer(matchers.Anything(), matchers.Anything())
-        ).then_return(self.truecaser_trainer)
-        decoy.when(self.smt_model_factory.create_truecaser()).then_return(self.truecaser)
-        decoy.when(self.smt_model_factory.save_model()).then_return(Path("model.zip"))
+        if smt_model_factory is None:
+            self.smt_model_factory: SmtModelFactory = decoy.mock(cls=SmtModelFactory)
+            decoy.when(
+                self.smt_model_factory.create_model_trainer(matchers.Anything(), matchers.Anything())
+            ).then_return(self.model_trainer)
+            decoy.when(
+                self.smt_model_factory.create_engine(matchers.Anything(), matchers.Anything(), matchers.Anything())
+            ).then_return(self.engine)
+            decoy.when(
+                self.smt_model_factory.create_truecaser_trainer(matchers.Anything(), matchers.Anything())
+            ).then_return(self.truecaser_trainer)
+            decoy.when(self.smt_model_factory.create_truecaser()).then_return(self.truecaser)
+            decoy.when(self.smt_model_factory.save_model()).then_return(Path("model.zip"))
+        else:
+            self.smt_model_factory = smt_model_factory
 
         self.translation_file_service = decoy.mock(cls=TranslationFileService)
         decoy.when(self.translation_file_service.create_source_corpus()).then_return(
@@ -128,23 +160,22 @@ class _TestEnvironment:
         )
         decoy.when(self.translation_file_service.exists_source_corpus()).then_return(True)
         decoy.when(self.translation_file_service.exists_target_corpus()).then_return(True)
+        decoy.when(self.translation_file_service.count_source_pretranslations()).then_return(pretranslation_count)
         decoy.when(self.translation_file_service.get_source_pretranslations()).then_do(
             lambda: ContextManagedGenerator(
                 (
-                    pi
-                    for pi in [
-                        PretranslationInfo(
-                            corpusId="corpus1",
-                            textId="text1",
-                            sourceRefs=["ref1"],
-                            targetRefs=["ref1"],
-                            translation="Por favor, tengo reservada una habitación.",
-                            sourceTokens=[],
-                            translationTokens=[],
-                            alignment="",
-                            sequenceConfidence=0.5,
-                        )
-                    ]
+                    PretranslationInfo(
+                        corpusId="corpus1",
+                        textId=f"text{i}",
+                        sourceRefs=[f"ref{i}"],
+                        targetRefs=[f"ref{i}"],
+                        translation="Por favor, tengo reservada una habitación.",
+                        sourceTokens=[],
+                        translationTokens=[],
+                        alignment="",
+                        sequenceConfidence=0.5,
+                    )
+                    for i in range(1, pretranslation_count + 1)
                 )
             )
         )
@@ -167,8 +198,8 @@ class _TestEnvironment:
             MockSettings(
                 {
                     "build_id": "mybuild",
-                    "inference_batch_size": 100,
-                    "thot_mt": {"tokenizer": "latin"},
+                    "inference_batch_size": inference_batch_size,
+                    "thot_mt": {"tokenizer": "latin", "inference_workers": inference_workers},
                     "align_pretranslations": False,
                 }
             ),
@@ -186,3 +217,93 @@ class _CancellationChecker:
         self._call_count += 1
         if self._call_count == self._raise_count:
             raise CanceledError
+
+
+class _TestTrainer(Trainer):
+    def __init__(self) -> None:
+        self._stats = TrainStats()
+        self._stats.train_corpus_size = 3
+        self._stats.metrics["bleu"] = 30.0
+
+    def train(
+        self,
+        progress: Optional[Callable[[ProgressStatus], None]] = None,
+        check_canceled: Optional[Callable[[], None]] = None,
+    ) -> None:
+        pass
+
+    def save(self) -> None:
+        pass
+
+    @property
+    def stats(self) -> TrainStats:
+        return self._stats
+
+
+class _UppercaseEngine(TranslationEngine):
+    def __init__(self, engine_log_dir: Optional[Path] = None) -> None:
+        self._engine_log_dir = engine_log_dir
+        if self._engine_log_dir is not None:
+            (self._engine_log_dir / f"created.{os.getpid()}").touch()
+
+    def close(self) -> None:
+        if self._engine_log_dir is not None:
+            (self._engine_log_dir / f"closed.{os.getpid()}").touch()
+
+    def translate(self, segment: Union[str, Sequence[str]]) -> TranslationResult:
+        return self.translate_batch([segment])[0]
+
+    def translate_n(self, n: int, segment: Union[str, Sequence[str]]) -> Sequence[TranslationResult]:
+        return [self.translate(segment)]
+
+    def translate_batch(self, segments: Sequence[Union[str, Sequence[str]]]) -> Sequence[TranslationResult]:
+        results: List[TranslationResult] = []
+        for segment in segments:
+            tokens = segment.split() if isinstance(segment, str) else list(segment)
+            results.append(
+                TranslationResult(
+                    translation=" ".join(tokens).upper(),
+                    source_tokens=tokens,
+                    target_tokens=[t.upper() for t in tokens],
+                    confidences=[1.0] * len(tokens),
+                    sequence_confidence=1.0,
+                    sources=[TranslationSources.SMT] * len(tokens),
+                    alignment=WordAlignmentMatrix.from_word_pairs(
+                        len(tokens), len(tokens), {(i, i) for i in range(len(tokens))}
+                    ),
+                    phrases=[Phrase(Range.create(0, len(tokens)), len(tokens))],
+                )
+            )
+        return results
+
+    def translate_n_batch(
+        self, n: int, segments: Sequence[Union[str, Sequence[str]]]
+    ) -> Sequence[Sequence[TranslationResult]]:
+        return [[result] for result in self.translate_batch(segments)]
+
+
+class _TestSmtModelFactory(SmtModelFactory):
+    def __init__(self, engine_log_dir: Optional[Path] = None) -> None:
+        super().__init__(None)
+        # the engines are created in worker processes, so they record their lifetime as files
+        self._engine_log_dir = engine_log_dir
+
+    def create_model_trainer(self, tokenizer: Tokenizer[str, int, str], corpus: ParallelTextCorpus) -> Trainer:
+        return _TestTrainer()
+
+    def create_engine(
+        self,
+        tokenizer: Tokenizer[str, int, str],
+        detokenizer: Detokenizer[str, str],
+        truecaser: Optional[Truecaser] = None,
+    ) -> TranslationEngine:
+        return _UppercaseEngine(self._engine_log_dir)
+
+    def create_truecaser_trainer(self, tokenizer: Tokenizer[str, int, str], target_corpus: TextCorpus) -> Trainer:
+        return _TestTrainer()
+
+    def create_truecaser(self) -> Truecaser:
+        return UnigramTruecaser()
+
+    def save_model(self) -> Path:
+        return Path("model.zip")
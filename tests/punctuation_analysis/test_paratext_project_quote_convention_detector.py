@@ -116,6 +116,73 @@ def test_get_quote_convention_weighted_average_of_multiple_books() -> None:
     )
 
 
+def test_get_quote_convention_parallel() -> None:
+    env = _TestEnvironment(
+        files={
+            "41MATTest.SFM": rf"""\id MAT
+{get_test_chapter(1, standard_english_quote_convention)}""",
+            "42MRKTest.SFM": rf"""\id MRK
+{get_test_chapter(1, standard_french_quote_convention)}
+{get_test_chapter(2, standard_french_quote_convention)}""",
+            "43LUKTest.SFM": r"""\id LUK
+\c 1
+\v 1 This "sentence uses a different" convention""",
+        }
+    )
+    serial_analysis = env.get_quote_convention()
+    parallel_analysis = env.get_quote_convention(max_workers=2)
+
+    assert parallel_analysis.best_quote_convention == serial_analysis.best_quote_convention
+    assert parallel_analysis.best_quote_convention_score == serial_analysis.best_quote_convention_score
+    assert parallel_analysis.best_quote_convention_margin == serial_analysis.best_quote_convention_margin
+    assert parallel_analysis.analysis_summary == serial_analysis.analysis_summary
+
+
+def test_get_quote_convention_parallel_by_chapter() -> None:
+    env = _TestEnvironment(
+        files={
+            "41MATTest.SFM": rf"""\id MAT
+{get_test_chapter(1, standard_english_quote_convention)}""",
+            "42MRKTest.SFM": rf"""\id MRK
+{get_test_chapter(1, standard_english_quote_convention)}
+{get_test_chapter(2, standard_french_quote_convention)}
+{get_test_chapter(3, standard_english_quote_convention)}""",
+        }
+    )
+    serial_analysis = env.get_quote_convention("MAT;MRK2")
+    parallel_analysis = env.get_quote_convention("MAT;MRK2", max_workers=2)
+
+    assert parallel_analysis.best_quote_convention == serial_analysis.best_quote_convention
+    assert parallel_analysis.best_quote_convention_score == serial_analysis.best_quote_convention_score
+    assert parallel_analysis.analysis_summary == serial_analysis.analysis_summary
+
+
+def test_get_quote_convention_early_stopping() -> None:
+    files = {
+        f"{book_num}{book_id}Test.SFM": rf"""\id {book_id}
+{get_test_chapter(1, standard_english_quote_convention)}"""
+        for book_num, book_id in [("41", "MAT"), ("42", "MRK"), ("43", "LUK"), ("44", "JHN"), ("45", "ACT")]
+    }
+    env = _TestEnvironment(files=files)
+    analysis = env.get_quote_convention(early_stopping_book_count=2)
+
+    assert analysis.best_quote_convention is not None
+    assert analysis.best_quote_convention.name == "standard_english"
+    assert (
+        analysis.analysis_summary
+        == "The most common level 1 quotation marks are “ (15 of 15 opening marks) and ” (15 of 15 closing marks)"
+    )
+
+    analysis = env.get_quote_convention(max_workers=2, early_stopping_book_count=2)
+
+    assert analysis.best_quote_convention is not None
+    assert analysis.best_quote_convention.name == "standard_english"
+    assert (
+        analysis.analysis_summary
+        == "The most common level 1 quotation marks are “ (15 of 15 opening marks) and ” (15 of 15 closing marks)"
+    )
+
+
 class _TestEnvironment:
     def __init__(
         self,
@@ -130,11 +197,18 @@ class _TestEnvironment:
     def detector(self) -> ParatextProjectQuoteConventionDetector:
         return self._detector
 
-    def get_quote_convention(self, scripture_range: Optional[str] = None) -> QuoteConventionAnalysis:
+    def get_quote_convention(
+        self,
+        scripture_range: Optional[str] = None,
+        max_workers: int = 1,
+        early_stopping_book_count: Optional[int] = None,
+    ) -> QuoteConventionAnalysis:
         chapters: Optional[Dict[int, List[int]]] = None
         if scripture_range is not None:
             chapters = get_chapters(scripture_range, ORIGINAL_VERSIFICATION)
-        return self.detector.get_quote_convention_analysis(include_chapters=chapters)
+        return self.detector.get_quote_convention_analysis(
+            include_chapters=chapters, max_workers=max_workers, early_stopping_book_count=early_stopping_book_count
+        )
 
 
 def get_test_chapter(number: int, quote_convention: Optional[QuoteConvention]) -> str:
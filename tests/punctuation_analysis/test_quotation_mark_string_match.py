@@ -1,5 +1,9 @@
+from typing import List
+
 import regex
+from testutils.corpora_test_helpers import USFM_TEST_PROJECT_PATH
 
+from machine.corpora import parse_usfm
 from machine.punctuation_analysis import (
     QuotationMarkDirection,
     QuotationMarkMetadata,
@@ -9,6 +13,7 @@ from machine.punctuation_analysis import (
     SingleLevelQuoteConvention,
     TextSegment,
     UsfmMarkerType,
+    UsfmStructureExtractor,
 )
 
 
@@ -459,3 +464,41 @@ def test_has_quote_introducer_in_leading_substring() -> None:
 
     quotation_mark_string_match = QuotationMarkStringMatch(TextSegment.Builder().set_text("sample, text").build(), 8, 9)
     assert quotation_mark_string_match.has_quote_introducer_in_leading_substring()
+
+
+def test_leading_and_trailing_substring_checks_match_substrings() -> None:
+    letter_pattern = QuotationMarkStringMatch._LETTER_PATTERN
+    quote_introducer_pattern = QuotationMarkStringMatch._QUOTE_INTRODUCER_PATTERN
+
+    text_segments = _get_test_project_text_segments()
+    text_segments.extend(
+        TextSegment.Builder().set_text(text).build()
+        for text in [
+            "He said, \u201cno\u201d",
+            "He said:\u00a0\u2003\u201cno\u201d",
+            ",,\n\u201c, :\u201c",
+            "12 \u201c34\u201d 56 \u2018\u2019 ,",
+            "\U0001E200\u201c\u201d\U0001E28F",
+            "   ",
+        ]
+    )
+    for text_segment in text_segments:
+        text = text_segment.text
+        for index in range(len(text)):
+            match = QuotationMarkStringMatch(text_segment, index, index + 1)
+            assert match.has_letter_in_leading_substring() == (letter_pattern.search(text[:index]) is not None)
+            assert match.has_letter_in_trailing_substring() == (letter_pattern.search(text[index + 1 :]) is not None)
+            assert match.has_quote_introducer_in_leading_substring() == (
+                quote_introducer_pattern.search(text[:index]) is not None
+            )
+
+
+def _get_test_project_text_segments() -> List[TextSegment]:
+    text_segments: List[TextSegment] = []
+    for path in sorted(USFM_TEST_PROJECT_PATH.glob("*.SFM")):
+        usfm_structure_extractor = UsfmStructureExtractor()
+        parse_usfm(path.read_text(encoding="utf-8-sig"), usfm_structure_extractor)
+        for chapter in usfm_structure_extractor.get_chapters():
+            for verse in chapter.verses:
+                text_segments.extend(verse.text_segments)
+    return text_segments
@@ -722,6 +722,45 @@ def test_update_quotation_marks() -> None:
     assert single_character_quotation_marks[3].text_segment == single_character_text_segment
 
 
+def test_update_quotation_marks_in_multiple_text_segments() -> None:
+    quote_convention_changer: QuoteConventionChangingUsfmUpdateBlockHandler = (
+        create_quote_convention_changing_usfm_update_block_handler("typewriter_french", "standard_english")
+    )
+
+    first_text_segment: TextSegment = TextSegment.Builder().set_text("<<a <b> c").build()
+    second_text_segment: TextSegment = TextSegment.Builder().set_text("d <e> f>>").build()
+    quotation_marks: List[QuotationMarkMetadata] = [
+        QuotationMarkMetadata("<<", 1, QuotationMarkDirection.OPENING, first_text_segment, 0, 2),
+        QuotationMarkMetadata("<", 2, QuotationMarkDirection.OPENING, first_text_segment, 4, 5),
+        QuotationMarkMetadata(">", 2, QuotationMarkDirection.CLOSING, first_text_segment, 6, 7),
+        QuotationMarkMetadata("<", 2, QuotationMarkDirection.OPENING, second_text_segment, 2, 3),
+        QuotationMarkMetadata(">", 2, QuotationMarkDirection.CLOSING, second_text_segment, 4, 5),
+        QuotationMarkMetadata(">>", 1, QuotationMarkDirection.CLOSING, second_text_segment, 7, 9),
+    ]
+
+    quote_convention_changer._update_quotation_marks(quotation_marks)
+
+    assert first_text_segment.text == "\u201ca \u2018b\u2019 c"
+    assert second_text_segment.text == "d \u2018e\u2019 f\u201d"
+    assert [(qm.start_index, qm.end_index) for qm in quotation_marks] == [
+        (0, 1),
+        (3, 4),
+        (5, 6),
+        (2, 3),
+        (4, 5),
+        (7, 8),
+    ]
+
+
+def test_many_quotation_marks_in_verse() -> None:
+    input_usfm = "\\c 1\n\\v 1 " + "He said, <<Go <now> and see>>. " * 2500 + "\n"
+    expected_usfm = "\\c 1\n\\v 1 " + ("He said, \u201cGo \u2018now\u2019 and see\u201d. " * 2500).strip()
+
+    observed_usfm = change_quotation_marks(input_usfm, "typewriter_french", "standard_english")
+    assert_usfm_equal(observed_usfm, expected_usfm)
+    assert observed_usfm.count("\u2019") == 2500
+
+
 def test_check_for_chapter_change() -> None:
     quote_convention_changer: QuoteConventionChangingUsfmUpdateBlockHandler = (
         create_quote_convention_changing_usfm_update_block_handler("standard_english", "standard_english")
@@ -1,6 +1,9 @@
+import random
+
 from pytest import approx
 
 from machine.punctuation_analysis import (
+    STANDARD_QUOTE_CONVENTIONS,
     QuotationMarkDirection,
     QuotationMarkMetadata,
     QuotationMarkTabulator,
@@ -1324,3 +1327,54 @@ def test_find_most_similar_convention() -> None:
         None,
         float("-inf"),
     )
+
+
+def test_score_all_quote_conventions_matches_calculate_similarity() -> None:
+    rand = random.Random(0)
+    quotation_marks = ["“", "”", "‘", "’", "«", "»", "„", '"', "'", ""]
+    for _ in range(50):
+        tabulator = QuotationMarkTabulator()
+        tabulator.tabulate(
+            [
+                QuotationMarkMetadata(
+                    rand.choice(quotation_marks),
+                    rand.randint(0, 6),
+                    rand.choice(list(QuotationMarkDirection)),
+                    TextSegment.Builder().build(),
+                    0,
+                    1,
+                )
+                for _ in range(rand.randint(0, 100))
+            ]
+        )
+
+        analysis = STANDARD_QUOTE_CONVENTIONS.score_all_quote_conventions(tabulator)
+        best_quote_convention, best_similarity = STANDARD_QUOTE_CONVENTIONS.find_most_similar_convention(tabulator)
+
+        expected_similarities = [tabulator.calculate_similarity(c) for c in STANDARD_QUOTE_CONVENTIONS._conventions]
+        assert [
+            analysis._convention_scores[c] for c in STANDARD_QUOTE_CONVENTIONS._conventions
+        ] == expected_similarities
+        assert best_similarity == max(expected_similarities)
+        assert (
+            best_quote_convention
+            is STANDARD_QUOTE_CONVENTIONS._conventions[expected_similarities.index(best_similarity)]
+        )
+
+
+def test_quotation_mark_depth_lookups_match_conventions() -> None:
+    quotation_marks = ["“", "”", "‘", "’", "«", "»", "„", '"', "'", "", "x"]
+    for quotation_mark in quotation_marks:
+        for direction in QuotationMarkDirection:
+            expected_depths = set()
+            for convention in STANDARD_QUOTE_CONVENTIONS._conventions:
+                expected_depths.update(convention.get_possible_depths(quotation_mark, direction))
+            assert STANDARD_QUOTE_CONVENTIONS.get_possible_depths(quotation_mark, direction) == expected_depths
+
+            for depth in range(0, 7):
+                assert STANDARD_QUOTE_CONVENTIONS.metadata_matches_quotation_mark(
+                    quotation_mark, depth, direction
+                ) == any(
+                    c.get_expected_quotation_mark(depth, direction) == quotation_mark
+                    for c in STANDARD_QUOTE_CONVENTIONS._conventions
+                )
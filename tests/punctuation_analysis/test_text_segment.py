@@ -276,3 +276,17 @@ def test_replace_substring() -> None:
 
     text_segment.replace_substring(6, 6, "-")
     assert text_segment.text == "prefix- new\u2019 suffix"
+
+
+def test_replace_substrings() -> None:
+    usfm_token = UsfmToken(type=UsfmTokenType.TEXT, text="<<a <b> c>>")
+    text_segment = TextSegment.Builder().set_text("<<a <b> c>>").set_usfm_token(usfm_token).build()
+    text_segment.replace_substrings([(0, 2, "\u201c"), (4, 5, "\u2018"), (6, 7, "\u2019"), (9, 11, "\u201d")])
+    assert text_segment.text == "\u201ca \u2018b\u2019 c\u201d"
+    assert usfm_token.text == "\u201ca \u2018b\u2019 c\u201d"
+
+    text_segment.replace_substrings([])
+    assert text_segment.text == "\u201ca \u2018b\u2019 c\u201d"
+
+    text_segment.replace_substrings([(0, 0, "prefix "), (2, 3, ""), (9, 9, " suffix")])
+    assert text_segment.text == "prefix \u201ca\u2018b\u2019 c\u201d suffix"
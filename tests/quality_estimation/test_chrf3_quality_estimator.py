@@ -1,7 +1,12 @@
-from pytest import approx
+import math
+import random
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from pytest import MonkeyPatch, approx
 
 from machine.corpora import MultiKeyRef, ScriptureRef
-from machine.quality_estimation import ChrF3QualityEstimator, UsabilityLabel
+from machine.quality_estimation import ChrF3QualityEstimator, UsabilityLabel, chrf3_quality_estimator
 from machine.scripture import VerseRef
 
 
@@ -94,3 +99,94 @@ def test_chrf3_quality_estimator_verses() -> None:
     assert usability_books[0].projected_chrf3 == approx(42.28, abs=0.01)
     assert usability_books[0].usability == approx(0.647, abs=0.001)
     assert usability_books[0].confidence == approx(0.514, abs=0.001)
+
+
+def test_chrf3_quality_estimator_verses_streamed(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(chrf3_quality_estimator, "_CHUNK_SIZE", 7)
+    quality_estimation = ChrF3QualityEstimator(slope=109.6145, intercept=-14.0633)
+
+    rng = random.Random(1)
+    confidences = [
+        (ScriptureRef(VerseRef(book, chapter, verse)), rng.uniform(0.2, 0.8))
+        for book in [2, 1, 3]
+        for chapter in range(1, 4)
+        for verse in range(1, rng.randint(2, 10))
+    ]
+    # a non-positive confidence results in a book and chapter confidence of zero
+    confidences[-1] = (confidences[-1][0], 0.0)
+    # chapters are reported in the order that their books are first seen
+    confidences.append((ScriptureRef(VerseRef(2, 4, 1)), 0.5))
+
+    usability_segments, usability_chapters, usability_books = quality_estimation.estimate_quality(iter(confidences))
+    expected_segments, expected_chapters, expected_books = _estimate_quality_scripture(quality_estimation, confidences)
+
+    assert len(usability_segments) == len(expected_segments)
+    for segment, (scripture_ref, label, usability, projected_chrf3, confidence) in zip(
+        usability_segments, expected_segments
+    ):
+        assert segment.scripture_ref == scripture_ref
+        assert segment.label == label
+        assert segment.usability == approx(usability)
+        assert segment.projected_chrf3 == approx(projected_chrf3)
+        assert segment.confidence == confidence
+
+    assert [(c.book, c.chapter) for c in usability_chapters] == [key for key, *_ in expected_chapters]
+    for chapter, (_, label, usability, projected_chrf3, confidence) in zip(usability_chapters, expected_chapters):
+        assert chapter.label == label
+        assert chapter.usability == approx(usability)
+        assert chapter.projected_chrf3 == approx(projected_chrf3)
+        assert chapter.confidence == approx(confidence)
+
+    assert [b.book for b in usability_books] == ["EXO", "GEN", "LEV"]
+    assert [b.book for b in usability_books] == [key for key, *_ in expected_books]
+    for book, (_, label, usability, projected_chrf3, confidence) in zip(usability_books, expected_books):
+        assert book.label == label
+        assert book.usability == approx(usability)
+        assert book.projected_chrf3 == approx(projected_chrf3)
+        assert book.confidence == approx(confidence)
+    assert usability_books[-1].confidence == 0.0
+
+
+def test_chrf3_quality_estimator_empty() -> None:
+    quality_estimation = ChrF3QualityEstimator(slope=109.6145, intercept=-14.0633)
+
+    assert quality_estimation.estimate_quality(iter([])) == ([], [], [])
+    assert quality_estimation.estimate_quality([], MultiKeyRef) == ([], [])
+
+
+def _estimate_quality_scripture(
+    quality_estimation: ChrF3QualityEstimator, confidences: List[Tuple[ScriptureRef, float]]
+) -> Tuple[list, list, list]:
+    def usable_probability(chrf3: float) -> float:
+        usable, unusable = quality_estimation.usable, quality_estimation.unusable
+        usable_weight = math.exp(-((chrf3 - usable.mean) ** 2) / (2 * usable.variance)) * usable.count
+        unusable_weight = math.exp(-((chrf3 - unusable.mean) ** 2) / (2 * unusable.variance)) * unusable.count
+        return usable_weight / (usable_weight + unusable_weight)
+
+    def project(confidence: float) -> float:
+        return 109.6145 * confidence - 14.0633
+
+    def gmean(values: List[float]) -> float:
+        if any(x <= 0 for x in values):
+            return 0.0
+        return math.exp(sum(math.log(x) for x in values) / len(values))
+
+    segments = []
+    by_book: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+    by_chapter: Dict[str, Dict[int, List[Tuple[float, float]]]] = defaultdict(lambda: defaultdict(list))
+    for scripture_ref, confidence in confidences:
+        probability = usable_probability(project(confidence))
+        label = quality_estimation.segment_thresholds.return_label(probability)
+        segments.append((scripture_ref, label, probability, project(confidence), confidence))
+        by_book[scripture_ref.book].append((confidence, probability))
+        by_chapter[scripture_ref.book][scripture_ref.chapter_num].append((confidence, probability))
+
+    def group(key: Any, values: List[Tuple[float, float]]) -> tuple:
+        confidence = gmean([c for c, _ in values])
+        probability = sum(p for _, p in values) / len(values)
+        label = quality_estimation.book_thresholds.return_label(probability)
+        return key, label, probability, project(confidence), confidence
+
+    chapters = [group((b, c), values) for b, chapter_dict in by_chapter.items() for c, values in chapter_dict.items()]
+    books = [group(b, values) for b, values in by_book.items()]
+    return segments, chapters, books
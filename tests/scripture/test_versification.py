@@ -1,6 +1,7 @@
 from io import BytesIO, StringIO
+from uuid import uuid4
 
-from pytest import raises
+from pytest import MonkeyPatch, raises
 from testutils.corpora_test_helpers import CUSTOM_VERS_PATH
 
 from machine.scripture import (
@@ -13,6 +14,7 @@ from machine.scripture import (
     VerseRef,
     Versification,
     VersificationType,
+    verse_ref,
 )
 
 
@@ -123,3 +125,33 @@ def test_has_cross_book_mappings() -> None:
     assert not RUSSIAN_PROTESTANT_VERSIFICATION.has_cross_book_mappings()
     assert VULGATE_VERSIFICATION.has_cross_book_mappings()
     assert VULGATE_VERSIFICATION.has_cross_book_mappings(ENGLISH_VERSIFICATION)
+
+
+def test_load_cached(monkeypatch: MonkeyPatch) -> None:
+    parse_count = 0
+    parse = verse_ref._parse_versification
+
+    def _parse_versification(*args, **kwargs) -> Versification:
+        nonlocal parse_count
+        parse_count += 1
+        return parse(*args, **kwargs)
+
+    fallback_name = f"custom-{uuid4()}"
+    data = CUSTOM_VERS_PATH.read_bytes()
+    expected = Versification(fallback_name, None, ENGLISH_VERSIFICATION)
+    expected = Versification.parse(StringIO(data.decode("utf-16")), None, expected, fallback_name)
+
+    monkeypatch.setattr(verse_ref, "_parse_versification", _parse_versification)
+    versification1 = Versification.load(BytesIO(data), ENGLISH_VERSIFICATION, fallback_name)
+    versification2 = Versification.load(BytesIO(data), ENGLISH_VERSIFICATION, fallback_name)
+    assert parse_count == 1
+    assert versification2 is versification1
+    assert versification1 == expected
+
+    versification3 = Versification.load(BytesIO(data), ORIGINAL_VERSIFICATION, fallback_name)
+    assert parse_count == 2
+    assert versification3 != versification1
+
+    versification4 = Versification.load(BytesIO(data + b"\n\x00"), ENGLISH_VERSIFICATION, fallback_name)
+    assert parse_count == 3
+    assert versification4 == versification1
@@ -1,12 +1,15 @@
-from typing import Iterable, List, Optional, Tuple
+import random
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from pytest import approx
+import numpy as np
+from pytest import approx, mark
 
 from machine.sequence_alignment import (
     Alignment,
     AlignmentCell,
     AlignmentMode,
     PairwiseAlignmentAlgorithm,
+    PairwiseAlignmentScoreMatrices,
     PairwiseAlignmentScorer,
 )
 
@@ -58,6 +61,42 @@ class _ZeroMaxStringScorer(_StringScorer):
         return 0
 
 
+class _MatrixStringScorer(_StringScorer):
+    def get_score_matrices(
+        self, sequence1: str, items1: Sequence[str], sequence2: str, items2: Sequence[str]
+    ) -> Optional[PairwiseAlignmentScoreMatrices]:
+        shape = (len(items1) + 1, len(items2) + 1)
+        insertion = np.zeros(shape, dtype=np.int64)
+        deletion = np.zeros(shape, dtype=np.int64)
+        substitution = np.zeros(shape, dtype=np.int64)
+        expansion = np.zeros(shape, dtype=np.int64)
+        compression = np.zeros(shape, dtype=np.int64)
+        transposition = np.zeros(shape, dtype=np.int64)
+        for i in range(len(items1) + 1):
+            p = None if i == 0 else items1[i - 1]
+            for j in range(len(items2) + 1):
+                q = None if j == 0 else items2[j - 1]
+                if q is not None:
+                    insertion[i, j] = self.get_insertion_score(sequence1, p, sequence2, q)
+                if p is not None:
+                    deletion[i, j] = self.get_deletion_score(sequence1, p, sequence2, q)
+                if p is not None and q is not None:
+                    substitution[i, j] = self.get_substitution_score(sequence1, p, sequence2, q)
+                if p is not None and j >= 2:
+                    expansion[i, j] = self.get_expansion_score(sequence1, p, sequence2, items2[j - 2], items2[j - 1])
+                if i >= 2 and q is not None:
+                    compression[i, j] = self.get_compression_score(
+                        sequence1, items1[i - 2], items1[i - 1], sequence2, q
+                    )
+                if i >= 2 and j >= 2:
+                    transposition[i, j] = self.get_transposition_score(
+                        sequence1, items1[i - 2], items1[i - 1], sequence2, items2[j - 2], items2[j - 1]
+                    )
+        return PairwiseAlignmentScoreMatrices(
+            insertion, deletion, substitution, expansion=expansion, compression=compression, transposition=transposition
+        )
+
+
 def _get_chars(sequence: str) -> Tuple[Iterable[str], int, int]:
     return sequence, 0, len(sequence)
 
@@ -336,3 +375,69 @@ def test_semi_global_align_empty_sequence() -> None:
     assert len(alignments) == 1
     _assert_alignments_equal(alignments[0], _create_alignment("||", "||"))
     assert alignments[0].normalized_score == 0
+
+
+@mark.parametrize("mode", list(AlignmentMode))
+@mark.parametrize("expansion_compression_enabled", [False, True])
+@mark.parametrize("transposition_enabled", [False, True])
+def test_score_matrices_align(
+    mode: AlignmentMode, expansion_compression_enabled: bool, transposition_enabled: bool
+) -> None:
+    rand = random.Random(0)
+    pairs = [("car", "bar"), ("cart", "bar"), ("cart", "art"), ("start", "tan"), ("", ""), ("a", ""), ("", "ab")]
+    pairs += [
+        ("".join(rand.choices("abc", k=rand.randint(0, 12))), "".join(rand.choices("abc", k=rand.randint(0, 12))))
+        for _ in range(30)
+    ]
+
+    expected_paas = [
+        PairwiseAlignmentAlgorithm(
+            _StringScorer(),
+            sequence1,
+            sequence2,
+            _get_chars,
+            mode=mode,
+            expansion_compression_enabled=expansion_compression_enabled,
+            transposition_enabled=transposition_enabled,
+        )
+        for sequence1, sequence2 in pairs
+    ]
+    for paa in expected_paas:
+        paa.compute()
+
+    paas = [
+        PairwiseAlignmentAlgorithm(
+            _MatrixStringScorer(),
+            sequence1,
+            sequence2,
+            _get_chars,
+            mode=mode,
+            expansion_compression_enabled=expansion_compression_enabled,
+            transposition_enabled=transposition_enabled,
+        )
+        for sequence1, sequence2 in pairs
+    ]
+    PairwiseAlignmentAlgorithm.compute_batch(paas)
+
+    for paa, expected_paa in zip(paas, expected_paas):
+        assert paa.best_raw_score == expected_paa.best_raw_score
+        alignments = list(paa.get_alignments())
+        expected_alignments = list(expected_paa.get_alignments())
+        assert len(alignments) == len(expected_alignments)
+        for alignment, expected_alignment in zip(alignments, expected_alignments):
+            _assert_alignments_equal(alignment, expected_alignment)
+            assert alignment.raw_score == expected_alignment.raw_score
+            assert alignment.normalized_score == expected_alignment.normalized_score
+
+    # a single pair is computed the same way as a batch
+    paa = PairwiseAlignmentAlgorithm(
+        _MatrixStringScorer(),
+        "start",
+        "tan",
+        _get_chars,
+        mode=mode,
+        expansion_compression_enabled=expansion_compression_enabled,
+        transposition_enabled=transposition_enabled,
+    )
+    paa.compute()
+    assert paa.best_raw_score == expected_paas[3].best_raw_score
@@ -16,3 +16,13 @@ def test_detokenize_empty() -> None:
     detokenizer = SentencePieceDetokenizer()
     sentence = detokenizer.detokenize([])
     assert sentence == ""
+
+
+def test_detokenize_batch() -> None:
+    detokenizer = SentencePieceDetokenizer()
+    tokens = [
+        "▁In ▁particular , ▁the ▁actress es ▁play ▁a ▁major ▁role".split(),
+        [],
+        "▁staging .".split(),
+    ]
+    assert detokenizer.detokenize_batch(tokens) == [detokenizer.detokenize(t) for t in tokens]
@@ -1,3 +1,9 @@
+from random import Random
+from typing import List, Optional, Tuple
+
+import pytest
+
+from machine.annotations import Range
 from machine.tokenization import LatinWordTokenizer
 
 
@@ -165,3 +171,75 @@ def test_tokenize_url_at_end_of_sentence() -> None:
         "http://www.test.com/page.html?param=1",
         ".",
     ]
+
+
+@pytest.mark.parametrize("treat_apostrophe_as_single_quote", [False, True])
+def test_tokenize_matches_character_tokenizer(treat_apostrophe_as_single_quote: bool) -> None:
+    tokenizer = LatinWordTokenizer(["mr", "dr", "ms"], treat_apostrophe_as_single_quote)
+    char_tokenizer = _CharacterLatinWordTokenizer(["mr", "dr", "ms"], treat_apostrophe_as_single_quote)
+    for data in _generate_corpus(10_000):
+        assert list(tokenizer.tokenize(data)) == list(char_tokenizer.tokenize(data)), repr(data)
+        if len(data) > 2:
+            data_range = Range.create(1, len(data) - 1)
+            assert list(tokenizer.tokenize_as_ranges(data, data_range)) == list(
+                char_tokenizer.tokenize_as_ranges(data, data_range)
+            ), repr(data)
+
+
+class _CharacterLatinWordTokenizer(LatinWordTokenizer):
+    # overriding the character handling disables the token regexes
+    def _process_character(
+        self, data: str, data_range: Range[int], ctxt: LatinWordTokenizer._TokenizeContext
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        return super()._process_character(data, data_range, ctxt)
+
+    def _is_whitespace(self, c: str) -> bool:
+        return super()._is_whitespace(c)
+
+
+_CORPUS_WORDS = [
+    "Mr.",
+    "dr.",
+    "isn't",
+    "Moses'",
+    "'tis",
+    "ha''on",
+    "5,000.",
+    "$50",
+    "name@test.com",
+    "http://www.test.com/page.html?param=1.",
+    "www.test.com,",
+    "snake_case",
+    "e.g.",
+    "co-op",
+    "--",
+    "...",
+    "“Meow”",
+    "‘Meow’",
+    "(yes)",
+    "é",
+    "über",
+    "αβγ",
+    "中文",
+    "😀",
+    "a\u0301",
+]
+_CORPUS_CHARS = (
+    "abcdeXYZ019 .,;:!?'\"_-&=@()[]{}<>/$%#*+~`^|\\\u00ad\u00b7\u2010\u2011\u2019\u2027\u2018\u201c\u201d"
+    + "\u0301\u1b4e\u2e5e\u00a0\u3000\u200b\ufeff\t\n\r\x00\x07\x1c"
+)
+
+
+def _generate_corpus(count: int) -> List[str]:
+    rand = Random(1234)
+    corpus: List[str] = []
+    for _ in range(count):
+        parts: List[str] = []
+        for _ in range(rand.randrange(0, 12)):
+            if rand.random() < 0.5:
+                parts.append(rand.choice(_CORPUS_WORDS))
+            else:
+                parts.append("".join(rand.choices(_CORPUS_CHARS, k=rand.randrange(1, 6))))
+            parts.append(rand.choice([" ", " ", "", "\u200b", "  "]))
+        corpus.append("".join(parts))
+    return corpus
@@ -0,0 +1,148 @@
+import random
+import time
+from collections import deque
+from typing import Any, Callable, List
+
+import pytest
+
+from machine.tokenization import LatinWordDetokenizer, StringDetokenizer, WhitespaceDetokenizer, ZwspWordDetokenizer
+from machine.tokenization.latin_word_detokenizer import QUOTATION_MARKS
+from machine.tokenization.string_detokenizer import DetokenizeOperation
+from machine.utils.string_utils import is_currency_symbol, is_punctuation
+
+VOCAB = ["the", "man", "said", ",", ".", "“", "”", '"', "'", "‘", "’", "(", ")", "$", "€", "5", "/", "\\", "?", "¿"]
+VOCAB += ["«", "»", "<", ">", "-", "—", " ", "　", "ไป", "ไหน", "។", "ជេង", "[", "]"]
+
+
+def test_latin_word_detokenizer_matches_reference() -> None:
+    detokenizer = LatinWordDetokenizer()
+    for tokens in _random_segments():
+        assert detokenizer.detokenize(tokens) == _detokenize_reference(detokenizer, tokens, _get_latin_operation)
+
+
+def test_zwsp_word_detokenizer_matches_reference() -> None:
+    detokenizer = ZwspWordDetokenizer()
+    for tokens in _random_segments():
+        assert detokenizer.detokenize(tokens) == _detokenize_reference(
+            detokenizer, tokens, _get_zwsp_operation, _get_zwsp_separator
+        )
+
+
+def test_whitespace_detokenizer_matches_reference() -> None:
+    detokenizer = WhitespaceDetokenizer()
+    for tokens in _random_segments():
+        assert detokenizer.detokenize(tokens) == _detokenize_reference(
+            detokenizer, tokens, lambda ctxt, token: DetokenizeOperation.NO_OPERATION
+        )
+
+
+def test_detokenize_batch() -> None:
+    segments = _random_segments()
+    for detokenizer in [LatinWordDetokenizer(), ZwspWordDetokenizer(), WhitespaceDetokenizer()]:
+        assert detokenizer.detokenize_batch(segments) == [detokenizer.detokenize(s) for s in segments]
+
+
+def test_detokenize_transform_token() -> None:
+    class UpperCaseDetokenizer(LatinWordDetokenizer):
+        def _transform_token(self, token: str) -> str:
+            return token.upper()
+
+    detokenizer = UpperCaseDetokenizer()
+    assert detokenizer.detokenize(["This", "is", "a", "“", "test", "”", "."]) == "THIS IS A “TEST”."
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "detokenizer",
+    [LatinWordDetokenizer(), ZwspWordDetokenizer(), WhitespaceDetokenizer()],
+    ids=lambda d: type(d).__name__,
+)
+def test_detokenize_batch_throughput(
+    detokenizer: StringDetokenizer, record_property: Callable[[str, object], None]
+) -> None:
+    segments = _random_segments(count=70_000)
+    assert sum(len(s) for s in segments) >= 1_000_000
+
+    start = time.perf_counter()
+    expected = [_detokenize_reference_for(detokenizer, s) for s in segments]
+    reference_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = detokenizer.detokenize_batch(segments)
+    elapsed = time.perf_counter() - start
+
+    assert actual == expected
+    assert elapsed < reference_elapsed
+    record_property("speedup", reference_elapsed / elapsed)
+
+
+def _random_segments(count: int = 1000) -> List[List[str]]:
+    rand = random.Random(1)
+    return [[rand.choice(VOCAB) for _ in range(rand.randint(0, 30))] for _ in range(count)]
+
+
+def _detokenize_reference_for(detokenizer: StringDetokenizer, tokens: List[str]) -> str:
+    if isinstance(detokenizer, ZwspWordDetokenizer):
+        return _detokenize_reference(detokenizer, tokens, _get_zwsp_operation, _get_zwsp_separator)
+    if isinstance(detokenizer, LatinWordDetokenizer):
+        return _detokenize_reference(detokenizer, tokens, _get_latin_operation)
+    return _detokenize_reference(detokenizer, tokens, lambda ctxt, token: DetokenizeOperation.NO_OPERATION)
+
+
+# the concatenation-based implementation that StringDetokenizer replaced
+def _detokenize_reference(detokenizer: StringDetokenizer, tokens: List[str], get_operation, get_separator=None) -> str:
+    ctxt = deque()
+    ops = [get_operation(ctxt, t) for t in tokens]
+    result = ""
+    for i in range(len(tokens)):
+        result += detokenizer._transform_token(tokens[i])
+
+        append_separator = True
+        if i + 1 == len(ops):
+            append_separator = False
+        elif ops[i + 1] in {DetokenizeOperation.MERGE_LEFT, DetokenizeOperation.MERGE_BOTH}:
+            append_separator = False
+        elif ops[i] in {DetokenizeOperation.MERGE_RIGHT, DetokenizeOperation.MERGE_BOTH}:
+            append_separator = False
+
+        if append_separator:
+            result += " " if get_separator is None else get_separator(tokens, ops, i)
+    return result
+
+
+def _get_latin_operation(ctxt: Any, token: str) -> DetokenizeOperation:
+    quotes: deque[str] = ctxt
+    c = token[0]
+    if is_currency_symbol(c) or c in {"(", "[", "{", "¿", "¡", "<"}:
+        return DetokenizeOperation.MERGE_RIGHT
+    elif c in QUOTATION_MARKS:
+        if len(quotes) == 0 or QUOTATION_MARKS[c] != QUOTATION_MARKS[quotes[-1]]:
+            quotes.append(c)
+            return DetokenizeOperation.MERGE_RIGHT
+        else:
+            quotes.pop()
+            return DetokenizeOperation.MERGE_LEFT
+    elif c in {"/", "\\"}:
+        return DetokenizeOperation.MERGE_BOTH
+    elif is_punctuation(c) or c == ">":
+        return DetokenizeOperation.MERGE_LEFT
+
+    return DetokenizeOperation.NO_OPERATION
+
+
+def _get_zwsp_operation(ctxt: Any, token: str) -> DetokenizeOperation:
+    if token[0].isspace():
+        return DetokenizeOperation.MERGE_BOTH
+    return _get_latin_operation(ctxt, token)
+
+
+def _get_zwsp_separator(tokens: List[str], ops: List[DetokenizeOperation], index: int) -> str:
+    if (
+        index < len(tokens) - 1
+        and ops[index + 1] == DetokenizeOperation.MERGE_RIGHT
+        and is_punctuation(tokens[index + 1][0])
+    ):
+        return " "
+    elif ops[index] == DetokenizeOperation.MERGE_LEFT and is_punctuation(tokens[index][0]):
+        return " "
+    return "\u200b"
@@ -0,0 +1,21 @@
+import sys
+
+from machine.tokenization import WhitespaceTokenizer
+from machine.tokenization.whitespace_tokenizer import NON_WHITESPACE_REGEX
+
+
+def test_tokenize() -> None:
+    tokenizer = WhitespaceTokenizer()
+    assert list(tokenizer.tokenize(" This  is\ta\u200btest.\ufeff\n")) == ["This", "is", "a", "test."]
+
+
+def test_tokenize_empty() -> None:
+    tokenizer = WhitespaceTokenizer()
+    assert not any(tokenizer.tokenize(""))
+
+
+def test_non_whitespace_regex_matches_is_whitespace() -> None:
+    tokenizer = WhitespaceTokenizer()
+    for code_point in range(sys.maxunicode + 1):
+        c = chr(code_point)
+        assert (NON_WHITESPACE_REGEX.match(c) is None) == tokenizer._is_whitespace(c), hex(code_point)
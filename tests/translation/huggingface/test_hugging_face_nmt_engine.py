@@ -6,7 +6,9 @@ if sys.platform == "darwin":
     skip("skipping Hugging Face tests on MacOS", allow_module_level=True)
 
 from math import exp, log
+from typing import List, Sequence, Union
 
+import torch
 from pytest import approx, mark, raises
 
 from machine.translation.huggingface import HuggingFaceNmtEngine
@@ -48,6 +50,25 @@ def test_translate_n_batch_beam(output_attentions: bool) -> None:
         assert results[1][1].sequence_confidence == approx(_get_sequence_confidence(results[0][0]), 0.01)
 
 
+def test_translate_n_batch_beam_batched() -> None:
+    segments = ["This is a test string", "Hello, world!", "Hi"]
+    with HuggingFaceNmtEngine("stas/tiny-m2m_100", src_lang="en", tgt_lang="es", num_beams=2, max_length=10) as engine:
+        expected = engine.translate_n_batch(n=2, segments=segments)
+
+    with HuggingFaceNmtEngine(
+        "stas/tiny-m2m_100", src_lang="en", tgt_lang="es", num_beams=2, max_length=10, batch_size=2
+    ) as engine:
+        results = engine.translate_n_batch(n=2, segments=segments)
+
+    assert len(results) == len(expected)
+    for segment_results, expected_segment_results in zip(results, expected):
+        assert len(segment_results) == 2
+        for result, expected_result in zip(segment_results, expected_segment_results):
+            assert result.translation == expected_result.translation
+            assert result.sequence_confidence == approx(expected_result.sequence_confidence, 0.01)
+            assert str(result.alignment) == str(expected_result.alignment)
+
+
 @mark.parametrize("output_attentions", [True, False])
 def test_translate_greedy(output_attentions: bool) -> None:
     with HuggingFaceNmtEngine(
@@ -60,6 +81,60 @@ def test_translate_greedy(output_attentions: bool) -> None:
         assert str(result.alignment) == ("2-0 2-1 2-2 2-3 4-4 4-5 4-6 4-7" if output_attentions else "")
 
 
+def test_translate_batch_by_length() -> None:
+    segments = ["This is a test string", "Hello, world!", "This is a much longer test string with more words", "Hi"]
+    with HuggingFaceNmtEngine("stas/tiny-m2m_100", src_lang="en", tgt_lang="es", max_length=10) as engine:
+        expected = engine.translate_batch(segments)
+
+    with HuggingFaceNmtEngine(
+        "stas/tiny-m2m_100",
+        src_lang="en",
+        tgt_lang="es",
+        max_length=10,
+        batch_size=2,
+        batch_by_length=True,
+        max_batch_tokens=16,
+    ) as engine:
+        results = engine.translate_batch(segments)
+
+    assert [r.translation for r in results] == [r.translation for r in expected]
+    assert [r.source_tokens for r in results] == [r.source_tokens for r in expected]
+
+
+def test_translate_batch_oom_backoff() -> None:
+    segments = ["This is a test string", "Hello, world!", "This is a much longer test string with more words", "Hi"] * 4
+    with HuggingFaceNmtEngine("stas/tiny-m2m_100", src_lang="en", tgt_lang="es", max_length=10) as engine:
+        expected = engine.translate_batch(segments)
+
+    with HuggingFaceNmtEngine(
+        "stas/tiny-m2m_100",
+        src_lang="en",
+        tgt_lang="es",
+        max_length=10,
+        batch_size=8,
+        oom_batch_size_backoff_mult=0.5,
+        oom_batch_size_probe_interval=2,
+    ) as engine:
+        try_translate_n_batch = engine._try_translate_n_batch
+        batch_sizes: List[int] = []
+
+        def fail_large_batches(n: int, segments: Sequence[Union[str, Sequence[str]]]):
+            batch_sizes.append(len(segments))
+            if len(segments) > 2:
+                raise torch.cuda.OutOfMemoryError()
+            return try_translate_n_batch(n, segments)
+
+        engine._try_translate_n_batch = fail_large_batches
+        results = engine.translate_batch(segments)
+
+        assert [r.translation for r in results] == [r.translation for r in expected]
+        assert batch_sizes[:3] == [8, 4, 2]
+        # larger batches are probed again after successful batches
+        assert batch_sizes.count(4) > 1
+        assert engine.batch_size == 2
+        assert engine.segments_per_second > 0
+
+
 @mark.parametrize("output_attentions", [True, False])
 def test_construct_invalid_lang(output_attentions: bool) -> None:
     with raises(ValueError):
@@ -1,6 +1,10 @@
+import random
 from typing import Sequence
 
+from pytest import MonkeyPatch
+
 from machine.translation import FuzzyEditDistanceWordAlignmentMethod
+from machine.translation.segment_scorer import SegmentScorer
 
 
 def test_align_last_src_first_trg() -> None:
@@ -13,3 +17,27 @@ def test_align_last_src_first_trg() -> None:
 
     matrix = method.align("A B".split(), "B C".split())
     assert str(matrix) == "1-0"
+
+
+def test_align_batch(monkeypatch: MonkeyPatch) -> None:
+    def score_selector(src_segment: Sequence[str], src_idx: int, trg_segment: Sequence[str], trg_idx: int) -> float:
+        if src_idx == -1 or trg_idx == -1:
+            return 0.1
+        return 0.9 if src_segment[src_idx].lower() == trg_segment[trg_idx].lower() else 0.1 + 0.01 * (src_idx % 5)
+
+    rand = random.Random(0)
+    segments = [
+        (
+            rand.choices("A B C D E".split(), k=rand.randint(1, 15)),
+            rand.choices("a b c d e".split(), k=rand.randint(1, 15)),
+        )
+        for _ in range(50)
+    ]
+    method = FuzzyEditDistanceWordAlignmentMethod(score_selector=score_selector)
+
+    matrices = method.align_batch(segments)
+
+    # align each segment pair with the score callbacks
+    monkeypatch.setattr(SegmentScorer, "get_score_matrices", lambda *args: None)
+    expected_matrices = [method.align(source_segment, target_segment) for source_segment, target_segment in segments]
+    assert matrices == expected_matrices
@@ -1,9 +1,11 @@
 from itertools import islice
+from typing import List, Tuple, Union
 
+import pytest
 from decoy import Decoy
 
 from machine.annotations import Range
-from machine.tokenization import WHITESPACE_TOKENIZER
+from machine.tokenization import WHITESPACE_TOKENIZER, LatinWordTokenizer, WhitespaceTokenizer, ZwspWordTokenizer
 from machine.translation import (
     MAX_SEGMENT_LENGTH,
     InteractiveTranslationEngine,
@@ -146,6 +148,92 @@ def test_get_current_results_multiple_suggestions_nonempty_prefix(decoy: Decoy)
     assert results[1].translation == "In the beginning his Word already existía ."
 
 
+_KEYSTROKES: List[Union[str, Tuple[str, str]]] = [
+    *"In the begi",
+    *"\b\b\b\b",
+    *"start ",
+    ("the", "a"),
+    *"Word ",
+    ("a start", "the beginning"),
+    *"\b\b",
+    *"d alr",
+    ("Word", "Words"),
+    *"\b\b\b\b\b\b\b\b",
+    " ",
+    ("In", "At"),
+]
+
+_LATIN_KEYSTROKES: List[Union[str, Tuple[str, str]]] = [
+    *"Mr. Smith's \"wor",
+    *"\b\b",
+    *'ord," he said... ',
+    ("Mr.", "Mrs."),
+    *"'Yes' (no)",
+    *"\b\b\b",
+    *"http://example.com/a. ",
+    ("Smith's", "Smith"),
+    *"\b\b\b\b\b",
+    *"a-b--c ",
+]
+
+_ZWSP_KEYSTROKES: List[Union[str, Tuple[str, str]]] = [
+    *"In\u200bthe beginning\u200bthe Wor",
+    *"\b\b",
+    *"ord, \u200balready. ",
+    ("the beginning", "the  beginning"),
+    *"\u200b\u200b(x) y",
+    *"\b\b\b",
+    ("In\u200b", "In \u200b"),
+    *" .\u200b",
+]
+
+
+@pytest.mark.parametrize(
+    "target_tokenizer,keystrokes",
+    [
+        (WHITESPACE_TOKENIZER, _KEYSTROKES),
+        (LatinWordTokenizer(), _KEYSTROKES),
+        (LatinWordTokenizer(), _LATIN_KEYSTROKES),
+        (LatinWordTokenizer(["mr"]), _LATIN_KEYSTROKES),
+        (ZwspWordTokenizer(), _ZWSP_KEYSTROKES),
+    ],
+    ids=["whitespace", "latin", "latin-punctuation", "latin-abbreviations", "zwsp"],
+)
+def test_get_current_results_replay_keystrokes(
+    decoy: Decoy, target_tokenizer: WhitespaceTokenizer, keystrokes: List[Union[str, Tuple[str, str]]]
+) -> None:
+    env = _TestEnvironment(decoy)
+    env.use_simple_word_graph()
+    env.use_target_tokenizer(target_tokenizer)
+    translator = env.create_translator()
+
+    prefix = ""
+    for keystroke in keystrokes:
+        if keystroke == "\b":
+            prefix = prefix[:-1]
+            translator.set_prefix(prefix)
+        elif isinstance(keystroke, tuple):
+            # replace text in the middle of the prefix
+            old, new = keystroke
+            prefix = prefix.replace(old, new, 1)
+            translator.set_prefix(prefix)
+        else:
+            prefix += keystroke
+            translator.append_to_prefix(keystroke)
+
+        expected_translator = env.create_translator()
+        expected_translator.set_prefix(prefix)
+
+        assert translator.prefix == prefix
+        assert translator.prefix_word_ranges == expected_translator.prefix_word_ranges
+        assert translator.is_last_word_complete == expected_translator.is_last_word_complete
+        results = list(islice(translator.get_current_results(), 3))
+        expected_results = list(islice(expected_translator.get_current_results(), 3))
+        assert [r.translation for r in results] == [r.translation for r in expected_results]
+        assert [r.sources for r in results] == [r.sources for r in expected_results]
+        assert [r.alignment for r in results] == [r.alignment for r in expected_results]
+
+
 class _TestEnvironment:
     def __init__(self, decoy: Decoy) -> None:
         self._decoy = decoy
@@ -522,5 +610,8 @@ class _TestEnvironment:
         )
         self._decoy.when(self.engine.get_word_graph(_SOURCE_SEGMENT)).then_return(word_graph)
 
+    def use_target_tokenizer(self, target_tokenizer: WhitespaceTokenizer) -> None:
+        self._factory.target_tokenizer = target_tokenizer
+
     def create_translator(self, segment: str = _SOURCE_SEGMENT) -> InteractiveTranslator:
         return self._factory.create(segment)
@@ -0,0 +1,187 @@
+import random
+import time
+from typing import Callable, List, Set, Tuple, TypeVar
+
+import pytest
+
+from machine.annotations import Range
+from machine.statistics import LOG_SPACE_ZERO, log_space_multiple
+from machine.translation import TranslationSources, WordAlignmentMatrix, WordGraph, WordGraphArc
+from machine.translation.word_graph import WORD_GRAPH_INITIAL_STATE
+
+
+def test_compute_rest_scores() -> None:
+    for seed in range(20):
+        word_graph = _create_random_word_graph(random.Random(seed), state_count=50, arc_count=200)
+        assert word_graph.compute_rest_scores() == _compute_rest_scores(word_graph)
+
+
+def test_compute_rest_scores_large() -> None:
+    word_graph = _create_random_word_graph(random.Random(0), state_count=2000, arc_count=15000)
+    assert word_graph.compute_rest_scores() == _compute_rest_scores(word_graph)
+
+
+def test_compute_rest_scores_empty() -> None:
+    word_graph = WordGraph(["a"])
+    assert word_graph.compute_rest_scores() == []
+
+
+def test_get_best_path_from_state_to_final_state() -> None:
+    for seed in range(20):
+        rand = random.Random(seed)
+        word_graph = _create_random_word_graph(rand, state_count=50, arc_count=200)
+        for state in [WORD_GRAPH_INITIAL_STATE] + rand.sample(range(1, word_graph.state_count), 5):
+            assert word_graph._compute_prev_scores(state) == _compute_prev_scores(word_graph, state)
+            assert list(word_graph.get_best_path_from_state_to_final_state(state)) == _get_best_path(word_graph, state)
+
+
+def test_get_arc_indices() -> None:
+    word_graph = _create_random_word_graph(random.Random(0), state_count=50, arc_count=200)
+    for state in range(word_graph.state_count):
+        assert word_graph.get_next_arc_indices(state) == [
+            i for i, arc in enumerate(word_graph.arcs) if arc.prev_state == state
+        ]
+        assert word_graph.get_prev_arc_indices(state) == [
+            i for i, arc in enumerate(word_graph.arcs) if arc.next_state == state
+        ]
+    assert word_graph.get_next_arc_indices(word_graph.state_count) == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("level_count,states_per_level", [(25, 80), (40, 200)])
+def test_word_graph_throughput(
+    level_count: int, states_per_level: int, record_property: Callable[[str, object], None]
+) -> None:
+    word_graphs = [_create_layered_word_graph(random.Random(0), level_count, states_per_level) for _ in range(3)]
+    assert len(word_graphs[0].arcs) >= 10_000
+
+    # each run uses a new word graph, so that the state levels that are computed on first use are included
+    rest_scores, elapsed = _time(lambda i: word_graphs[i].compute_rest_scores())
+    expected_rest_scores, reference_elapsed = _time(lambda i: _compute_rest_scores(word_graphs[i]))
+    assert rest_scores == expected_rest_scores
+    assert elapsed < reference_elapsed
+    record_property("rest_scores_speedup", reference_elapsed / elapsed)
+
+    word_graphs = [_create_layered_word_graph(random.Random(0), level_count, states_per_level) for _ in range(3)]
+    prev_scores, elapsed = _time(lambda i: word_graphs[i]._compute_prev_scores(WORD_GRAPH_INITIAL_STATE))
+    expected_prev_scores, reference_elapsed = _time(
+        lambda i: _compute_prev_scores(word_graphs[i], WORD_GRAPH_INITIAL_STATE)
+    )
+    assert prev_scores == expected_prev_scores
+    assert elapsed < reference_elapsed
+    record_property("prev_scores_speedup", reference_elapsed / elapsed)
+
+
+T = TypeVar("T")
+
+
+def _time(func: Callable[[int], T], runs: int = 3) -> Tuple[T, float]:
+    # take the best of several runs to reduce the effect of other load on the machine
+    results: List[T] = []
+    best_elapsed = float("inf")
+    for i in range(runs):
+        start = time.perf_counter()
+        results.append(func(i))
+        best_elapsed = min(best_elapsed, time.perf_counter() - start)
+    assert all(r == results[0] for r in results)
+    return results[0], best_elapsed
+
+
+def _create_layered_word_graph(rand: random.Random, level_count: int, states_per_level: int) -> WordGraph:
+    # every state is connected to several states of the next two levels, similar to the lattice of a phrase-based
+    # decoder, and the arcs are ordered topologically
+    arcs: List[WordGraphArc] = []
+    for level in range(level_count - 1):
+        for state in range(level * states_per_level, (level + 1) * states_per_level):
+            next_states: Set[int] = set()
+            for next_level in range(level + 1, min(level + 3, level_count)):
+                next_states.update(
+                    rand.sample(range(next_level * states_per_level, (next_level + 1) * states_per_level), 3)
+                )
+            for next_state in sorted(next_states):
+                arcs.append(
+                    WordGraphArc(
+                        state,
+                        next_state,
+                        round(rand.uniform(-20, 0), 0),
+                        ["word"],
+                        WordAlignmentMatrix.from_word_pairs(1, 1, [(0, 0)]),
+                        Range.create(0, 1),
+                        [TranslationSources.SMT],
+                        [0.5],
+                    )
+                )
+    final_states = range((level_count - 1) * states_per_level, level_count * states_per_level)
+    return WordGraph(["word"], arcs, final_states, initial_state_score=-10)
+
+
+def _create_random_word_graph(rand: random.Random, state_count: int, arc_count: int) -> WordGraph:
+    # arcs are ordered topologically, like the word graphs produced by the SMT decoder
+    arc_states: Set[Tuple[int, int]] = {(i, i + 1) for i in range(state_count - 1)}
+    while len(arc_states) < arc_count:
+        prev_state = rand.randrange(state_count - 1)
+        arc_states.add((prev_state, rand.randrange(prev_state + 1, min(prev_state + 10, state_count))))
+    arcs = [
+        WordGraphArc(
+            prev_state,
+            next_state,
+            # rounded scores produce ties between paths
+            round(rand.uniform(-20, 0), 0),
+            ["word"],
+            WordAlignmentMatrix.from_word_pairs(1, 1, [(0, 0)]),
+            Range.create(0, 1),
+            [TranslationSources.SMT],
+            [0.5],
+        )
+        for prev_state, next_state in sorted(arc_states)
+    ]
+    final_states = [state_count - 1] + rand.sample(range(1, state_count - 1), 3)
+    return WordGraph(["word"], arcs, final_states, initial_state_score=-10)
+
+
+def _compute_rest_scores(word_graph: WordGraph) -> List[float]:
+    rest_scores: List[float] = [LOG_SPACE_ZERO] * word_graph.state_count
+    for state in word_graph.final_states:
+        rest_scores[state] = word_graph.initial_state_score
+
+    for arc in reversed(word_graph.arcs):
+        score = log_space_multiple(arc.score, rest_scores[arc.next_state])
+        if score > rest_scores[arc.prev_state]:
+            rest_scores[arc.prev_state] = score
+    return rest_scores
+
+
+def _compute_prev_scores(word_graph: WordGraph, state: int) -> Tuple[List[float], List[int]]:
+    prev_scores: List[float] = [LOG_SPACE_ZERO] * word_graph.state_count
+    state_best_prev_arcs = [0] * word_graph.state_count
+    prev_scores[state] = word_graph.initial_state_score if state == WORD_GRAPH_INITIAL_STATE else 0
+
+    accessible_states: Set[int] = {state}
+    for arc_index, arc in enumerate(word_graph.arcs):
+        if arc.prev_state in accessible_states:
+            score = log_space_multiple(arc.score, prev_scores[arc.prev_state])
+            if score > prev_scores[arc.next_state]:
+                prev_scores[arc.next_state] = score
+                state_best_prev_arcs[arc.next_state] = arc_index
+            accessible_states.add(arc.next_state)
+    return prev_scores, state_best_prev_arcs
+
+
+def _get_best_path(word_graph: WordGraph, state: int) -> List[WordGraphArc]:
+    prev_scores, state_best_prev_arcs = _compute_prev_scores(word_graph, state)
+    best_final_state_score: float = LOG_SPACE_ZERO
+    best_final_state = WORD_GRAPH_INITIAL_STATE
+    for final_state in word_graph.final_states:
+        if best_final_state_score < prev_scores[final_state]:
+            best_final_state = final_state
+            best_final_state_score = prev_scores[final_state]
+
+    arcs: List[WordGraphArc] = []
+    if best_final_state in word_graph.final_states:
+        cur_state = best_final_state
+        while cur_state != state:
+            arc = word_graph.arcs[state_best_prev_arcs[cur_state]]
+            arcs.append(arc)
+            cur_state = arc.prev_state
+    arcs.reverse()
+    return arcs
@@ -0,0 +1,129 @@
+import gzip
+import io
+import random
+import shutil
+import tarfile
+from pathlib import Path
+from typing import Dict
+
+from machine.utils.archive_utils import ParallelGzipWriter, create_tar_gz, extract_tar_gz
+
+
+def test_parallel_gzip_writer() -> None:
+    data = _random_bytes(100_000)
+    output = io.BytesIO()
+    with ParallelGzipWriter(output, max_workers=4, block_size=4096) as writer:
+        for i in range(0, len(data), 1000):
+            writer.write(data[i : i + 1000])
+
+    assert gzip.decompress(output.getvalue()) == data
+
+
+def test_parallel_gzip_writer_single_worker() -> None:
+    data = _random_bytes(10_000)
+    output = io.BytesIO()
+    with ParallelGzipWriter(output, max_workers=1, block_size=4096) as writer:
+        writer.write(data)
+
+    assert gzip.decompress(output.getvalue()) == data
+
+
+def test_parallel_gzip_writer_empty() -> None:
+    output = io.BytesIO()
+    with ParallelGzipWriter(output):
+        pass
+
+    assert gzip.decompress(output.getvalue()) == b""
+
+
+def test_create_tar_gz(tmp_path: Path) -> None:
+    model_dir = tmp_path / "model"
+    files = _create_model_dir(model_dir)
+    tar_file_path = tmp_path / "model.tar.gz"
+
+    with create_tar_gz(tar_file_path, max_workers=4, block_size=8192) as tar:
+        tar.add(model_dir, arcname=".")
+
+    with tarfile.open(tar_file_path, "r:gz") as tar:
+        members = {m.name: m for m in tar.getmembers()}
+        for name, content in files.items():
+            extracted = tar.extractfile(members[f"./{name}"])
+            assert extracted is not None
+            assert extracted.read() == content
+
+    # the layout matches the one produced by shutil.make_archive
+    expected_tar_file_path = shutil.make_archive(str(tmp_path / "expected"), "gztar", model_dir)
+    with tarfile.open(expected_tar_file_path, "r:gz") as tar:
+        assert sorted(members) == sorted(tar.getnames())
+
+
+def test_extract_tar_gz(tmp_path: Path) -> None:
+    model_dir = tmp_path / "model"
+    files = _create_model_dir(model_dir)
+    tar_file_path = tmp_path / "model.tar.gz"
+    with create_tar_gz(tar_file_path, max_workers=4, block_size=8192) as tar:
+        tar.add(model_dir, arcname=".")
+
+    dest_dir = extract_tar_gz(tar_file_path, tmp_path / "extracted")
+
+    assert _read_dir(dest_dir) == files
+
+
+def test_extract_tar_gz_stream(tmp_path: Path) -> None:
+    model_dir = tmp_path / "model"
+    files = _create_model_dir(model_dir)
+    tar_file_path = tmp_path / "model.tar.gz"
+    with create_tar_gz(tar_file_path, max_workers=4, block_size=8192) as tar:
+        tar.add(model_dir, arcname=".")
+
+    with tar_file_path.open("rb") as file:
+        dest_dir = extract_tar_gz(io.BufferedReader(_NonSeekableStream(file)), tmp_path / "extracted")
+
+    assert _read_dir(dest_dir) == files
+
+
+def test_extract_tar_gz_standard_archive(tmp_path: Path) -> None:
+    model_dir = tmp_path / "model"
+    files = _create_model_dir(model_dir)
+    tar_file_path = shutil.make_archive(str(tmp_path / "model"), "gztar", model_dir)
+
+    dest_dir = extract_tar_gz(tar_file_path, tmp_path / "extracted")
+
+    assert _read_dir(dest_dir) == files
+
+
+def _random_bytes(length: int) -> bytes:
+    rand = random.Random(0)
+    words = [b"the", b"model", b"weights", b"token", b"\x00\x01", b"\n"]
+    return b" ".join(rand.choice(words) for _ in range(length // 4))[:length]
+
+
+def _create_model_dir(model_dir: Path) -> Dict[str, bytes]:
+    files = {
+        "config.json": b'{"model_type": "test"}',
+        "model.bin": _random_bytes(50_000) + random.Random(1).randbytes(20_000),
+        "empty.txt": b"",
+        "tokenizer/vocab.txt": b"\n".join(f"token{i}".encode() for i in range(2000)),
+    }
+    for name, content in files.items():
+        path = model_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return files
+
+
+def _read_dir(dir: Path) -> Dict[str, bytes]:
+    return {p.relative_to(dir).as_posix(): p.read_bytes() for p in dir.rglob("*") if p.is_file()}
+
+
+class _NonSeekableStream(io.RawIOBase):
+    def __init__(self, file: io.BufferedIOBase) -> None:
+        self._file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
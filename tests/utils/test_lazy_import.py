@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+HEAVY_MODULES = ["torch", "transformers", "clearml"]
+
+
+@pytest.mark.parametrize(
+    "import_statement",
+    [
+        "import machine.corpora",
+        "import machine.jobs",
+        "import machine.translation",
+        "from machine.corpora import UsfmFileText",
+    ],
+)
+def test_import_does_not_import_heavy_modules(import_statement: str) -> None:
+    code = f"import sys\n{import_statement}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("package_name", ["machine.corpora", "machine.translation"])
+def test_lazy_exports(package_name: str) -> None:
+    package = import_module(package_name)
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+    with pytest.raises(AttributeError):
+        getattr(package, "NotAnExport")
+
+
+def test_submodule_import_does_not_shadow_export() -> None:
+    code = (
+        "import inspect\n"
+        "import machine.corpora.flatten\n"
+        "from machine.corpora import flatten\n"
+        "print(inspect.isfunction(flatten))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "True"